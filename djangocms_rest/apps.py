@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
 
 
 class DjangocmsRestConfig(AppConfig):
@@ -10,3 +11,71 @@ class DjangocmsRestConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "djangocms_rest"
     verbose_name = "Django CMS REST API"
+
+    def ready(self):
+        from django.contrib.auth import get_user_model
+        from django.contrib.auth.models import Group
+
+        from cms.models import GlobalPagePermission, Page, PageContent, PagePermission, PageUrl
+        from cms.signals import post_obj_operation, post_placeholder_operation
+
+        from djangocms_rest import changes, purge
+        from djangocms_rest.permissions import clear_viewable_page_ids
+        from djangocms_rest.routing import clear_routes
+        from djangocms_rest.search import (
+            create_search_index,
+            page_content_saved,
+            placeholder_operation,
+            version_operation,
+        )
+
+        post_migrate.connect(create_search_index, sender=self)
+
+        # Route table for page paths
+        for model in (Page, PageUrl):
+            post_save.connect(clear_routes, sender=model, dispatch_uid="djangocms_rest_routes")
+            post_delete.connect(clear_routes, sender=model, dispatch_uid="djangocms_rest_routes")
+        post_obj_operation.connect(clear_routes, dispatch_uid="djangocms_rest_routes")
+
+        # Cached viewable page ids
+        for model in (Page, PagePermission, GlobalPagePermission):
+            post_save.connect(clear_viewable_page_ids, sender=model, dispatch_uid="djangocms_rest_permissions")
+            post_delete.connect(clear_viewable_page_ids, sender=model, dispatch_uid="djangocms_rest_permissions")
+        user_model = get_user_model()
+        for through in (Group.permissions.through, user_model.user_permissions.through, user_model.groups.through):
+            m2m_changed.connect(clear_viewable_page_ids, sender=through, dispatch_uid="djangocms_rest_permissions")
+        post_obj_operation.connect(clear_viewable_page_ids, dispatch_uid="djangocms_rest_permissions")
+
+        # Incremental search index maintenance
+        post_save.connect(page_content_saved, sender=PageContent, dispatch_uid="djangocms_rest_search_index")
+        post_placeholder_operation.connect(placeholder_operation, dispatch_uid="djangocms_rest_search_index")
+        try:
+            from djangocms_versioning.signals import post_version_operation
+        except ImportError:
+            pass
+        else:
+            post_version_operation.connect(version_operation, dispatch_uid="djangocms_rest_search_index")
+            post_version_operation.connect(changes.version_operation, dispatch_uid="djangocms_rest_change_log")
+            post_version_operation.connect(purge.version_operation, dispatch_uid="djangocms_rest_purge")
+
+        # Change log (change feed)
+        for model, receiver in (
+            (PageContent, changes.page_content_changed),
+            (Page, changes.page_changed),
+            (PageUrl, changes.page_url_changed),
+        ):
+            post_save.connect(receiver, sender=model, dispatch_uid="djangocms_rest_change_log")
+            post_delete.connect(receiver, sender=model, dispatch_uid="djangocms_rest_change_log")
+        post_obj_operation.connect(changes.page_operation, dispatch_uid="djangocms_rest_change_log")
+        post_placeholder_operation.connect(changes.placeholder_operation, dispatch_uid="djangocms_rest_change_log")
+
+        # CDN purges by surrogate key
+        for model, receiver in (
+            (PageContent, purge.page_content_changed),
+            (Page, purge.page_changed),
+            (PageUrl, purge.page_url_changed),
+        ):
+            post_save.connect(receiver, sender=model, dispatch_uid="djangocms_rest_purge")
+            post_delete.connect(receiver, sender=model, dispatch_uid="djangocms_rest_purge")
+        post_obj_operation.connect(purge.page_operation, dispatch_uid="djangocms_rest_purge")
+        post_placeholder_operation.connect(purge.placeholder_operation, dispatch_uid="djangocms_rest_purge")
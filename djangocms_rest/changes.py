@@ -0,0 +1,207 @@
+"""
+Change feed of pages and placeholders.
+
+Static-site builders and CDNs only need to rebuild what changed since their last run. With
+``REST_CHANGE_LOG = True``, every change of a page, its contents, URLs or plugins is written
+to a compact log table (:class:`~djangocms_rest.models.ChangeLogEntry`) from django CMS'
+signals. The primary key of the log serves as the token: the change feed endpoint returns the
+pages and placeholders changed after a token together with the token to pass next time.
+Entries older than ``REST_CHANGE_LOG_RETENTION`` days are removed; clients with an older token
+are told to rebuild everything.
+
+Entries are written by concurrent transactions, so an entry with a lower primary key can be
+committed after one with a higher key. The returned token therefore lags behind the newest
+entries: it only covers entries written more than ``REST_CHANGE_LOG_WINDOW`` seconds ago.
+Newer entries are reported, too, and reported again by the next request. Every change is
+reported at least once; a change may be reported twice.
+"""
+
+from collections.abc import Iterable
+from datetime import timedelta
+from functools import partial
+from operator import attrgetter
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.db import transaction
+from django.utils import timezone
+
+from cms.models import Page, PageContent, PageUrl, Placeholder
+
+from djangocms_rest.models import ChangeLogEntry
+from djangocms_rest.permissions import get_viewable_pages
+from djangocms_rest.utils import get_page_tree_lookup
+
+
+def change_log_enabled() -> bool:
+    return getattr(settings, "REST_CHANGE_LOG", False)
+
+
+def get_retention() -> timedelta:
+    return timedelta(days=getattr(settings, "REST_CHANGE_LOG_RETENTION", 30))
+
+
+def get_window() -> timedelta:
+    return timedelta(seconds=getattr(settings, "REST_CHANGE_LOG_WINDOW", 10))
+
+
+def _get_site_id(page: Page) -> int:
+    return attrgetter(get_page_tree_lookup("site_id").replace("__", "."))(page)
+
+
+def write_entries(entries: list[ChangeLogEntry]) -> None:
+    """Writes the entries and removes the ones which are past the retention period."""
+    ChangeLogEntry.objects.bulk_create(entries)
+    ChangeLogEntry.objects.filter(created__lt=timezone.now() - get_retention()).delete()
+
+
+def log_changes(pages: Iterable[Page], language: str = "", placeholder: Placeholder | None = None) -> None:
+    """
+    Logs that the pages changed (in a language or, if empty, in all languages) once the
+    transaction is committed. The current paths of the pages are kept with the entries, so
+    clients learn the paths of pages which are renamed or deleted later on.
+    """
+    if not change_log_enabled():
+        return
+    pages = {page.pk: page for page in pages if page is not None and page.pk is not None}
+    if not pages:
+        return
+    urls = PageUrl.objects.filter(page__in=pages.keys())
+    if language:
+        urls = urls.filter(language=language)
+    paths = {}
+    for url in urls:
+        paths.setdefault(url.page_id, []).append((url.language, url.path))
+    placeholder_id = placeholder.pk if placeholder else None
+    transaction.on_commit(
+        partial(
+            write_entries,
+            [
+                ChangeLogEntry(
+                    site_id=_get_site_id(page),
+                    language=url_language,
+                    page_id=page.pk,
+                    placeholder_id=placeholder_id,
+                    path=path,
+                )
+                for page in pages.values()
+                # Pages without URLs are logged without a path
+                for url_language, path in paths.get(page.pk, [(language, None)])
+            ],
+        )
+    )
+
+
+def page_content_changed(sender, instance: PageContent, raw: bool = False, **kwargs) -> None:
+    """``post_save`` / ``post_delete`` receiver: Titles, menu settings or meta data changed."""
+    if not raw:
+        log_changes([instance.page], instance.language)
+
+
+def page_changed(sender, instance: Page, raw: bool = False, **kwargs) -> None:
+    """``post_save`` / ``post_delete`` receiver: Page settings changed or the page was deleted."""
+    if not raw:
+        log_changes([instance])
+
+
+def page_url_changed(sender, instance: PageUrl, raw: bool = False, **kwargs) -> None:
+    """``post_save`` / ``post_delete`` receiver: The path of a page changed."""
+    if raw or not change_log_enabled():
+        return
+    lookup = get_page_tree_lookup("site_id")
+    site_id = Page.objects.filter(pk=instance.page_id).values_list(lookup, flat=True).first()
+    if site_id is not None:
+        entry = ChangeLogEntry(
+            site_id=site_id, language=instance.language, page_id=instance.page_id, path=instance.path
+        )
+        transaction.on_commit(partial(write_entries, [entry]))
+
+
+def page_operation(sender, operation: str, obj=None, **kwargs) -> None:
+    """``post_obj_operation`` receiver: A page was moved, copied, deleted, ... in the admin."""
+    if isinstance(obj, Page) and obj.pk is not None:
+        # Moving a page changes the paths of all its descendants in bulk, without signals
+        log_changes([obj, *obj.get_descendant_pages()])
+
+
+def placeholder_operation(sender, **kwargs) -> None:
+    """``post_placeholder_operation`` receiver: Plugins were added, changed, moved or deleted."""
+    for key in ("placeholder", "source_placeholder", "target_placeholder"):
+        placeholder = kwargs.get(key)
+        if placeholder is not None and isinstance(placeholder.source, PageContent):
+            log_changes([placeholder.source.page], placeholder.source.language, placeholder=placeholder)
+
+
+def version_operation(sender, operation: str, obj, **kwargs) -> None:
+    """``post_version_operation`` receiver (djangocms-versioning): A page content was (un)published."""
+    from djangocms_versioning.constants import OPERATION_PUBLISH, OPERATION_UNPUBLISH
+
+    if operation in (OPERATION_PUBLISH, OPERATION_UNPUBLISH) and isinstance(obj.content, PageContent):
+        log_changes([obj.content.page], obj.content.language)
+
+
+def get_current_token() -> int:
+    return ChangeLogEntry.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+
+
+def get_settled_token() -> int:
+    """
+    The token up to which the log is complete: the newest entry written before the window
+    (``REST_CHANGE_LOG_WINDOW``). Entries written since may still be preceded by entries of
+    transactions which have not been committed yet.
+    """
+    entries = ChangeLogEntry.objects.filter(created__lt=timezone.now() - get_window())
+    return entries.order_by("-pk").values_list("pk", flat=True).first() or 0
+
+
+def get_changes(site: Site, language: str, since: int | None, user, limit: int = 1000) -> dict:
+    """
+    Returns what changed in a language after the token ``since``:
+
+    * ``pages``: the (visible) pages which changed, with their current paths,
+    * ``removed``: the paths of changed pages which are no longer available (deleted, renamed,
+      unpublished or hidden),
+    * ``placeholders``: the placeholders of the visible pages whose plugins changed,
+    * ``menu``: whether the menu may have changed.
+
+    At most ``limit`` log entries are read; ``more`` tells if there are further changes to fetch
+    with the returned ``token``. ``full_rebuild`` is set if there is no token or the log has
+    been pruned beyond it. The returned token never passes entries written within the window
+    (see :func:`get_settled_token`), so those are returned again next time.
+    """
+    current = get_current_token()
+    settled = get_settled_token()
+    oldest = ChangeLogEntry.objects.order_by("pk").values_list("pk", flat=True).first()
+    if since is None or (oldest is not None and since < oldest - 1):
+        return {"token": settled, "full_rebuild": True, "more": False}
+
+    entries = list(
+        ChangeLogEntry.objects.filter(pk__gt=since, pk__lte=current, site=site, language__in=(language, ""))
+        .order_by("pk")
+        .values_list("pk", "page_id", "placeholder_id", "path")[: limit + 1]
+    )
+    more = len(entries) > limit
+    entries = entries[:limit]
+    # Entries of other sites and languages up to the token are skipped, too
+    token = max(since, min(entries[-1][0], settled) if more else settled)
+    # Further entries within the window can only be fetched once they are settled
+    more = more and token > since
+
+    pages = Page.objects.filter(
+        pk__in={page_id for _, page_id, _, _ in entries},
+        pagecontent_set__in=PageContent.objects.filter(language=language),
+    ).distinct()
+    visible = [page.pk for page in get_viewable_pages(pages, user, site)]
+    current_paths = dict(PageUrl.objects.filter(page__in=visible, language=language).values_list("page_id", "path"))
+    placeholder_ids = {placeholder_id for _, page_id, placeholder_id, _ in entries if page_id in current_paths}
+    placeholder_ids.discard(None)
+    logged_paths = {path for _, _, _, path in entries if path is not None}
+    return {
+        "token": token,
+        "full_rebuild": False,
+        "more": more,
+        "menu": bool(entries),
+        "pages": sorted(current_paths.values()),
+        "removed": sorted(logged_paths - set(current_paths.values())),
+        "placeholders": list(Placeholder.objects.filter(pk__in=placeholder_ids).order_by("pk")),
+    }
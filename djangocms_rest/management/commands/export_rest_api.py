@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import django
+from django.apps import apps
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import RequestFactory
+from django.urls import resolve
+
+from cms.models import PageContent, PageUrl, Placeholder
+from cms.utils.i18n import get_public_languages
+
+from djangocms_rest.url_builder import url_builder
+
+MANIFEST = "manifest.json"
+JOURNAL = ".export-journal"
+
+
+def get_site_urls(site: Site) -> Iterator[tuple[str, bool]]:
+    """
+    Yields the API URLs to export for a site as ``(url, is_page)``: the languages, the plugin
+    definitions and, per public language, the page tree, the menu and every page with its
+    placeholders and breadcrumbs.
+    """
+    yield url_builder.build("language-list"), False
+    yield url_builder.build("plugin-list"), False
+    for language in get_public_languages(site_id=site.pk):
+        yield url_builder.build("page-tree-list", kwargs={"language": language}), False
+        yield url_builder.build("menu", kwargs={"language": language}), False
+        yield url_builder.build("page-root", kwargs={"language": language}), True
+        # The export is public: pages which require a login are left out
+        paths = PageUrl.objects.get_for_site(site).filter(language=language, page__login_required=False)
+        paths = paths.exclude(path="")
+        for path in paths.order_by("path").values_list("path", flat=True).iterator():
+            yield url_builder.build("page-detail", kwargs={"language": language, "path": path}), True
+            yield url_builder.build("breadcrumbs-path", kwargs={"language": language, "path": path}), False
+
+        placeholders = Placeholder.objects.filter(
+            content_type=ContentType.objects.get_for_model(PageContent),
+            object_id__in=PageContent.objects.filter(language=language, page__in=paths.values("page")).values("pk"),
+        )
+        for content_type_id, object_id, slot in (
+            placeholders.order_by("object_id", "slot").values_list("content_type_id", "object_id", "slot").iterator()
+        ):
+            yield url_builder.build("placeholder-detail", args=(language, content_type_id, object_id, slot)), False
+
+
+def get_file_path(output_dir: Path, key: str) -> Path:
+    """
+    Responses are stored as ``index.json`` in a directory per URL, mirroring the URL layout below
+    a directory per site domain. ``key`` is the site domain followed by the URL.
+    """
+    return output_dir.joinpath(*[part for part in key.split("/") if part], "index.json")
+
+
+def export_urls(
+    output_dir: str, site_id: int, base_url: str, urls: list[str], previous: dict[str, str]
+) -> list[tuple[str, str | None, bool]]:
+    """
+    Renders the URLs of a site with the API views and writes the responses to ``output_dir``.
+    Files whose content hash is unchanged since the previous export (``previous`` maps keys to
+    hashes) are not rewritten. Returns ``(key, content hash or None if not exported, written)``
+    for every URL.
+    """
+    site = Site.objects.get(pk=site_id)
+    base = urlsplit(base_url or f"https://{site.domain}")
+    factory = RequestFactory(HTTP_HOST=base.netloc, HTTP_ACCEPT="application/json")
+    results = []
+    for url in urls:
+        request = factory.get(url, secure=base.scheme == "https")
+        request.user = AnonymousUser()
+        request.site = site
+        match = resolve(url)
+        response = match.func(request, *match.args, **match.kwargs)
+        key = f"{site.domain}{url}"
+        if response.status_code != 200:
+            results.append((key, None, False))
+            continue
+        if hasattr(response, "render"):
+            # Responses served from the cache are rendered already
+            response.render()
+        content = response.content
+        digest = hashlib.sha256(content).hexdigest()
+        file_path = get_file_path(Path(output_dir), key)
+        written = previous.get(key) != digest or not file_path.exists()
+        if written:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}")
+            tmp_path.write_bytes(content)
+            tmp_path.replace(file_path)
+        results.append((key, digest, written))
+    return results
+
+
+def init_worker() -> None:
+    # Workers started with "spawn" (e.g. on macOS) have to set up Django themselves
+    if not apps.ready:
+        django.setup()
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports the API as static JSON files (one <site domain>/<url>/index.json per URL) for all sites "
+        "and public languages. Unchanged files are not rewritten. Use --workers to render in parallel "
+        "processes and --resume to continue an interrupted export."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("output_dir", help="Directory to write the files to.")
+        parser.add_argument(
+            "--site", action="append", type=int, dest="sites", help="Only export this site id (can be repeated)."
+        )
+        parser.add_argument(
+            "--base-url",
+            default="",
+            help="Scheme and host of absolute URLs in the files (default: https://<site domain>).",
+        )
+        parser.add_argument("--workers", type=int, default=1, help="Number of parallel worker processes.")
+        parser.add_argument("--batch-size", type=int, default=50, help="URLs per worker batch.")
+        parser.add_argument(
+            "--resume", action="store_true", help="Skip the URLs already exported by an interrupted export."
+        )
+
+    def handle(self, *args, output_dir, sites=None, base_url="", workers=1, batch_size=50, resume=False, **options):
+        output = Path(output_dir)
+        output.mkdir(parents=True, exist_ok=True)
+        manifest_path, journal_path = output / MANIFEST, output / JOURNAL
+        previous = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+        done = {}
+        if resume and journal_path.exists():
+            for line in journal_path.read_text().splitlines():
+                key, _, digest = line.partition("\t")
+                if key:
+                    done[key] = digest or None
+        elif journal_path.exists():
+            journal_path.unlink()
+
+        site_queryset = Site.objects.order_by("pk")
+        if sites:
+            site_queryset = site_queryset.filter(pk__in=sites)
+            if len(site_queryset) != len(set(sites)):
+                raise CommandError("Unknown site id.")
+
+        jobs, page_keys = [], set()
+        for site in site_queryset:
+            urls = []
+            for url, is_page in dict.fromkeys(get_site_urls(site)):
+                key = f"{site.domain}{url}"
+                if is_page:
+                    page_keys.add(key)
+                if key not in done:
+                    urls.append(url)
+            for i in range(0, len(urls), batch_size):
+                batch = urls[i : i + batch_size]
+                hashes = {f"{site.domain}{url}": previous.get(f"{site.domain}{url}") for url in batch}
+                jobs.append((str(output), site.pk, base_url, batch, hashes))
+
+        start = time.perf_counter()
+        written = unchanged = skipped = 0
+        exported = set()
+        with journal_path.open("a") as journal:
+
+            def record(results):
+                nonlocal written, unchanged, skipped
+                for key, digest, is_written in results:
+                    done[key] = digest
+                    exported.add(key)
+                    journal.write(f"{key}\t{digest or ''}\n")
+                    if digest is None:
+                        skipped += 1
+                    elif is_written:
+                        written += 1
+                    else:
+                        unchanged += 1
+                journal.flush()
+
+            if workers > 1:
+                # Workers must not share the parent's database connections
+                connections.close_all()
+                with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+                    for results in executor.map(export_urls, *zip(*jobs)):
+                        record(results)
+            else:
+                for job in jobs:
+                    record(export_urls(*job))
+        elapsed = time.perf_counter() - start
+
+        # Remove the files of URLs which no longer exist
+        manifest = {key: digest for key, digest in done.items() if digest}
+        removed = 0
+        for key in previous.keys() - manifest.keys():
+            file_path = get_file_path(output, key)
+            if file_path.exists():
+                file_path.unlink()
+                removed += 1
+        manifest_path.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+        journal_path.unlink()
+
+        pages = sum(1 for key in page_keys if key in exported and done[key])
+        self.stdout.write(
+            f"Exported {len(manifest)} files ({written} written, {unchanged} unchanged, {removed} removed, "
+            f"{skipped} not public) in {elapsed:.2f}s: {pages / elapsed if elapsed else 0:.1f} pages/s."
+        )
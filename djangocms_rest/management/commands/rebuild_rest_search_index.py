@@ -0,0 +1,43 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from djangocms_rest.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the search index of the page search endpoint and reports how long indexing a page took. "
+        "Use --workers to index in parallel on PostgreSQL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--language",
+            action="append",
+            dest="languages",
+            help="Only index page contents in this language (can be repeated).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of parallel worker threads (PostgreSQL only, other databases index sequentially).",
+        )
+        parser.add_argument("--batch-size", type=int, default=100, help="Page contents per batch.")
+
+    def handle(self, *args, languages=None, workers=1, batch_size=100, **options):
+        timings = []
+        start = time.perf_counter()
+        count = rebuild_search_index(languages, batch_size=batch_size, workers=workers, timings=timings)
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(f"Indexed {count} page contents in {elapsed:.2f}s.")
+        if timings:
+            timings.sort()
+            mean, median = statistics.mean(timings) * 1000, statistics.median(timings) * 1000
+            p95, maximum = timings[int(0.95 * (len(timings) - 1))] * 1000, timings[-1] * 1000
+            self.stdout.write(
+                f"Latency per page (ms): mean {mean:.1f}, median {median:.1f}, p95 {p95:.1f}, max {maximum:.1f}"
+            )
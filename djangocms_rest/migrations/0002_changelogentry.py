@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("djangocms_rest", "0001_initial"),
+        ("sites", "0002_alter_domain_unique"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChangeLogEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("language", models.CharField(blank=True, max_length=15, verbose_name="language")),
+                ("page_id", models.BigIntegerField(verbose_name="page id")),
+                ("placeholder_id", models.BigIntegerField(blank=True, null=True, verbose_name="placeholder id")),
+                ("path", models.CharField(blank=True, max_length=255, null=True, verbose_name="path")),
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+                (
+                    "site",
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="+", to="sites.site"),
+                ),
+            ],
+            options={
+                "verbose_name": "change log entry",
+                "verbose_name_plural": "change log entries",
+            },
+        ),
+    ]
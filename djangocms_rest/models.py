@@ -0,0 +1,52 @@
+from django.contrib.sites.models import Site
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SearchEntry(models.Model):
+    """
+    Search index entry of a page content: its titles and the text of its serialized
+    placeholders. The database's full-text index is built on top of this table
+    (see :mod:`djangocms_rest.search`).
+    """
+
+    page_content = models.OneToOneField(
+        "cms.PageContent",
+        on_delete=models.CASCADE,
+        related_name="rest_search_entry",
+    )
+    site = models.ForeignKey(Site, on_delete=models.CASCADE, related_name="+")
+    language = models.CharField(_("language"), max_length=15, db_index=True)
+    title = models.TextField(_("title"), blank=True)
+    text = models.TextField(_("text"), blank=True)
+    changed_date = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("search entry")
+        verbose_name_plural = _("search entries")
+
+    def __str__(self):
+        return self.title
+
+
+class ChangeLogEntry(models.Model):
+    """
+    A page (or one of its placeholders) changed. Entries are numbered in the order they
+    were written; the number serves as the token of the change feed
+    (see :mod:`djangocms_rest.changes`). An empty language means all languages of the page.
+    """
+
+    site = models.ForeignKey(Site, on_delete=models.CASCADE, related_name="+")
+    language = models.CharField(_("language"), max_length=15, blank=True)
+    # Not foreign keys: entries outlive deleted pages and placeholders
+    page_id = models.BigIntegerField(_("page id"))
+    placeholder_id = models.BigIntegerField(_("placeholder id"), null=True, blank=True)
+    path = models.CharField(_("path"), max_length=255, null=True, blank=True)
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = _("change log entry")
+        verbose_name_plural = _("change log entries")
+
+    def __str__(self):
+        return f"{self.pk}: page {self.page_id} ({self.language or '*'})"
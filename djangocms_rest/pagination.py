@@ -0,0 +1,63 @@
+from django.db.models import F, QuerySet
+
+from rest_framework import pagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from djangocms_rest.utils import get_page_tree_lookup
+
+
+class PageLimitOffsetPagination(pagination.LimitOffsetPagination):
+    """
+    Limit/offset pagination for page lists. Add ``?count=false`` to skip counting all results:
+    The response then omits ``count`` and ``next`` is determined by fetching one extra item.
+    """
+
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list | None:
+        self.include_count = request.query_params.get(self.count_query_param, "").lower() not in ("0", "false")
+        if self.include_count:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+        self.offset = self.get_offset(request)
+        self.count = None
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(results) > self.limit
+        return results[: self.limit]
+
+    def get_next_link(self) -> str | None:
+        if self.include_count:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
+    def get_paginated_response(self, data: list) -> Response:
+        response = super().get_paginated_response(data)
+        if not self.include_count:
+            del response.data["count"]
+        return response
+
+
+class PageCursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination for page lists ordered by the page tree. Each page of results is a
+    range query on the (unique) tree path of the page instead of an offset, so it runs in
+    constant time and stays stable if pages are published while a client walks the list.
+    No total count is computed.
+    """
+
+    ordering = ("tree_path", "pk")
+    page_size_query_param = "limit"
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list | None:
+        queryset = queryset.annotate(tree_path=F(f"page__{get_page_tree_lookup()}"))
+        return super().paginate_queryset(queryset, request, view)
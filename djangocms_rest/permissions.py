@@ -1,26 +1,191 @@
-from django.contrib.sites.shortcuts import get_current_site
+import hashlib
+import time
+from collections.abc import Iterable
 
-from cms.models import Page, PageContent
-from cms.utils.i18n import get_language_tuple, get_languages
-from cms.utils.page_permissions import user_can_view_page
+from django.contrib.auth import get_user_model
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db.models import BooleanField, Exists, ExpressionWrapper, OuterRef, Q, QuerySet
+
+from cms.cache import CMS_PAGE_CACHE_VERSION_KEY
+from cms.constants import GRANT_ALL_PERMISSIONS
+from cms.models import GlobalPagePermission, Page, PageContent, PagePermission, PermissionTuple
+from cms.utils.conf import get_cms_setting
+from cms.utils.page_permissions import (
+    PAGE_CHANGE_CODENAME,
+    get_change_perm_tuples,
+    get_view_perm_tuples,
+    user_can_view_all_pages,
+    user_can_view_page,
+)
 
 from rest_framework.exceptions import NotFound
 from rest_framework.permissions import BasePermission
 from rest_framework.request import Request
 
+from djangocms_rest.utils import get_api_context, get_page_tree_lookup, get_site_filtered_queryset
 from djangocms_rest.views_base import BaseAPIView
 
 
+def _perm_tuples_to_q(perm_tuples: list) -> Q:
+    """Turn a list of ``(grant_on, path)`` permission tuples into a filter for pages."""
+    prefix = "" if get_page_tree_lookup() == "path" else "node"
+    query = Q(pk__in=[])
+    for perm in perm_tuples:
+        query |= PermissionTuple(perm).allow_list(prefix)
+    return query
+
+
+def _filter_viewable_pages(queryset: QuerySet, user, site: Site) -> QuerySet:
+    """
+    Restricts a page queryset to the pages the user can view. This is the queryset counterpart
+    of :func:`cms.utils.page_permissions.user_can_view_page`: view restrictions are expressed as
+    filters on the page tree paths.
+    """
+    if user.is_superuser:
+        return queryset
+
+    public_for = get_cms_setting("PUBLIC_FOR")
+    can_see_unrestricted = public_for == "all" or (public_for == "staff" and user.is_staff)
+
+    if not get_cms_setting("PERMISSION"):
+        # No page restrictions without permissions
+        return queryset if can_see_unrestricted else queryset.none()
+
+    if user.is_authenticated and user_can_view_all_pages(user, site=site):
+        return queryset
+
+    restrictions = (
+        PagePermission.objects.filter(can_view=True, **{f"page__{get_page_tree_lookup('site')}": site})
+        .values_list("grant_on", f"page__{get_page_tree_lookup()}")
+        .distinct()
+    )
+    restricted = _perm_tuples_to_q(restrictions)
+    visible = ~restricted if can_see_unrestricted else Q(pk__in=[])
+
+    if user.is_authenticated:
+        perm_tuples = [get_view_perm_tuples(user, site, check_global=False)]
+        if user.has_perm(PAGE_CHANGE_CODENAME):
+            # Users with change permissions on a page can automatically view it
+            perm_tuples.append(get_change_perm_tuples(user, site))
+        if GRANT_ALL_PERMISSIONS in perm_tuples:
+            visible |= restricted
+        else:
+            visible |= restricted & _perm_tuples_to_q([perm for perms in perm_tuples for perm in perms])
+    return queryset.filter(visible)
+
+
+PERMISSION_VERSION_KEY = f"{get_cms_setting('CACHE_PREFIX')}rest:permissions:version"
+
+
+def get_permission_fingerprint(user) -> tuple:
+    """
+    Returns what the view permissions of a user depend on: users without permissions of their own
+    share the fingerprint (and the cached viewable pages) with all users of the same groups.
+    """
+    if not user.is_authenticated:
+        return ("anonymous",)
+    # Not type(user): request.user is a lazy wrapper around the user
+    user_model = get_user_model()
+    own_permissions = ExpressionWrapper(
+        Exists(PagePermission.objects.filter(user=OuterRef("pk")))
+        | Exists(GlobalPagePermission.objects.filter(user=OuterRef("pk")))
+        | Exists(user_model.user_permissions.through.objects.filter(user=OuterRef("pk"))),
+        output_field=BooleanField(),
+    )
+    rows = list(
+        user_model.objects.filter(pk=user.pk)
+        .annotate(own_permissions=own_permissions)
+        .values_list("own_permissions", "groups")
+    )
+    if not rows or rows[0][0]:
+        return ("user", user.pk, user.is_staff)
+    return ("groups", user.is_staff, *sorted(group for _, group in rows if group is not None))
+
+
+def get_viewable_page_ids(user, site: Site) -> tuple[bool, frozenset[int]] | None:
+    """
+    Returns the pages of the site the user can view as ``(exclude, page_ids)``: either the ids of
+    the viewable pages or (if there are fewer of them) the ids of the pages the user cannot view.
+    ``None`` means the user can view all pages.
+
+    The result is computed in a few queries and cached per permission fingerprint
+    (see :func:`get_permission_fingerprint`). The cache entry is invalidated whenever pages or
+    page permissions change, or the django CMS page cache version moves on (e.g. after a page
+    was moved).
+    """
+    if user.is_superuser or (not get_cms_setting("PERMISSION") and get_cms_setting("PUBLIC_FOR") == "all"):
+        return None
+
+    fingerprint = "|".join(str(part) for part in get_permission_fingerprint(user))
+    digest = hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()
+    versions = cache.get_many([PERMISSION_VERSION_KEY, CMS_PAGE_CACHE_VERSION_KEY])
+    if PERMISSION_VERSION_KEY not in versions:
+        versions[PERMISSION_VERSION_KEY] = clear_viewable_page_ids()
+    key = "{}rest:permissions:{}:{}:{}:{}".format(
+        get_cms_setting("CACHE_PREFIX"),
+        site.pk,
+        digest,
+        versions[PERMISSION_VERSION_KEY],
+        versions.get(CMS_PAGE_CACHE_VERSION_KEY, 1),
+    )
+    result = cache.get(key, default=False)
+    if result is not False:
+        return result
+
+    pages = get_site_filtered_queryset(site)
+    page_ids = set(pages.values_list("pk", flat=True))
+    viewable_ids = set(_filter_viewable_pages(pages, user, site).values_list("pk", flat=True))
+    if viewable_ids == page_ids:
+        result = None
+    elif len(viewable_ids) <= len(page_ids) // 2:
+        result = (False, frozenset(viewable_ids))
+    else:
+        result = (True, frozenset(page_ids - viewable_ids))
+    cache.set(key, result, get_cms_setting("CACHE_DURATIONS")["permissions"])
+    return result
+
+
+def filter_viewable_pages(queryset: QuerySet, user, site: Site) -> QuerySet:
+    """
+    Restricts a page queryset to the pages the user can view, using the cached page ids of
+    :func:`get_viewable_page_ids`. The result can be counted and paginated in the database.
+    """
+    page_ids = get_viewable_page_ids(user, site)
+    if page_ids is None:
+        return queryset
+    exclude, page_ids = page_ids
+    return queryset.exclude(pk__in=page_ids) if exclude else queryset.filter(pk__in=page_ids)
+
+
+def get_viewable_pages(pages: Iterable[Page], user, site: Site) -> list[Page]:
+    """
+    Returns the pages the user can view, checked in memory against the cached page ids of
+    :func:`get_viewable_page_ids`. Anonymous users cannot view pages which require a login.
+    """
+    page_ids = get_viewable_page_ids(user, site)
+    pages = [page for page in pages if not (user.is_anonymous and page.login_required)]
+    if page_ids is None:
+        return pages
+    exclude, page_ids = page_ids
+    return [page for page in pages if (page.pk in page_ids) != exclude]
+
+
+def clear_viewable_page_ids(sender=None, **kwargs) -> int:
+    """Signal receiver: Invalidates all cached viewable page ids. Returns the new cache version."""
+    version = time.time_ns()
+    cache.set(PERMISSION_VERSION_KEY, version, None)
+    return version
+
+
 class IsAllowedLanguage(BasePermission):
     """
     Check whether the provided language is allowed for a given site.
     """
 
     def has_permission(self, request: Request, view: BaseAPIView) -> bool:
-        site = view.site
         language = view.kwargs.get("language")
-        allowed_languages = [lang[0] for lang in get_language_tuple(site.pk)]
-        if language not in allowed_languages:
+        if language not in get_api_context(request).languages:
             raise NotFound()
         return True
 
@@ -33,11 +198,7 @@ class IsAllowedPublicLanguage(IsAllowedLanguage):
     def has_permission(self, request: Request, view: BaseAPIView) -> bool:
         super().has_permission(request, view)
         language = view.kwargs.get("language")
-        languages = get_languages(get_current_site(request).pk)
-        public_languages = [
-            lang["code"] for lang in languages if lang.get("public", True)
-        ]
-        if language not in public_languages:
+        if language not in get_api_context(request).public_languages:
             raise NotFound()
         return True
 
@@ -47,9 +208,7 @@ class CanViewPage(IsAllowedLanguage):
     Check whether the provided language is allowed and the user can view the page.
     """
 
-    def has_object_permission(
-        self, request: Request, view: BaseAPIView, obj: Page
-    ) -> bool:
+    def has_object_permission(self, request: Request, view: BaseAPIView, obj: Page) -> bool:
         if isinstance(obj, Page):
             if not super().has_permission(request, view):
                 raise NotFound()
@@ -62,13 +221,10 @@ class CanViewPageContent(IsAllowedLanguage):
     Object-level permission to check if the user is allowed to view PageContent.
     """
 
-    def has_object_permission(
-        self, request: Request, view: BaseAPIView, obj: PageContent
-    ) -> bool:
+    def has_object_permission(self, request: Request, view: BaseAPIView, obj: PageContent) -> bool:
         """
         # Check if the object is a PageContent instance and enforce page view permission
         """
-        if isinstance(obj, PageContent):
-            if not user_can_view_page(request.user, obj.page):
-                raise NotFound()
+        if isinstance(obj, PageContent) and not user_can_view_page(request.user, obj.page):
+            raise NotFound()
         return True
@@ -1,27 +1,35 @@
 import json
-from typing import Any, TypeVar
+from collections import defaultdict
 from collections.abc import Iterable
+from contextlib import contextmanager
+from typing import Any, TypeVar
 
-from django.contrib.sites.shortcuts import get_current_site
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 from django.db import models
+from django.db.models import prefetch_related_objects
 from django.utils.html import escape, mark_safe
 
-from cms.models import Placeholder
+from cms.models import CMSPlugin, Placeholder
 from cms.plugin_rendering import ContentRenderer
-from cms.utils.plugins import get_plugins
+from cms.utils.plugins import assign_plugins, get_plugins
 
 from djangocms_rest.serializers.placeholders import PlaceholderSerializer
 from djangocms_rest.serializers.plugins import GenericPluginSerializer, base_exclude
 from djangocms_rest.serializers.utils.cache import (
     get_placeholder_rest_cache,
+    get_placeholder_rest_cache_many,
     set_placeholder_rest_cache,
+    set_placeholder_rest_cache_many,
 )
+from djangocms_rest.utils import get_api_context
 
 
 ModelType = TypeVar("ModelType", bound=models.Model)
 
+#: Marks placeholders whose cache entry was not read by ``RESTRenderer.prefetch_plugins``
+NOT_PREFETCHED = object()
+
 
 def get_auto_model_serializer(model_class: type[ModelType]) -> type:
     """
@@ -50,21 +58,60 @@ def get_auto_model_serializer(model_class: type[ModelType]) -> type:
     )
 
 
-def serialize_cms_plugin(
-    instance: Any | None, context: dict[str, Any]
-) -> dict[str, Any] | None:
-    if not instance or not hasattr(instance, "get_plugin_instance"):
-        return None
-    plugin_instance, plugin = instance.get_plugin_instance()
-
-    model_cls = plugin_instance.__class__
+def get_plugin_serializer_class(plugin, model_cls: type[ModelType]) -> type:
+    """
+    Returns the serializer class of a plugin, building (and keeping) an automatic
+    model serializer if the plugin does not declare one.
+    """
     serializer_cls = getattr(plugin, "serializer_class", None)
     serializer_cls = serializer_cls or get_auto_model_serializer(model_cls)
     plugin.__class__.serializer_class = serializer_cls
+    return serializer_cls
 
+
+def serialize_cms_plugin(instance: Any | None, context: dict[str, Any]) -> dict[str, Any] | None:
+    if not instance or not hasattr(instance, "get_plugin_instance"):
+        return None
+    plugin_instance, plugin = instance.get_plugin_instance()
+
+    serializer_cls = get_plugin_serializer_class(plugin, plugin_instance.__class__)
     return serializer_cls(plugin_instance, context=context).data
 
 
+def prefetch_plugin_relations(plugins: Iterable[CMSPlugin], context: dict[str, Any]) -> None:
+    """
+    Loads the objects referenced by foreign keys of (downcast) plugin instances which
+    their serializers output: one query per plugin model and foreign key instead of
+    one query per plugin.
+    """
+    plugins_by_model = defaultdict(list)
+    for plugin in plugins:
+        plugins_by_model[plugin.__class__].append(plugin)
+
+    for model_cls, instances in plugins_by_model.items():
+        if model_cls is CMSPlugin:
+            continue  # Plugin without model
+        serializer_cls = get_plugin_serializer_class(instances[0].get_plugin_class_instance(), model_cls)
+        serializer_fields = serializer_cls(context=context).fields
+        lookups = [
+            field.name
+            for field in model_cls._meta.concrete_fields
+            if field.is_relation
+            and not field.remote_field.parent_link
+            and field.name not in base_exclude
+            and field.name in serializer_fields
+        ]
+        if lookups:
+            prefetch_related_objects(instances, *lookups)
+
+
+def get_plugin_tree(plugins: Iterable[CMSPlugin]) -> Iterable[CMSPlugin]:
+    """Yields the plugins and all their descendants."""
+    for plugin in plugins:
+        yield plugin
+        yield from get_plugin_tree(getattr(plugin, "child_plugin_instances", None) or [])
+
+
 # Template for a collapsable key-value pair
 DETAILS_TEMPLATE = (
     '<details open><summary><span class="key">"{key}"</span>: {open}</summary>'
@@ -72,10 +119,7 @@ DETAILS_TEMPLATE = (
 )
 
 # Template for a collapsable object/list
-OBJ_TEMPLATE = (
-    "<details open><summary>{open}</summary>"
-    '<div class="indent">{value}</div></details>{close}'
-)
+OBJ_TEMPLATE = '<details open><summary>{open}</summary><div class="indent">{value}</div></details>{close}'
 
 # Tempalte for a non-collasable object/list
 FIXED_TEMPLATE = '{open}<div class="indent">{value}</div>{close}'
@@ -110,8 +154,8 @@ def highlight_data(json_data: Any, drop_frame: bool = False) -> str:
             classes = "str ellipsis"
 
         if is_valid_url(json_data):
-            return f'<span class="{ classes }">"<a href="{ json_data }">{escapestr(json_data)}</a>"</span>'
-        return f'<span class="{ classes }">"{escapestr(json_data)}"</span>'
+            return f'<span class="{classes}">"<a href="{json_data}">{escapestr(json_data)}</a>"</span>'
+        return f'<span class="{classes}">"{escapestr(json_data)}"</span>'
     if isinstance(json_data, bool):
         return f'<span class="bool">{str(json_data).lower()}</span>'
     if isinstance(json_data, (int, float)):
@@ -166,8 +210,7 @@ def highlight_json(
         dict[str, str]: A dictionary containing the formatted representation with keys 'open', 'close', and 'value'.
     """
     has_children = children is not None
-    if field in json_data:
-        del json_data[field]
+    json_data.pop(field, None)
 
     items = [
         DETAILS_TEMPLATE.format(
@@ -206,18 +249,16 @@ class RESTRenderer(ContentRenderer):
     """
 
     placeholder_edit_template = "{content}{plugin_js}{placeholder_js}"
+    # Cache entries collected by defer_cache_writes()
+    deferred_cache_writes = None
 
-    def render_plugin(
-        self, instance, context, placeholder=None, editable: bool = False
-    ):
+    def render_plugin(self, instance, context, placeholder=None, editable: bool = False):
         """
         Render a CMS plugin instance using the serialize_cms_plugin function.
         """
         data = serialize_cms_plugin(instance, context) or {}
         children = [
-            self.render_plugin(
-                child, context, placeholder=placeholder, editable=editable
-            )
+            self.render_plugin(child, context, placeholder=placeholder, editable=editable)
             for child in getattr(instance, "child_plugin_instances", [])
         ] or None
         content = OBJ_TEMPLATE.format(**highlight_json(data, children=children))
@@ -228,21 +269,14 @@ class RESTRenderer(ContentRenderer):
                 placeholder=instance.placeholder_id,
                 content=content,
                 position=instance.position,
-                disabled=' cms-slot' if getattr(plugin, "is_slot", False) else ''
-            )
-            placeholder_cache = self._rendered_plugins_by_placeholder.setdefault(
-                placeholder.pk, {}
+                disabled=" cms-slot" if getattr(plugin, "is_slot", False) else "",
             )
+            placeholder_cache = self._rendered_plugins_by_placeholder.setdefault(placeholder.pk, {})
             placeholder_cache.setdefault("plugins", []).append(instance)
         return mark_safe(content)
 
-    def render_plugins(
-        self, placeholder, language, context, editable=False, template=None
-    ):
-        yield "<div class='rest-placeholder' data-placeholder='{placeholder}' data-language='{language}'>".format(
-            placeholder=placeholder.slot,
-            language=language,
-        )
+    def render_plugins(self, placeholder, language, context, editable=False, template=None):
+        yield f"<div class='rest-placeholder' data-placeholder='{placeholder.slot}' data-language='{language}'>"
         placeholder_data = PlaceholderSerializer(
             instance=placeholder,
             language=language,
@@ -266,26 +300,81 @@ class RESTRenderer(ContentRenderer):
     def get_plugins_and_placeholder_lot(
         self, placeholder, language, context, editable=False, template=None
     ) -> Iterable[str]:
-        yield from super().render_plugins(
-            placeholder, language, context, editable=editable, template=template
+        yield from super().render_plugins(placeholder, language, context, editable=editable, template=template)
+
+    def use_placeholder_cache(self, placeholder, use_cache=True) -> bool:
+        if use_cache and placeholder.cache_placeholder:
+            return self.placeholder_cache_is_enabled()
+        return False
+
+    def prefetch_plugins(self, placeholders, language, use_cache=True) -> None:
+        """
+        Loads the plugins of all placeholders which are not served from the cache at once:
+        One query for the plugins of all placeholders plus one query per plugin type to
+        downcast them, instead of these queries for every single placeholder. The cache
+        entries are read with a single ``get_many``.
+        Plugins (and cache hits) are kept on the placeholder instances, so
+        :meth:`serialize_placeholder` does not fetch them again.
+        """
+        placeholders = [
+            placeholder
+            for placeholder in placeholders
+            # Skip placeholders which have already been prefetched
+            if "_rest_cache" not in placeholder.__dict__ and not hasattr(placeholder, "_plugins_cache")
+        ]
+        cached = get_placeholder_rest_cache_many(
+            [placeholder for placeholder in placeholders if self.use_placeholder_cache(placeholder, use_cache)],
+            lang=language,
+            site_id=get_api_context(self.request).site.pk,
+            request=self.request,
         )
+        missing = []
+        for placeholder in placeholders:
+            if self.use_placeholder_cache(placeholder, use_cache):
+                # Misses are kept as None, so that serialize_placeholder does not read the cache again
+                placeholder._rest_cache = cached.get(placeholder.pk)
+            if placeholder.pk not in cached:
+                missing.append(placeholder)
+        assign_plugins(self.request, missing, template=None, lang=language)
+        prefetch_plugin_relations(
+            [plugin for placeholder in missing for plugin in getattr(placeholder, "_all_plugins_cache", [])],
+            {"request": self.request},
+        )
+
+    @contextmanager
+    def defer_cache_writes(self, language):
+        """
+        Collects the cache entries of all placeholders serialized within the block and writes
+        them with a single ``set_many`` when the block is left.
+        """
+        self.deferred_cache_writes = []
+        try:
+            yield self
+        finally:
+            entries, self.deferred_cache_writes = self.deferred_cache_writes, None
+            if entries:
+                set_placeholder_rest_cache_many(
+                    entries,
+                    lang=language,
+                    site_id=get_api_context(self.request).site.pk,
+                    request=self.request,
+                )
 
     def serialize_placeholder(self, placeholder, context, language, use_cache=True):
         context.update({"request": self.request})
-        if use_cache and placeholder.cache_placeholder:
-            use_cache = self.placeholder_cache_is_enabled()
-        else:
-            use_cache = False
+        use_cache = self.use_placeholder_cache(placeholder, use_cache)
 
-        if use_cache:
+        # The cache entry read by prefetch_plugins (None for a miss) is only used once
+        cached_value = placeholder.__dict__.pop("_rest_cache", NOT_PREFETCHED)
+        if not use_cache:
+            cached_value = None
+        elif cached_value is NOT_PREFETCHED:
             cached_value = get_placeholder_rest_cache(
                 placeholder,
                 lang=language,
-                site_id=get_current_site(self.request).pk,
+                site_id=get_api_context(self.request).site.pk,
                 request=self.request,
             )
-        else:
-            cached_value = None
 
         if cached_value is not None:
             # User has opted to use the cache
@@ -298,11 +387,13 @@ class RESTRenderer(ContentRenderer):
             context=context,
         )
 
-        if use_cache:
+        if use_cache and self.deferred_cache_writes is not None:
+            self.deferred_cache_writes.append((placeholder, plugin_content))
+        elif use_cache:
             set_placeholder_rest_cache(
                 placeholder,
                 lang=language,
-                site_id=get_current_site(self.request).pk,
+                site_id=get_api_context(self.request).site.pk,
                 content=plugin_content,
                 request=self.request,
             )
@@ -313,24 +404,21 @@ class RESTRenderer(ContentRenderer):
 
         return plugin_content
 
-    def serialize_plugins(
-        self, placeholder: Placeholder, language: str, context: dict
-    ) -> list:
+    def serialize_plugins(self, placeholder: Placeholder, language: str, context: dict) -> list:
         plugins = get_plugins(
             self.request,
             placeholder=placeholder,
             lang=language,
             template=None,
         )
+        prefetch_plugin_relations(get_plugin_tree(plugins), context)
 
         def serialize_children(child_plugins):
             children_list = []
             for child_plugin in child_plugins:
                 child_content = serialize_cms_plugin(child_plugin, context)
                 if getattr(child_plugin, "child_plugin_instances", None):
-                    child_content["children"] = serialize_children(
-                        child_plugin.child_plugin_instances
-                    )
+                    child_content["children"] = serialize_children(child_plugin.child_plugin_instances)
                 if child_content:
                     children_list.append(child_content)
             return children_list
@@ -339,10 +427,7 @@ class RESTRenderer(ContentRenderer):
         for plugin in plugins:
             plugin_content = serialize_cms_plugin(plugin, context)
             if getattr(plugin, "child_plugin_instances", None):
-                plugin_content["children"] = serialize_children(
-                    plugin.child_plugin_instances
-                )
+                plugin_content["children"] = serialize_children(plugin.child_plugin_instances)
             if plugin_content:
                 results.append(plugin_content)
         return results
-
@@ -0,0 +1,211 @@
+"""
+Surrogate keys and tag-based purging of CDN caches.
+
+With ``REST_SURROGATE_KEYS = True``, API responses carry a ``Surrogate-Key`` header (see
+``REST_SURROGATE_KEY_HEADER``) listing what they were built from: ``site:<id>``,
+``lang:<code>``, ``page:<id>``, ``placeholder:<id>`` and, for the page tree, page lists and
+menus, ``menu:<site id>``. A CDN can then hold the responses for a long time and drop exactly
+those affected by a change.
+
+``REST_PURGE_BACKEND`` configures where these purges are sent once a change is committed::
+
+    REST_PURGE_BACKEND = {
+        "BACKEND": "djangocms_rest.purge.HTTPPurgeBackend",
+        "OPTIONS": {"url": "https://api.fastly.com/service/<id>/purge", "headers": {"Fastly-Key": "..."}},
+    }
+"""
+
+from collections.abc import Iterable
+from functools import partial
+from operator import attrgetter
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from cms.models import Page, PageContent, PageUrl
+
+from djangocms_rest.utils import get_page_tree_lookup
+
+
+def surrogate_keys_enabled() -> bool:
+    return getattr(settings, "REST_SURROGATE_KEYS", False)
+
+
+def purge_enabled() -> bool:
+    return bool(getattr(settings, "REST_PURGE_BACKEND", None))
+
+
+def get_surrogate_key_header() -> str:
+    return getattr(settings, "REST_SURROGATE_KEY_HEADER", "Surrogate-Key")
+
+
+def get_site_key(site_id: int) -> str:
+    return f"site:{site_id}"
+
+
+def get_language_key(language: str) -> str:
+    return f"lang:{language}"
+
+
+def get_menu_key(site_id: int) -> str:
+    """Responses which depend on all pages of a site: the page tree, page lists and menus."""
+    return f"menu:{site_id}"
+
+
+def get_page_key(page_id: int) -> str:
+    return f"page:{page_id}"
+
+
+def get_placeholder_key(placeholder_id: int) -> str:
+    return f"placeholder:{placeholder_id}"
+
+
+def get_page_content_keys(page_content: PageContent) -> set[str]:
+    """The keys of a page response: the page and the placeholders embedded in it."""
+    return {
+        get_page_key(page_content.page_id),
+        *(get_placeholder_key(placeholder.pk) for placeholder in page_content.placeholders.all()),
+    }
+
+
+def get_placeholder_keys(placeholder, source) -> set[str]:
+    """The keys of a placeholder response: the placeholder and, for page contents, its page."""
+    keys = {get_placeholder_key(placeholder.pk)}
+    if isinstance(source, PageContent):
+        keys.add(get_page_key(source.page_id))
+    return keys
+
+
+def format_surrogate_keys(keys: Iterable[str]) -> str:
+    # Cloudflare expects a comma-separated Cache-Tag header, Fastly and Varnish a space-separated one
+    separator = "," if get_surrogate_key_header().lower() == "cache-tag" else " "
+    return separator.join(keys)
+
+
+class PurgeBackend:
+    """Base class of purge backends. ``OPTIONS`` of the ``REST_PURGE_BACKEND`` setting are
+    passed to the constructor."""
+
+    def __init__(self, **options):
+        pass
+
+    def purge(self, keys: list[str]) -> None:
+        raise NotImplementedError
+
+
+class FilePurgeBackend(PurgeBackend):
+    """Appends the purged keys to a file, one purge per line (for development and tests)."""
+
+    def __init__(self, path: str, **options):
+        self.path = path
+
+    def purge(self, keys: list[str]) -> None:
+        with open(self.path, "a") as file:
+            file.write(" ".join(keys) + "\n")
+
+
+class HTTPPurgeBackend(PurgeBackend):
+    """
+    Sends the purged keys in a header (by default the surrogate key header) of a request to
+    ``url``, e.g. Fastly's batch purge API or a Varnish ``xkey`` purge handler. At most
+    ``batch_size`` keys are sent per request.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        method: str = "POST",
+        headers: dict[str, str] | None = None,
+        header: str | None = None,
+        batch_size: int = 256,
+        timeout: float = 10,
+        **options,
+    ):
+        self.url = url
+        self.method = method
+        self.headers = headers or {}
+        self.header = header or get_surrogate_key_header()
+        self.batch_size = batch_size
+        self.timeout = timeout
+
+    def purge(self, keys: list[str]) -> None:
+        for i in range(0, len(keys), self.batch_size):
+            headers = {**self.headers, self.header: format_surrogate_keys(keys[i : i + self.batch_size])}
+            with urlopen(Request(self.url, method=self.method, headers=headers), timeout=self.timeout):
+                pass
+
+
+def get_purge_backend() -> PurgeBackend | None:
+    config = getattr(settings, "REST_PURGE_BACKEND", None)
+    if not config:
+        return None
+    return import_string(config["BACKEND"])(**config.get("OPTIONS", {}))
+
+
+def purge(keys: Iterable[str]) -> None:
+    """Purges the keys right away."""
+    backend = get_purge_backend()
+    keys = sorted(set(keys))
+    if backend is not None and keys:
+        backend.purge(keys)
+
+
+def schedule_purge(keys: Iterable[str]) -> None:
+    """Purges the keys once the transaction is committed. Failing purges are logged, not raised."""
+    if purge_enabled():
+        transaction.on_commit(partial(purge, set(keys)), robust=True)
+
+
+def get_page_keys(pages: Iterable[Page]) -> set[str]:
+    """The keys of the pages and the menus of their sites."""
+    site_id = attrgetter(get_page_tree_lookup("site_id").replace("__", "."))
+    keys = set()
+    for page in pages:
+        keys.update((get_page_key(page.pk), get_menu_key(site_id(page))))
+    return keys
+
+
+def page_content_changed(sender, instance: PageContent, raw: bool = False, **kwargs) -> None:
+    """``post_save`` / ``post_delete`` receiver: Titles, menu settings or meta data changed."""
+    if not raw and purge_enabled():
+        schedule_purge(get_page_keys([instance.page]))
+
+
+def page_changed(sender, instance: Page, raw: bool = False, **kwargs) -> None:
+    """``post_save`` / ``post_delete`` receiver: Page settings changed or the page was deleted."""
+    if not raw:
+        schedule_purge(get_page_keys([instance]))
+
+
+def page_url_changed(sender, instance: PageUrl, raw: bool = False, **kwargs) -> None:
+    """``post_save`` / ``post_delete`` receiver: The path of a page changed."""
+    if raw or not purge_enabled():
+        return
+    lookup = get_page_tree_lookup("site_id")
+    site_id = Page.objects.filter(pk=instance.page_id).values_list(lookup, flat=True).first()
+    if site_id is not None:
+        schedule_purge([get_page_key(instance.page_id), get_menu_key(site_id)])
+
+
+def page_operation(sender, operation: str, obj=None, **kwargs) -> None:
+    """``post_obj_operation`` receiver: A page was moved, copied, deleted, ... in the admin."""
+    if purge_enabled() and isinstance(obj, Page) and obj.pk is not None:
+        # Moving a page changes the paths of all its descendants in bulk, without signals
+        schedule_purge(get_page_keys([obj, *obj.get_descendant_pages()]))
+
+
+def placeholder_operation(sender, **kwargs) -> None:
+    """``post_placeholder_operation`` receiver: Plugins were added, changed, moved or deleted.
+    Page responses embedding the placeholder carry its key, too."""
+    placeholders = [kwargs.get(key) for key in ("placeholder", "source_placeholder", "target_placeholder")]
+    schedule_purge(get_placeholder_key(placeholder.pk) for placeholder in placeholders if placeholder is not None)
+
+
+def version_operation(sender, operation: str, obj, **kwargs) -> None:
+    """``post_version_operation`` receiver (djangocms-versioning): A page content was (un)published."""
+    from djangocms_versioning.constants import OPERATION_PUBLISH, OPERATION_UNPUBLISH
+
+    if operation in (OPERATION_PUBLISH, OPERATION_UNPUBLISH) and isinstance(obj.content, PageContent):
+        schedule_purge(get_page_keys([obj.content.page]))
@@ -0,0 +1,101 @@
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer using `orjson <https://github.com/ijl/orjson>`_ if it is installed. orjson
+    serializes dicts, lists, strings, numbers, datetimes and UUIDs natively; all other types
+    (lazy translation strings, decimals, querysets, ...) are converted by DRF's encoder like by
+    the stock renderer. Indented output (``Accept: application/json; indent=4``, the browsable
+    API), ASCII-only or non-compact output (``UNICODE_JSON`` / ``COMPACT_JSON`` settings) and data
+    orjson cannot encode (e.g. integers beyond 64 bits) are rendered by the stock renderer.
+    """
+
+    options = (orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z) if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Like the stock renderer, escape U+2028 and U+2029 to output a strict subset of JavaScript
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renders `MessagePack <https://msgpack.org>`_ (``Accept: application/msgpack``) if msgpack is
+    installed. Types without a MessagePack representation (datetimes, lazy strings, decimals,
+    ...) are converted by DRF's JSON encoder, so the data equals the JSON response's.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=JSONEncoder().default, use_bin_type=True)
+
+
+def _encode_as_json(encoder, value):
+    encoder.encode(JSONEncoder().default(value))
+
+
+class CBORRenderer(BaseRenderer):
+    """
+    Renders `CBOR <https://cbor.io>`_ (``Accept: application/cbor``) if cbor2 is installed.
+    Types without a JSON representation (datetimes, lazy strings, decimals, ...) are converted by
+    DRF's JSON encoder rather than to CBOR tags, so the data equals the JSON response's.
+    """
+
+    media_type = "application/cbor"
+    format = "cbor"
+    charset = None
+    render_style = "binary"
+
+    encoders = dict.fromkeys((date, datetime, time, Decimal, uuid.UUID), _encode_as_json)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return cbor2.dumps(data, default=_encode_as_json, encoders=self.encoders)
+
+
+def get_binary_renderer_classes() -> list[type[BaseRenderer]]:
+    """The binary renderers whose libraries are installed."""
+    return [
+        renderer_class
+        for renderer_class, library in ((MessagePackRenderer, msgpack), (CBORRenderer, cbor2))
+        if library is not None
+    ]
@@ -0,0 +1,86 @@
+"""
+Route table for resolving page paths.
+
+The table maps ``(site id, path)`` to the page URLs of the matching page (one per language,
+with the page itself) and keeps them in the Django cache, so that a known path is resolved
+without any database query. Paths that do not resolve to a page are remembered as well, so
+that repeated requests for unknown paths (crawlers, bots) do not hit the database either.
+
+All entries belong to a route version that is kept in the cache, too: saving or deleting a
+page or page URL, and page operations in the admin (e.g. moving a page, which changes the paths
+of its descendants in bulk, without signals), move the version on. Entries also depend on the
+django CMS page cache version, which django CMS moves on whenever pages change (e.g. after
+``Page.move_page``). Since the cache is shared, this forgets the routes (and the unknown paths)
+of all processes at once.
+"""
+
+import hashlib
+import time
+
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.http import Http404
+
+from cms.cache import CMS_PAGE_CACHE_VERSION_KEY
+from cms.models import Page, PageUrl
+from cms.utils.conf import get_cms_setting
+
+ROUTE_VERSION_KEY = f"{get_cms_setting('CACHE_PREFIX')}rest:routes:version"
+
+
+class RouteTable:
+    def resolve(self, site: Site, path: str) -> Page:
+        """Returns the page with the given path on the site (with its URLs cached) or raises ``Http404``."""
+        page = self.resolve_many(site, [path]).get(path)
+        if page is None:
+            raise Http404
+        return page
+
+    def resolve_many(self, site: Site, paths: list[str]) -> dict[str, Page]:
+        """
+        Returns the pages of all given paths which exist on the site (with their URLs cached).
+        Known paths are read from the cache with one ``get_many``, all others are resolved in a
+        single query and stored.
+        """
+        versions = cache.get_many([ROUTE_VERSION_KEY, CMS_PAGE_CACHE_VERSION_KEY])
+        if ROUTE_VERSION_KEY not in versions:
+            versions[ROUTE_VERSION_KEY] = self.clear()
+        version = f"{versions[ROUTE_VERSION_KEY]}:{versions.get(CMS_PAGE_CACHE_VERSION_KEY, 1)}"
+        keys = {self.get_key(site.pk, path, version): path for path in dict.fromkeys(paths)}
+        urls_by_path = {keys[key]: page_urls for key, page_urls in cache.get_many(keys).items()}
+
+        missing = {path for path in keys.values() if path not in urls_by_path}
+        if missing:
+            for url in PageUrl.objects.get_for_site(site).filter(path__in=missing).select_related("page"):
+                urls_by_path.setdefault(url.path, []).append(url)
+            # Paths without a page are stored as an empty list
+            entries = {key: urls_by_path.setdefault(path, []) for key, path in keys.items() if path in missing}
+            for page_urls in entries.values():
+                page_urls.sort(key=lambda url: url.pk)
+            cache.set_many(entries, get_cms_setting("CACHE_DURATIONS")["menus"])
+        return {path: self.get_page(page_urls) for path, page_urls in urls_by_path.items() if page_urls}
+
+    @staticmethod
+    def get_key(site_id: int, path: str, version: str) -> str:
+        digest = hashlib.md5(path.encode(), usedforsecurity=False).hexdigest()
+        return f"{get_cms_setting('CACHE_PREFIX')}rest:routes:{site_id}:{version}:{digest}"
+
+    @staticmethod
+    def get_page(page_urls: list[PageUrl]) -> Page:
+        page = page_urls[0].page
+        page.urls_cache = {url.language: url for url in page_urls}
+        return page
+
+    def clear(self) -> int:
+        """Forgets all routes and unknown paths. Returns the new route version."""
+        version = time.time_ns()
+        cache.set(ROUTE_VERSION_KEY, version, None)
+        return version
+
+
+route_table = RouteTable()
+
+
+def clear_routes(sender=None, **kwargs) -> None:
+    """``post_save`` / ``post_delete`` receiver for pages and page URLs and ``post_obj_operation`` receiver."""
+    route_table.clear()
@@ -68,8 +68,95 @@ try:
         """
         return extend_schema(responses=OpenApiResponse(response=NavigationNodeSerializer(many=True)))(method)
 
+    SPARSE_FIELDSET_PARAMETERS = [
+        OpenApiParameter(
+            name="fields",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+            description="Comma-separated fields to include (nested fields are dotted, e.g. placeholders.slot)",
+            required=False,
+        ),
+        OpenApiParameter(
+            name="omit",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+            description="Comma-separated fields to leave out (e.g. placeholders.content)",
+            required=False,
+        ),
+    ]
+
+    extend_sparse_fieldset_schema = extend_schema(parameters=SPARSE_FIELDSET_PARAMETERS)
+
+    extend_page_detail_schema = extend_schema(
+        parameters=[
+            *SPARSE_FIELDSET_PARAMETERS,
+            OpenApiParameter(
+                name="placeholders",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Comma-separated slots of the placeholders to embed the content of, or none",
+                required=False,
+            ),
+        ]
+    )
+
+    extend_page_batch_schema = extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="path",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Path of a page to retrieve, repeat for more pages (e.g. ?path=a&path=b)",
+                required=True,
+                many=True,
+            ),
+            *SPARSE_FIELDSET_PARAMETERS,
+            OpenApiParameter(
+                name="placeholders",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Comma-separated slots of the placeholders to embed the content of, or none",
+                required=False,
+            ),
+        ]
+    )
+
+    extend_placeholder_batch_schema = extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="placeholder",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Placeholder to retrieve as {content_type_id}/{object_id}/{slot}, repeat for more",
+                required=True,
+                many=True,
+            ),
+            *SPARSE_FIELDSET_PARAMETERS,
+            OpenApiParameter(
+                name="html",
+                type=OpenApiTypes.INT,
+                location="query",
+                description="Set to 1 to include HTML rendering in response",
+                required=False,
+            ),
+        ]
+    )
+
+    extend_change_feed_schema = extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="since",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Token returned by the previous request; omit to get the current token",
+                required=False,
+            ),
+        ]
+    )
+
     extend_placeholder_schema = extend_schema(
         parameters=[
+            *SPARSE_FIELDSET_PARAMETERS,
             OpenApiParameter(
                 name="html",
                 type=OpenApiTypes.INT,
@@ -100,6 +187,33 @@ try:
         ]
     )
 
+    extend_page_tree_schema = extend_schema(
+        parameters=[
+            *SPARSE_FIELDSET_PARAMETERS,
+            OpenApiParameter(
+                name="stream",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description="Set to true to stream the JSON response (for very large page trees)",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="depth",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Number of tree levels to return (use children_count to lazy-load deeper levels)",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="root",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Path of a page to only return the tree below this page",
+                required=False,
+            ),
+        ]
+    )
+
 except ImportError:
 
     def method_schema_decorator(method):
@@ -119,3 +233,27 @@ except ImportError:
     def extend_page_search_schema(func):
         """No-op when drf-spectacular is not available."""
         return func
+
+    def extend_page_tree_schema(func):
+        """No-op when drf-spectacular is not available."""
+        return func
+
+    def extend_sparse_fieldset_schema(func):
+        """No-op when drf-spectacular is not available."""
+        return func
+
+    def extend_page_detail_schema(func):
+        """No-op when drf-spectacular is not available."""
+        return func
+
+    def extend_page_batch_schema(func):
+        """No-op when drf-spectacular is not available."""
+        return func
+
+    def extend_placeholder_batch_schema(func):
+        """No-op when drf-spectacular is not available."""
+        return func
+
+    def extend_change_feed_schema(func):
+        """No-op when drf-spectacular is not available."""
+        return func
@@ -0,0 +1,351 @@
+"""
+Full-text search of page contents.
+
+Each page content gets a :class:`~djangocms_rest.models.SearchEntry` with its titles and the
+text of its serialized placeholders (the output of :meth:`RESTRenderer.serialize_plugins`).
+The database's own full-text engine indexes these entries: an FTS5 table on SQLite and a GIN
+``tsvector`` index on PostgreSQL. Other databases fall back to (unranked) substring matching.
+"""
+
+import html
+import re
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import DatabaseError, transaction
+from django.db import connection as default_connection
+from django.db import connections as db_connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import BooleanField, Case, FloatField, Q, QuerySet, Value, When
+from django.db.models.expressions import RawSQL
+from django.http import HttpRequest
+from django.template import Context
+from django.utils.html import strip_tags
+
+from cms.models import PageContent
+from cms.utils.placeholder import get_declared_placeholders_for_obj
+
+from djangocms_rest.models import SearchEntry
+from djangocms_rest.utils import get_page_tree_lookup
+
+WORD_PATTERN = re.compile(r"\w+")
+
+#: Keys of serialized plugin data which do not contain searchable text
+SEARCH_SKIP_KEYS = {"plugin_type", "parent_plugin_type", "type", "attrs", "template", "details"}
+
+
+class SearchBackend:
+    """Fallback backend for databases without a supported full-text engine."""
+
+    def create_index(self, connection: BaseDatabaseWrapper) -> None:
+        pass
+
+    def is_available(self, connection: BaseDatabaseWrapper) -> bool:
+        return True
+
+    def filter(self, queryset: QuerySet, terms: list[str]) -> QuerySet:
+        for term in terms:
+            queryset = queryset.filter(
+                Q(rest_search_entry__title__icontains=term) | Q(rest_search_entry__text__icontains=term)
+            )
+        rank = sum(
+            (
+                Case(When(rest_search_entry__title__icontains=term, then=Value(1.0)), default=Value(0.0))
+                for term in terms
+            ),
+            Value(0.0),
+        )
+        return queryset.annotate(search_rank=rank)
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """SQLite FTS5 table kept in sync with the search entries by triggers, ranked by BM25."""
+
+    table = SearchEntry._meta.db_table
+    fts_table = f"{table}_fts"
+    available = set()  # Aliases of the connections with an FTS5 table
+
+    def create_index(self, connection: BaseDatabaseWrapper) -> None:
+        if self.is_available(connection):
+            return
+        table, fts = self.table, self.fts_table
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts}" USING fts5('
+                    f'title, text, content="{table}", content_rowid="id", tokenize="unicode61 remove_diacritics 2")'
+                )
+        except DatabaseError:
+            return  # SQLite without FTS5
+        with connection.cursor() as cursor:
+            insert = f'INSERT INTO "{fts}"(rowid, title, text) VALUES (new.id, new.title, new.text);'
+            delete = (
+                f'INSERT INTO "{fts}"("{fts}", rowid, title, text) VALUES (\'delete\', old.id, old.title, old.text);'
+            )
+            cursor.execute(f'CREATE TRIGGER IF NOT EXISTS "{fts}_insert" AFTER INSERT ON "{table}" BEGIN {insert} END')
+            cursor.execute(f'CREATE TRIGGER IF NOT EXISTS "{fts}_delete" AFTER DELETE ON "{table}" BEGIN {delete} END')
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS "{fts}_update" AFTER UPDATE ON "{table}" BEGIN {delete} {insert} END'
+            )
+            cursor.execute(f'INSERT INTO "{fts}"("{fts}") VALUES (\'rebuild\')')
+
+    def is_available(self, connection: BaseDatabaseWrapper) -> bool:
+        if connection.alias not in self.available:
+            if self.fts_table not in connection.introspection.table_names():
+                return False
+            self.available.add(connection.alias)
+        return True
+
+    def filter(self, queryset: QuerySet, terms: list[str]) -> QuerySet:
+        # Quote every term (FTS5 syntax is not exposed) and match the last one as a prefix
+        match = " ".join(f'"{term}"' for term in terms) + "*"
+        table, fts = self.table, self.fts_table
+        return (
+            queryset.filter(rest_search_entry__isnull=False)
+            .filter(
+                RawSQL(
+                    f'"{table}"."id" IN (SELECT rowid FROM "{fts}" WHERE "{fts}" MATCH %s)',
+                    (match,),
+                    output_field=BooleanField(),
+                )
+            )
+            .annotate(
+                search_rank=RawSQL(
+                    # bm25() is lower for better matches, titles weigh ten times more than text
+                    f'SELECT -bm25("{fts}", 10.0, 1.0) FROM "{fts}" WHERE "{fts}" MATCH %s AND rowid = "{table}"."id"',
+                    (match,),
+                    output_field=FloatField(),
+                )
+            )
+        )
+
+
+class PostgreSQLSearchBackend(SearchBackend):
+    """GIN index on a weighted ``tsvector`` expression of the search entries."""
+
+    table = SearchEntry._meta.db_table
+    vector = (
+        f"(setweight(to_tsvector('simple'::regconfig, \"{table}\".\"title\"), 'A') || "
+        f"setweight(to_tsvector('simple'::regconfig, \"{table}\".\"text\"), 'B'))"
+    )
+    query = "to_tsquery('simple'::regconfig, %s)"
+
+    def create_index(self, connection: BaseDatabaseWrapper) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS "{self.table}_fts" ON "{self.table}" USING gin ({self.vector})'
+            )
+
+    def filter(self, queryset: QuerySet, terms: list[str]) -> QuerySet:
+        query = " & ".join(terms) + ":*"
+        return (
+            queryset.filter(rest_search_entry__isnull=False)
+            .filter(RawSQL(f"{self.vector} @@ {self.query}", (query,), output_field=BooleanField()))
+            .annotate(search_rank=RawSQL(f"ts_rank({self.vector}, {self.query})", (query,), output_field=FloatField()))
+        )
+
+
+def search_index_enabled() -> bool:
+    return getattr(settings, "REST_SEARCH_INDEX", False)
+
+
+SEARCH_BACKENDS = {
+    "sqlite": SQLiteSearchBackend,
+    "postgresql": PostgreSQLSearchBackend,
+}
+
+
+def get_search_backend(connection: BaseDatabaseWrapper = default_connection) -> SearchBackend:
+    backend = SEARCH_BACKENDS.get(connection.vendor, SearchBackend)()
+    return backend if backend.is_available(connection) else SearchBackend()
+
+
+def create_search_index(sender=None, using: str = "default", **kwargs) -> None:
+    """Creates the full-text index of the search entries (``post_migrate`` receiver)."""
+    from django.db import connections
+
+    connection = connections[using]
+    if SearchEntry._meta.db_table in connection.introspection.table_names():
+        SEARCH_BACKENDS.get(connection.vendor, SearchBackend)().create_index(connection)
+
+
+def search_page_contents(queryset: QuerySet, search_term: str) -> QuerySet:
+    """
+    Filters a page content queryset by the search index and orders it by relevance (best first).
+    Every word of the search term has to match, the last one as a prefix.
+    """
+    terms = WORD_PATTERN.findall(search_term.lower())
+    if not terms:
+        return queryset.none()
+    queryset = get_search_backend().filter(queryset, terms)
+    return queryset.order_by("-search_rank", *queryset.query.order_by)
+
+
+class SearchIndexRequest(HttpRequest):
+    """An anonymous request to serialize page contents outside the request/response cycle."""
+
+    def __init__(self, site):
+        super().__init__()
+        self.method = "GET"
+        self.site = site
+        self.user = AnonymousUser()
+
+    def get_host(self) -> str:
+        return self.site.domain
+
+
+def get_search_text(data: Any) -> Iterator[str]:
+    """Yields the text contained in serialized plugin data (without markup and urls)."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key not in SEARCH_SKIP_KEYS:
+                yield from get_search_text(value)
+    elif isinstance(data, list):
+        for item in data:
+            yield from get_search_text(item)
+    elif isinstance(data, str) and not data.startswith(("http://", "https://", "/")):
+        text = " ".join(html.unescape(strip_tags(data)).split())
+        if text:
+            yield text
+
+
+def get_page_content_search_text(page_content: PageContent, request: HttpRequest) -> str:
+    """Serializes the declared placeholders of a page content and returns their text."""
+    from djangocms_rest.plugin_rendering import RESTRenderer
+
+    declared = {placeholder.slot for placeholder in get_declared_placeholders_for_obj(page_content)}
+    placeholders = [placeholder for placeholder in page_content.placeholders.all() if placeholder.slot in declared]
+    renderer = RESTRenderer(request)
+    renderer.prefetch_plugins(placeholders, page_content.language, use_cache=False)
+    context = Context({"request": request})
+    texts = [page_content.meta_description or ""]
+    for placeholder in placeholders:
+        content = renderer.serialize_plugins(placeholder, language=page_content.language, context=context)
+        texts.extend(get_search_text(content))
+    return " ".join(dict.fromkeys(text for text in texts if text))
+
+
+def update_search_index(page_contents: Iterable[PageContent], timings: list[float] | None = None) -> int:
+    """
+    Creates or updates the search entries of the given page contents. Returns their number. The
+    time indexing each page content took is appended to ``timings`` if given.
+    """
+    requests = {}
+    count = 0
+    get_site = attrgetter(get_page_tree_lookup("site").replace("__", "."))
+    for page_content in page_contents:
+        start = time.perf_counter()
+        site = get_site(page_content.page)
+        request = requests.setdefault(site.pk, SearchIndexRequest(site))
+        titles = (page_content.title, page_content.page_title, page_content.menu_title)
+        SearchEntry.objects.update_or_create(
+            page_content=page_content,
+            defaults={
+                "site": site,
+                "language": page_content.language,
+                "title": " ".join(dict.fromkeys(title for title in titles if title)),
+                "text": get_page_content_search_text(page_content, request),
+            },
+        )
+        count += 1
+        if timings is not None:
+            timings.append(time.perf_counter() - start)
+    return count
+
+
+def reindex_pages(pages_and_languages: Iterable[tuple[int, str]]) -> int:
+    """
+    Re-indexes the public contents of the given pages (by id) in the given languages and removes
+    the entries of their contents which are no longer public. Returns the number of indexed contents.
+    """
+    contents, entries = Q(), Q()
+    for page_id, language in set(pages_and_languages):
+        contents |= Q(page_id=page_id, language=language)
+        entries |= Q(page_content__page_id=page_id, language=language)
+    if not contents:
+        return 0
+    public = PageContent.objects.filter(contents)
+    SearchEntry.objects.filter(entries).exclude(page_content__in=public).delete()
+    return update_search_index(public.select_related("page").prefetch_related("placeholders"))
+
+
+def _index_batch(pks: list[int], timings: list[float] | None = None) -> int:
+    page_contents = PageContent.objects.filter(pk__in=pks).select_related("page").prefetch_related("placeholders")
+    return update_search_index(page_contents, timings)
+
+
+def _index_batch_in_thread(pks: list[int], timings: list[float] | None = None) -> int:
+    try:
+        return _index_batch(pks, timings)
+    finally:
+        # Each worker thread has its own database connection
+        db_connections.close_all()
+
+
+def rebuild_search_index(
+    languages: Iterable[str] | None = None,
+    batch_size: int = 100,
+    workers: int = 1,
+    timings: list[float] | None = None,
+) -> int:
+    """
+    Indexes all (public) page contents, optionally only of the given languages, and removes
+    entries of page contents which are no longer public. Returns the number of indexed contents.
+
+    Page contents are loaded in batches of ``batch_size``. On PostgreSQL, ``workers`` threads
+    index batches in parallel; SQLite allows a single writer only, so other databases index the
+    batches one after the other. The time indexing each page content took is appended to
+    ``timings`` if given.
+    """
+    page_contents = PageContent.objects.all()
+    entries = SearchEntry.objects.all()
+    if languages is not None:
+        page_contents = page_contents.filter(language__in=languages)
+        entries = entries.filter(language__in=languages)
+    entries.exclude(page_content__in=page_contents).delete()
+
+    pks = list(page_contents.order_by("pk").values_list("pk", flat=True))
+    batches = [pks[i : i + batch_size] for i in range(0, len(pks), batch_size)]
+    if workers > 1 and default_connection.vendor == "postgresql":
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(partial(_index_batch_in_thread, timings=timings), batches))
+    return sum(_index_batch(batch, timings) for batch in batches)
+
+
+def schedule_reindex(page_contents: Iterable[PageContent]) -> None:
+    """Re-indexes the pages and languages of the page contents once the transaction is committed."""
+    if not search_index_enabled():
+        return
+    pages_and_languages = {(page_content.page_id, page_content.language) for page_content in page_contents}
+    if pages_and_languages:
+        transaction.on_commit(partial(reindex_pages, pages_and_languages))
+
+
+def page_content_saved(sender, instance: PageContent, raw: bool = False, **kwargs) -> None:
+    """``post_save`` receiver: Titles or meta data of a page content changed."""
+    if not raw:
+        schedule_reindex([instance])
+
+
+def placeholder_operation(sender, **kwargs) -> None:
+    """``post_placeholder_operation`` receiver: Plugins were added, changed, moved or deleted."""
+    placeholders = [kwargs.get(key) for key in ("placeholder", "source_placeholder", "target_placeholder")]
+    schedule_reindex(
+        placeholder.source
+        for placeholder in placeholders
+        if placeholder is not None and isinstance(placeholder.source, PageContent)
+    )
+
+
+def version_operation(sender, operation: str, obj, **kwargs) -> None:
+    """``post_version_operation`` receiver (djangocms-versioning): A page content was (un)published."""
+    from djangocms_versioning.constants import OPERATION_PUBLISH, OPERATION_UNPUBLISH
+
+    if operation in (OPERATION_PUBLISH, OPERATION_UNPUBLISH) and isinstance(obj.content, PageContent):
+        schedule_reindex([obj.content])
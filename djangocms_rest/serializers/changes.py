@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+
+class ChangedPageSerializer(serializers.Serializer):
+    path = serializers.CharField(allow_blank=True, help_text="Path of the changed page")
+    details = serializers.URLField(help_text="URL of the page detail endpoint")
+
+
+class ChangedPlaceholderSerializer(serializers.Serializer):
+    slot = serializers.CharField(help_text="Slot of the changed placeholder")
+    details = serializers.URLField(help_text="URL of the placeholder detail endpoint")
+
+
+class ChangeFeedSerializer(serializers.Serializer):
+    token = serializers.CharField(help_text="Token to pass as since with the next request")
+    full_rebuild = serializers.BooleanField(help_text="Set if the client has to fetch all pages again")
+    more = serializers.BooleanField(help_text="Set if further changes are available right away")
+    menu = serializers.BooleanField(required=False, help_text="Set if the menu may have changed")
+    pages = ChangedPageSerializer(many=True, required=False)
+    removed = serializers.ListField(
+        child=serializers.CharField(allow_blank=True), required=False, help_text="Paths of removed pages"
+    )
+    placeholders = ChangedPlaceholderSerializer(many=True, required=False)
@@ -1,8 +1,8 @@
-from rest_framework import serializers
-
 from menus.base import NavigationNode
 
-from djangocms_rest.utils import get_absolute_frontend_url
+from rest_framework import serializers
+
+from djangocms_rest.utils import get_absolute_frontend_url, get_api_context
 
 
 class NavigationNodeSerializer(serializers.Serializer):
@@ -29,7 +29,7 @@ class NavigationNodeSerializer(serializers.Serializer):
         """Customize the base representation of the NavigationNode."""
         path = getattr(obj, "api_endpoint", "")
         api_endpoint = get_absolute_frontend_url(self.request, path) if path else ""
-        if self.request._preview_mode:
+        if get_api_context(self.request).preview:
             if "?" in api_endpoint:
                 api_endpoint += "&preview=1"
             else:
@@ -1,12 +1,18 @@
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
 from django.db import models
+from django.db.models import prefetch_related_objects
 
-from cms.models import PageContent
+from cms.models import Page, PageContent
 from cms.utils.placeholder import get_declared_placeholders_for_obj
 
 from rest_framework import serializers
 
+from djangocms_rest.renderers import ORJSONRenderer
 from djangocms_rest.serializers.placeholders import PlaceholderSerializer
-from djangocms_rest.utils import get_absolute_frontend_url
+from djangocms_rest.serializers.utils.prefetch import prefetch_page_data, prefetch_templates
+from djangocms_rest.utils import get_absolute_frontend_url, get_api_context
 
 
 class BasePageSerializer(serializers.Serializer):
@@ -33,63 +39,127 @@ class BasePageSerializer(serializers.Serializer):
     changed_date = serializers.DateTimeField()
 
 
+def _get_api_endpoint(serializer, page_content: PageContent) -> str:
+    api_endpoint = get_absolute_frontend_url(
+        getattr(serializer, "request", None), page_content.page.get_api_endpoint(page_content.language)
+    )
+    if serializer.is_preview:
+        if "?" in api_endpoint:
+            api_endpoint += "&preview=1"
+        else:
+            api_endpoint += "?preview=1"
+    return api_endpoint
+
+
 class BasePageContentMixin:
+    # Each field is only computed if it is requested (see ``?fields=`` and ``?omit=``)
+    base_field_getters = {
+        "title": lambda self, page_content: page_content.title,
+        "page_title": lambda self, page_content: page_content.page_title or page_content.title,
+        "menu_title": lambda self, page_content: page_content.menu_title or page_content.title,
+        # Model allows None, schema does not
+        "meta_description": lambda self, page_content: page_content.meta_description or "",
+        "redirect": lambda self, page_content: str(page_content.redirect or ""),
+        "in_navigation": lambda self, page_content: page_content.in_navigation,
+        "soft_root": lambda self, page_content: page_content.soft_root,
+        "template": lambda self, page_content: page_content.template,
+        "xframe_options": lambda self, page_content: str(page_content.xframe_options or ""),
+        "limit_visibility_in_menu": lambda self, page_content: bool(page_content.limit_visibility_in_menu),
+        "language": lambda self, page_content: page_content.language,
+        "path": lambda self, page_content: page_content.page.get_path(page_content.language),
+        "absolute_url": lambda self, page_content: get_absolute_frontend_url(
+            getattr(self, "request", None), page_content.page.get_path(page_content.language)
+        ),
+        "is_home": lambda self, page_content: page_content.page.is_home,
+        "login_required": lambda self, page_content: page_content.page.login_required,
+        "languages": lambda self, page_content: page_content.page.get_languages(),
+        "is_preview": lambda self, page_content: getattr(self, "is_preview", False),
+        "application_namespace": lambda self, page_content: str(page_content.page.application_namespace or ""),
+        "creation_date": lambda self, page_content: page_content.creation_date,
+        "changed_date": lambda self, page_content: page_content.changed_date,
+        "details": _get_api_endpoint,
+    }
+
     @property
     def is_preview(self):
-        return "preview" in self.request.GET and self.request.GET.get("preview", "").lower() not in ("0", "false")
+        return get_api_context(self.request).preview
 
-    def get_base_representation(self, page_content: PageContent) -> dict:
-        request = getattr(self, "request", None)
-        path = page_content.page.get_path(page_content.language)
-        absolute_url = get_absolute_frontend_url(request, path)
-        api_endpoint = get_absolute_frontend_url(request, page_content.page.get_api_endpoint(page_content.language))
-        if self.is_preview:
-            if "?" in api_endpoint:
-                api_endpoint += "&preview=1"
-            else:
-                api_endpoint += "?preview=1"
-        redirect = str(page_content.redirect or "")
-        xframe_options = str(page_content.xframe_options or "")
-        application_namespace = str(page_content.page.application_namespace or "")
-        limit_visibility_in_menu = bool(page_content.limit_visibility_in_menu)
+    def include_field(self, name: str) -> bool:
+        return get_api_context(getattr(self, "request", None)).include_field(name)
 
+    def get_base_representation(self, page_content: PageContent) -> dict:
         return {
-            "title": page_content.title,
-            "page_title": page_content.page_title or page_content.title,
-            "menu_title": page_content.menu_title or page_content.title,
-            "meta_description": page_content.meta_description or "",  # Model allows None, schema does not
-            "redirect": redirect or "",
-            "in_navigation": page_content.in_navigation,
-            "soft_root": page_content.soft_root,
-            "template": page_content.template,
-            "xframe_options": xframe_options,
-            "limit_visibility_in_menu": limit_visibility_in_menu,
-            "language": page_content.language,
-            "path": path,
-            "absolute_url": absolute_url,
-            "is_home": page_content.page.is_home,
-            "login_required": page_content.page.login_required,
-            "languages": page_content.page.get_languages(),
-            "is_preview": getattr(self, "is_preview", False),
-            "application_namespace": application_namespace,
-            "creation_date": page_content.creation_date,
-            "changed_date": page_content.changed_date,
-            "details": api_endpoint,
+            name: get_value(self, page_content)
+            for name, get_value in self.base_field_getters.items()
+            if self.include_field(name)
         }
 
 
+def get_parent_id(page: Page) -> int | None:
+    try:
+        return page.parent_id
+    except AttributeError:
+        # Can be removed once django CMS 4.1 is no longer supported
+        parent = page.parent_page
+        return parent.pk if parent else None
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def stream_page_tree(
+    page_contents: Iterable[PageContent],
+    child: serializers.Serializer,
+    chunk_size: int = 500,
+    root_id: int | None = None,
+) -> Iterator[bytes]:
+    """
+    Serialize page contents into the same nested JSON as :class:`PageTreeSerializer`, but
+    incrementally: ``page_contents`` must be ordered by the page tree path (i.e., depth-first),
+    so each node can be written as soon as it is read. Only the chain of currently open
+    ancestors and one chunk of page contents (prefetched together) are kept in memory.
+    Nodes whose parent is not part of the tree are skipped with their descendants, like in
+    :class:`PageTreeSerializer`. The top-level nodes are the children of the page ``root_id``
+    (or the root pages of the site if ``None``).
+    """
+    renderer = ORJSONRenderer()
+    open_nodes = []  # page ids of the ancestors of the current node
+    first = True  # no sibling has been written to the innermost open list yet
+
+    yield b"["
+    for chunk in _chunks(page_contents, chunk_size):
+        for page_content in prefetch_page_data(chunk):
+            parent_id = get_parent_id(page_content.page)
+            if parent_id != root_id and parent_id not in open_nodes:
+                continue
+            while open_nodes and open_nodes[-1] != parent_id:
+                open_nodes.pop()
+                first = False
+                yield b"]}"
+            node = renderer.render(child.to_representation(page_content))[:-1]
+            yield (b"" if first else b",") + node + (b',"children":[' if len(node) > 1 else b'"children":[')
+            open_nodes.append(page_content.page_id)
+            first = True
+    yield b"]}" * len(open_nodes) + b"]"
+
+
 class PageTreeSerializer(serializers.ListSerializer):
-    def __init__(self, tree: dict, *args, **kwargs):
+    def __init__(self, tree: dict, *args, root_id: int | None = None, **kwargs):
         if not isinstance(tree, dict):
             raise TypeError(f"Expected tree to be a dict, got {type(tree).__name__}")
         self.tree = tree
-        super().__init__(tree.get(None, []), *args, **kwargs)
+        super().__init__(tree.get(root_id, []), *args, **kwargs)
 
     def tree_to_representation(self, item: PageContent) -> dict:
         serialized_data = self.child.to_representation(item)
         serialized_data["children"] = []
-        if item.page in self.tree:
-            serialized_data["children"] = [self.tree_to_representation(child) for child in self.tree[item.page]]
+        if item.page_id in self.tree:
+            serialized_data["children"] = [self.tree_to_representation(child) for child in self.tree[item.page_id]]
+        if self.child.include_field("children_count"):
+            serialized_data.setdefault("children_count", len(serialized_data["children"]))
         return serialized_data
 
     def to_representation(self, data: dict) -> list[dict]:
@@ -99,6 +169,7 @@ class PageTreeSerializer(serializers.ListSerializer):
 
 class PageMetaSerializer(BasePageSerializer, BasePageContentMixin):
     children = serializers.ListSerializer(child=serializers.DictField(), required=False, default=[])
+    children_count = serializers.IntegerField(required=False)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -107,56 +178,113 @@ class PageMetaSerializer(BasePageSerializer, BasePageContentMixin):
     @classmethod
     def many_init(cls, *args, **kwargs):
         """
-        Build a tree from the instances if `as_tree` is True.
+        Build a tree from the instances, keyed by the parent page id. The top-level nodes are
+        the children of the page ``root_id`` (or the root pages if ``None``).
+        Page data needed for serialization is prefetched for all instances at once.
         """
         context = kwargs.get("context", {})
         if args:
-            instances = list(args[0])
+            instances = prefetch_page_data(args[0])
         else:
             instances = []
         tree = {}
         for instance in instances:
-            try:
-                parent = instance.page.parent
-            except AttributeError:
-                parent = instance.page.parent_page  # TODO: Remove when django CMS 4.1 is no longer supported
-            tree.setdefault(parent, []).append(instance)
+            tree.setdefault(get_parent_id(instance.page), []).append(instance)
 
         # Prepare the child serializer with the proper context.
         kwargs["child"] = cls(context=context)
         return PageTreeSerializer(tree, *args[1:], **kwargs)
 
     def to_representation(self, page_content: PageContent) -> dict:
-        return self.get_base_representation(page_content)
+        data = self.get_base_representation(page_content)
+        if hasattr(page_content, "children_count") and self.include_field("children_count"):
+            # Annotated by the view: counts children beyond a depth limit, too
+            data["children_count"] = page_content.children_count
+        return data
 
 
 class PageContentSerializer(BasePageSerializer, BasePageContentMixin):
     """
     Serialize the page content with the placeholders in the order they are declared in the template.
     """
+
     placeholders = PlaceholderSerializer(many=True, required=False)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.request = self.context.get("request")
 
-    def to_representation(self, page_content: PageContent) -> dict:
-        declared_placeholders = get_declared_placeholders_for_obj(page_content)
-        placeholder_map = {
-            placeholder.slot: placeholder
-            for placeholder in page_content.placeholders.all()
-        }
-        placeholders = [
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        """
+        Prefetch page data, placeholders and the plugins of the embedded placeholders for all
+        instances at once: a constant number of queries instead of these queries for every page.
+        """
+        if args:
+            page_contents = prefetch_page_data(args[0])
+            request = kwargs.get("context", {}).get("request")
+            if get_api_context(request).include_field("placeholders"):
+                prefetch_related_objects(page_contents, "placeholders")
+                prefetch_templates(page_contents)
+                placeholders_by_language = {}
+                for page_content in page_contents:
+                    placeholders_by_language.setdefault(page_content.language, []).extend(
+                        cls.get_placeholders(page_content)
+                    )
+                for language, placeholders in placeholders_by_language.items():
+                    cls.prefetch_placeholder_content(request, placeholders, language)
+            args = (page_contents, *args[1:])
+        return super().many_init(*args, **kwargs)
+
+    @staticmethod
+    def get_placeholders(page_content: PageContent) -> list:
+        """The placeholders of the page content in the order they are declared in its template."""
+        placeholder_map = {}
+        for placeholder in page_content.placeholders.all():
+            # Spare the queries for the source and the page of every placeholder
+            placeholder.source = page_content
+            placeholder.page = page_content.page
+            placeholder_map[placeholder.slot] = placeholder
+        return [
             placeholder_map[declared.slot]
-            for declared in declared_placeholders
+            for declared in get_declared_placeholders_for_obj(page_content)
             if declared.slot in placeholder_map
         ]
 
+    @staticmethod
+    def prefetch_placeholder_content(request, placeholders: list, language: str) -> None:
+        """Loads the plugins of the placeholders whose content is embedded in the response."""
+        if not request:
+            return
+        api_context = get_api_context(request)
+        if not api_context.include_field("content", prefix="placeholders."):
+            return
+        from djangocms_rest.plugin_rendering import RESTRenderer
+
+        embedded_slots = api_context.embedded_placeholders
+        RESTRenderer(request).prefetch_plugins(
+            [
+                placeholder
+                for placeholder in placeholders
+                if embedded_slots is None or placeholder.slot in embedded_slots
+            ],
+            language,
+            use_cache=not api_context.preview,
+        )
+
+    def to_representation(self, page_content: PageContent) -> dict:
         data = self.get_base_representation(page_content)
+        if not self.include_field("placeholders"):
+            return data
+
+        placeholders = self.get_placeholders(page_content)
+        self.prefetch_placeholder_content(self.request, placeholders, page_content.language)
         data["placeholders"] = PlaceholderSerializer(
             placeholders,
             language=page_content.language,
             many=True,
+            field_prefix="placeholders.",
+            embedded_slots=get_api_context(self.request).embedded_placeholders,
             context={"request": self.request},
         ).data
         return data
@@ -167,5 +295,12 @@ class PageListSerializer(BasePageSerializer, BasePageContentMixin):
         super().__init__(*args, **kwargs)
         self.request = self.context.get("request")
 
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        """Prefetch page data needed for serialization for all instances at once."""
+        if args:
+            args = (prefetch_page_data(args[0]), *args[1:])
+        return super().many_init(*args, **kwargs)
+
     def to_representation(self, page_content: PageContent) -> dict:
         return self.get_base_representation(page_content)
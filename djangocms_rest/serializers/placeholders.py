@@ -1,12 +1,12 @@
 from urllib.parse import urlencode
 
 from django.template import Context
-from django.urls import reverse
 
 from rest_framework import serializers
 
 from djangocms_rest.serializers.utils.render import render_html
-from djangocms_rest.utils import get_absolute_frontend_url
+from djangocms_rest.url_builder import url_builder
+from djangocms_rest.utils import get_absolute_frontend_url, get_api_context
 
 try:
     from drf_spectacular.utils import extend_schema_field
@@ -46,26 +46,46 @@ class PlaceholderSerializer(serializers.Serializer):
         self.request = kwargs.pop("request", None)
         self.language = kwargs.pop("language", None)
         self.render_plugins = kwargs.pop("render_plugins", True)
+        # Slots of the placeholders to serialize the content of (None for all)
+        self.embedded_slots = kwargs.pop("embedded_slots", None)
+        # Dotted path of the placeholders in the response for ``?fields=`` and ``?omit=``
+        self.field_prefix = kwargs.pop("field_prefix", "")
+        # Renderer shared by all placeholders (e.g. to defer cache writes), a new one if None
+        self.renderer = kwargs.pop("renderer", None)
         super().__init__(*args, **kwargs)
         if self.request is None:
             self.request = self.context.get("request")
 
+    def include_field(self, name: str) -> bool:
+        return get_api_context(self.request).include_field(name, prefix=self.field_prefix)
+
+    def embeds(self, instance) -> bool:
+        return self.embedded_slots is None or instance.slot in self.embedded_slots
+
+    @property
+    def _readable_fields(self):
+        for field in super()._readable_fields:
+            if self.include_field(field.field_name):
+                yield field
+
     def to_representation(self, instance):
-        instance.label = instance.get_label()
+        if self.include_field("label"):
+            instance.label = instance.get_label()
         instance.language = self.language
-        instance.details = self.get_details(instance)
+        if self.include_field("details"):
+            instance.details = self.get_details(instance)
         if instance and self.request and self.language:
-            if self.render_plugins:
+            if self.render_plugins and self.include_field("content") and self.embeds(instance):
                 from djangocms_rest.plugin_rendering import RESTRenderer
 
-                renderer = RESTRenderer(self.request)
+                renderer = self.renderer or RESTRenderer(self.request)
                 instance.content = renderer.serialize_placeholder(
                     instance,
                     context=Context({"request": self.request}),
                     language=self.language,
-                    use_cache=not getattr(self.request, "_preview_mode", False),
+                    use_cache=not get_api_context(self.request).preview,
                 )
-            if self.request.GET.get("html", False):
+            if self.request.GET.get("html", False) and self.include_field("html"):
                 html = render_html(self.request, instance, self.language)
                 for key, value in html.items():
                     if not hasattr(instance, key):
@@ -76,14 +96,14 @@ class PlaceholderSerializer(serializers.Serializer):
     def get_details(self, instance):
         url = get_absolute_frontend_url(
             self.request,
-            reverse(
+            url_builder.build(
                 "placeholder-detail",
-                args=[
+                args=(
                     self.language,
                     instance.content_type_id,
                     instance.object_id,
                     instance.slot,
-                ],
+                ),
             ),
         )
         get_params = {key: self.request.GET[key] for key in ("html", "preview") if key in self.request.GET}
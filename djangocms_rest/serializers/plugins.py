@@ -3,13 +3,13 @@ from typing import Any
 from django.apps import apps
 from django.db.models import Field, Model
 from django.http import HttpRequest
-from django.urls import NoReverseMatch, reverse
 
 from cms.models import CMSPlugin
 from cms.plugin_pool import plugin_pool
 
 from rest_framework import serializers
 
+from djangocms_rest.url_builder import url_builder
 from djangocms_rest.utils import get_absolute_frontend_url
 
 
@@ -44,12 +44,9 @@ def serialize_fk(
 
     # Second choice: Use DRF naming conventions to build the default API URL for the related model
     model_name = related_model._meta.model_name
-    try:
-        return get_absolute_frontend_url(
-            request, reverse(f"{model_name}-detail", args=(pk,))
-        )
-    except NoReverseMatch:
-        pass
+    url = url_builder.build(f"{model_name}-detail", args=(pk,))
+    if url is not None:
+        return get_absolute_frontend_url(request, url)
 
     # Fallback:
     app_name = related_model._meta.app_label
@@ -137,11 +134,7 @@ class GenericPluginSerializer(serializers.ModelSerializer):
                         request,
                         field.related_model,
                         getattr(instance, f"{field.name}_id"),
-                        obj=(
-                            getattr(instance, field.name)
-                            if field.is_cached(instance)
-                            else None
-                        ),
+                        obj=(getattr(instance, field.name) if field.is_cached(instance) else None),
                     )
             elif isinstance(field, JSON_FIELDS) and ret.get(field.name):
                 # If the field is a subclass of JSONField, serialize its value directly
@@ -154,9 +147,7 @@ class PluginDefinitionSerializer(serializers.Serializer):
     Serializer for plugin type definitions.
     """
 
-    plugin_type = serializers.CharField(
-        help_text="Unique identifier for the plugin type"
-    )
+    plugin_type = serializers.CharField(help_text="Unique identifier for the plugin type")
     title = serializers.CharField(help_text="Human readable name of the plugin")
     type = serializers.CharField(help_text="Schema type")
     properties = serializers.DictField(help_text="Property definitions")
@@ -191,7 +182,7 @@ class PluginDefinitionSerializer(serializers.Serializer):
         definitions = {}
 
         for plugin in plugin_pool.plugins.values():
-            #Fall back to GenericPluginSerializer to match the runtime auto-serializer.
+            # Fall back to GenericPluginSerializer to match the runtime auto-serializer.
             serializer_cls = getattr(plugin, "serializer_class", None)
 
             if not serializer_cls:
@@ -214,11 +205,7 @@ class PluginDefinitionSerializer(serializers.Serializer):
                     if field_name in base_exclude:
                         continue
 
-                    properties[
-                        field_name
-                    ] = PluginDefinitionSerializer.map_field_to_schema(
-                        field, field_name
-                    )
+                    properties[field_name] = PluginDefinitionSerializer.map_field_to_schema(field, field_name)
 
                 definitions[plugin.__name__] = {
                     "name": getattr(plugin, "name", plugin.__name__),
@@ -277,9 +264,7 @@ class PluginDefinitionSerializer(serializers.Serializer):
             # Extract nested properties
             properties = {}
             for nested_field_name, nested_field in field.fields.items():
-                properties[
-                    nested_field_name
-                ] = PluginDefinitionSerializer.map_field_to_schema(
+                properties[nested_field_name] = PluginDefinitionSerializer.map_field_to_schema(
                     nested_field, nested_field_name
                 )
             if properties:
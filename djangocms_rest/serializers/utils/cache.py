@@ -1,11 +1,17 @@
+import hashlib
 import time
 from datetime import datetime
 
-from cms.cache.placeholder import (
-    _get_placeholder_cache_key,
-    _get_placeholder_cache_version_key,
-)
+from django.conf import settings
+from django.db.models import Count, Max, OuterRef, Subquery
+
+from cms.cache import CMS_PAGE_CACHE_VERSION_KEY, _get_cache_version
+from cms.cache.placeholder import _get_placeholder_cache_version as _get_cms_placeholder_cache_version
+from cms.cache.placeholder import _get_placeholder_cache_version_key
 from cms.utils.conf import get_cms_setting
+from cms.utils.helpers import get_header_name, get_timezone_name
+
+from djangocms_rest.utils import get_api_context
 
 
 def _get_placeholder_cache_version(placeholder, lang, site_id):
@@ -43,23 +49,82 @@ def _set_placeholder_cache_version(placeholder, lang, site_id, version, vary_on_
     cache.set(key, (version, vary_on_list), duration)
 
 
+def _get_placeholder_rest_cache_key(placeholder, lang, site_id, request, version, vary_on_list):
+    """
+    Returns the cache key of the placeholder's serialized content for a known cache version and
+    vary-on header-names list. Builds the same key as ``cms.cache.placeholder._get_placeholder_cache_key``
+    (plus a ``:rest`` suffix), which reads and writes the version itself. Used for reads and writes
+    alike, so that both always agree.
+    """
+    prefix = get_cms_setting("CACHE_PREFIX")
+    cache_key = (
+        f"{prefix}|render_placeholder|id:{placeholder.pk}|lang:{lang}|site:{site_id}"
+        f"|tz:{get_timezone_name()}|v:{version}"
+    )
+    sub_key_list = [f"{key}:{request.META.get(get_header_name(key)) or '_'}" for key in vary_on_list]
+    if sub_key_list:
+        cache_key += "|" + "|".join(sub_key_list)
+    if len(cache_key) > 200:
+        cache_key = f"{prefix}|{hashlib.sha1(cache_key.encode('utf-8')).hexdigest()}"
+    return cache_key + ":rest"
+
+
+def set_placeholder_rest_cache_many(entries, lang, site_id, request):
+    """
+    Sets the placeholder caches with the serialized content of many placeholders, given as
+    ``(placeholder, content)`` pairs. Like django CMS, the cache versions are updated with the
+    placeholders' current vary-on header-names (placeholders without a version get a new one).
+    The versions are read with one ``get_many``; entries and versions are written with one
+    ``set_many`` per cache duration.
+    """
+    from django.core.cache import cache
+
+    entries = list(entries)
+    version_keys = [_get_placeholder_cache_version_key(placeholder, lang, site_id) for placeholder, _ in entries]
+    versions = cache.get_many(version_keys)
+    now = datetime.now()
+    content_duration = get_cms_setting("CACHE_DURATIONS")["content"]
+    values = {}
+    for (placeholder, content), version_key in zip(entries, version_keys):
+        version = versions[version_key][0] if versions.get(version_key) else int(time.time() * 1000000)
+        vary_on_list = placeholder.get_vary_cache_on(request)
+        key = _get_placeholder_rest_cache_key(placeholder, lang, site_id, request, version, vary_on_list)
+        duration = min(content_duration, placeholder.get_cache_expiration(request, now))
+        items = values.setdefault(duration, {})
+        items[key] = {"content": content}
+        # "touch" the cache-version, so that it stays as fresh as the content.
+        items[version_key] = (version, vary_on_list)
+    for duration, items in values.items():
+        cache.set_many(items, duration)
+
+
 def set_placeholder_rest_cache(placeholder, lang, site_id, content, request):
     """
     Sets the (correct) placeholder cache with the rendered placeholder.
     """
-    from django.core.cache import cache
+    set_placeholder_rest_cache_many([(placeholder, content)], lang, site_id, request)
 
-    key = _get_placeholder_cache_key(placeholder, lang, site_id, request) + ":rest"
 
-    duration = min(
-        get_cms_setting("CACHE_DURATIONS")["content"],
-        placeholder.get_cache_expiration(request, datetime.now()),
-    )
-    cache.set(key, {"content": content}, duration)
+def get_placeholder_rest_cache_many(placeholders, lang, site_id, request):
+    """
+    Returns the cached serialized content of the placeholders (respecting their VARY headers)
+    as a dict keyed by placeholder pk. Misses are left out. The cache versions and the entries
+    are read with one ``get_many`` each (the second is skipped if no placeholder has a version).
+    """
+    from django.core.cache import cache
 
-    # "touch" the cache-version, so that it stays as fresh as this content.
-    version, vary_on_list = _get_placeholder_cache_version(placeholder, lang, site_id)
-    _set_placeholder_cache_version(placeholder, lang, site_id, version, vary_on_list, duration=duration)
+    version_keys = {
+        _get_placeholder_cache_version_key(placeholder, lang, site_id): placeholder for placeholder in placeholders
+    }
+    keys = {}
+    for version_key, cached in cache.get_many(version_keys).items():
+        if cached:
+            # Without a version there cannot be a current entry
+            placeholder = version_keys[version_key]
+            keys[_get_placeholder_rest_cache_key(placeholder, lang, site_id, request, *cached)] = placeholder.pk
+    if not keys:
+        return {}
+    return {keys[key]: value for key, value in cache.get_many(keys).items()}
 
 
 def get_placeholder_rest_cache(placeholder, lang, site_id, request):
@@ -67,7 +132,165 @@ def get_placeholder_rest_cache(placeholder, lang, site_id, request):
     Returns the placeholder from cache respecting the placeholder's
     VARY headers.
     """
+    return get_placeholder_rest_cache_many([placeholder], lang, site_id, request).get(placeholder.pk)
+
+
+def get_placeholder_response_cache_key(placeholder, lang, site_id, request, media_type):
+    """
+    Returns the cache key of the encoded placeholder response in a media type for the
+    placeholder's current cache version (and VARY headers), or ``None`` if the placeholder has no
+    cache version yet. The key also depends on the URL prefix and the query parameters.
+    """
+    from django.core.cache import cache
+
+    cached = cache.get(_get_placeholder_cache_version_key(placeholder, lang, site_id))
+    if not cached:
+        return None
+    query = "&".join(sorted(request.GET.urlencode().split("&")))
+    fingerprint = f"{request.scheme}://{request.get_host()}|{media_type}|{query}"
+    digest = hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()
+    return f"{_get_placeholder_rest_cache_key(placeholder, lang, site_id, request, *cached)}:response:{digest}"
+
+
+def get_placeholder_response_cache(key):
+    """Returns the cached ``(content type, content)`` of an encoded placeholder response."""
     from django.core.cache import cache
 
-    key = f"{_get_placeholder_cache_key(placeholder, lang, site_id, request, soft=True)}:rest"
     return cache.get(key)
+
+
+def set_placeholder_response_cache(key, placeholder, request, response):
+    """
+    Post-render callback storing the encoded placeholder response, so that later requests
+    return the bytes without serializing or encoding anything. Expires like the placeholder's
+    serialized content.
+    """
+    from django.core.cache import cache
+
+    if response.status_code == 200:
+        duration = min(
+            get_cms_setting("CACHE_DURATIONS")["content"], placeholder.get_cache_expiration(request, datetime.now())
+        )
+        cache.set(key, (response["Content-Type"], response.content), duration)
+
+
+def get_placeholder_cache_versions(placeholders, lang, site_id):
+    """
+    Returns the current django CMS cache versions of the placeholders (in microseconds since
+    the epoch). A version moves on whenever the placeholder's cache is invalidated, i.e., its
+    content changed. All versions are read with a single cache round-trip.
+    """
+    from django.core.cache import cache
+
+    keys = {
+        _get_placeholder_cache_version_key(placeholder, lang, site_id): placeholder for placeholder in placeholders
+    }
+    cached = cache.get_many(keys)
+    return [
+        cached[key][0] if cached.get(key) else _get_cms_placeholder_cache_version(placeholder, lang, site_id)[0]
+        for key, placeholder in keys.items()
+    ]
+
+
+def page_response_cache_enabled() -> bool:
+    return getattr(settings, "REST_PAGE_CACHE", False)
+
+
+def _get_page_response_cache_key(request, lang, site_id, path):
+    # The response contains absolute URLs, so the scheme and host are part of the key
+    query = "&".join(sorted(request.GET.urlencode().split("&")))
+    fingerprint = f"{get_api_context(request).url_prefix}|{path}?{query}"
+    digest = hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()
+    return f"{get_cms_setting('CACHE_PREFIX')}rest:page:{site_id}:{lang}:{digest}"
+
+
+def _get_page_content_state(pk):
+    """
+    Returns what the cached page response of a page content depends on besides its placeholders,
+    read with one query: the change dates of the page content and its page, and the number and
+    latest change date of the page's contents (i.e., its languages). ``None`` if the page content is
+    gone.
+    """
+    from cms.models import PageContent
+
+    translations = PageContent.admin_manager.filter(page=OuterRef("page")).order_by().values("page")
+    return (
+        PageContent.objects.filter(pk=pk)
+        .annotate(
+            translation_count=Subquery(translations.annotate(count=Count("pk")).values("count")),
+            translations_changed=Subquery(translations.annotate(changed=Max("changed_date")).values("changed")),
+        )
+        .values_list("changed_date", "page__changed_date", "translation_count", "translations_changed")
+        .first()
+    )
+
+
+def set_page_response_cache(
+    request, lang, site_id, path, page_content, placeholders, data, validators, last_modified, surrogate_keys=()
+):
+    """
+    Stores the serialized page response together with what it was derived from: the django CMS
+    page cache version (bumped by django CMS whenever a page changes), the view permission version
+    (bumped whenever pages or permissions change, see :mod:`djangocms_rest.permissions`), the
+    cache versions of the page's placeholders and the state of the page content and its page.
+    ``validators`` and ``last_modified`` are kept to answer conditional requests from the cache,
+    ``surrogate_keys`` to tag the response, too.
+    """
+    from django.core.cache import cache
+
+    from djangocms_rest.permissions import PERMISSION_VERSION_KEY
+
+    placeholders = list(placeholders)
+    if not all(placeholder.cache_placeholder for placeholder in placeholders):
+        return
+    page_cache = get_cms_setting("PAGE_CACHE")
+    keys = [_get_placeholder_cache_version_key(placeholder, lang, site_id) for placeholder in placeholders]
+    entry = {
+        "data": data,
+        "validators": validators,
+        "last_modified": last_modified,
+        "surrogate_keys": sorted(surrogate_keys),
+        "page_content": page_content.pk,
+        "page_cache_version": _get_cache_version() if page_cache else None,
+        "permission_version": cache.get(PERMISSION_VERSION_KEY),
+        "page_content_state": _get_page_content_state(page_content.pk),
+        "placeholder_versions": dict(zip(keys, get_placeholder_cache_versions(placeholders, lang, site_id))),
+    }
+    cache.set(
+        _get_page_response_cache_key(request, lang, site_id, path),
+        entry,
+        get_cms_setting("CACHE_DURATIONS")["content"],
+    )
+
+
+def get_page_response_cache(request, lang, site_id, path):
+    """
+    Returns the cached page response entry if it is still current: The placeholder versions,
+    the view permission version (and the django CMS page cache version) are checked with a single
+    cache round-trip, the state of the page content and its page with a single query.
+    """
+    from django.core.cache import cache
+
+    from djangocms_rest.permissions import PERMISSION_VERSION_KEY
+
+    entry = cache.get(_get_page_response_cache_key(request, lang, site_id, path))
+    if entry is None:
+        return None
+
+    keys = [*entry["placeholder_versions"], PERMISSION_VERSION_KEY]
+    if entry["page_cache_version"] is not None:
+        keys.append(CMS_PAGE_CACHE_VERSION_KEY)
+    current = cache.get_many(keys)
+    for key, version in entry["placeholder_versions"].items():
+        if not current.get(key) or current[key][0] != version:
+            return None
+
+    if current.get(PERMISSION_VERSION_KEY) != entry["permission_version"]:
+        return None
+    page_cache_version = entry["page_cache_version"]
+    if page_cache_version is not None and current.get(CMS_PAGE_CACHE_VERSION_KEY) != page_cache_version:
+        return None
+    state = entry["page_content_state"]
+    if state is None or _get_page_content_state(entry["page_content"]) != state:
+        return None
+    return entry
@@ -0,0 +1,88 @@
+from collections.abc import Iterable
+from operator import attrgetter
+
+from django.db.models import prefetch_related_objects
+
+from cms.constants import TEMPLATE_INHERITANCE_MAGIC
+from cms.models import PageContent, pagemodel
+from cms.utils.conf import get_cms_setting
+
+from djangocms_rest.utils import get_page_tree_lookup
+
+# Can be simplified once django CMS 4.1 (which uses a plain dict) is no longer supported
+AdminCacheDict = getattr(pagemodel, "AdminCacheDict", dict)
+
+
+def prefetch_page_data(page_contents: Iterable[PageContent]) -> list[PageContent]:
+    """
+    Loads everything ``BasePageContentMixin.get_base_representation`` needs for a collection of
+    page contents in a constant number of queries and attaches it to the page objects:
+
+    * the pages themselves (if not already loaded by ``select_related``),
+    * the page urls (used by ``Page.get_path`` and ``Page.get_api_endpoint``),
+    * the admin page contents (used by ``Page.get_languages``).
+
+    The parent of a page is not loaded: tree building only requires ``page.parent_id``.
+    """
+    page_contents = list(page_contents)
+    if not page_contents:
+        return page_contents
+
+    prefetch_related_objects(page_contents, "page")
+    pages = [page_content.page for page_content in page_contents]
+    prefetch_related_objects(pages, "urls")
+
+    admin_contents = {}
+    for content in PageContent.admin_manager.latest_content().filter(page__in={page.pk for page in pages}):
+        admin_contents.setdefault(content.page_id, []).append(content)
+
+    for page in pages:
+        page.urls_cache = {url.language: url for url in page.urls.all()}
+        if getattr(page, "admin_content_cache", None) is None:
+            page.admin_content_cache = AdminCacheDict()
+            for content in admin_contents.get(page.pk, []):
+                page.admin_content_cache.setdefault(content.language, content)
+    return page_contents
+
+
+def prefetch_templates(page_contents: Iterable[PageContent]) -> None:
+    """
+    Resolves the inherited templates of all page contents in a single query, mirroring
+    ``PageContent.get_template``: a content which inherits its template uses the template
+    of the closest ancestor page content in the same language which does not.
+    """
+    if not get_cms_setting("TEMPLATES"):
+        return
+    inheriting = [
+        page_content
+        for page_content in page_contents
+        if page_content.template == TEMPLATE_INHERITANCE_MAGIC and not hasattr(page_content, "_template_cache")
+    ]
+    if not inheriting:
+        return
+
+    lookup = get_page_tree_lookup()
+    get_tree_path = attrgetter(lookup.replace("__", "."))
+    ancestor_paths = {}
+    for page_content in inheriting:
+        page = page_content.page
+        path = get_tree_path(page)
+        steplen = getattr(page, "steplen", None) or page.node.steplen
+        # Closest ancestor first
+        ancestor_paths[page_content] = [path[:end] for end in range(len(path) - steplen, 0, -steplen)]
+
+    templates = {
+        (language, path): template
+        for language, path, template in PageContent.objects.filter(
+            language__in={page_content.language for page_content in inheriting},
+            **{f"page__{lookup}__in": {path for paths in ancestor_paths.values() for path in paths}},
+        )
+        .exclude(template=TEMPLATE_INHERITANCE_MAGIC)
+        .values_list("language", f"page__{lookup}", "template")
+    }
+    default = get_cms_setting("TEMPLATES")[0][0]
+    for page_content, paths in ancestor_paths.items():
+        page_content._template_cache = next(
+            (templates[key] for key in ((page_content.language, path) for path in paths) if key in templates),
+            default,
+        )
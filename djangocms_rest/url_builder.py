@@ -0,0 +1,115 @@
+"""
+URL builder for the API's own routes.
+
+``reverse()`` searches the URL resolver, validates every argument and quotes the result on
+each call, which adds up when serializing thousands of menu nodes, pages or plugin references.
+:class:`URLBuilder` reverses a route once per URL configuration, script prefix, language and
+argument signature with placeholder arguments, turns the result into a format string and
+afterwards only interpolates (and quotes) the actual arguments. Routes that do not exist are
+remembered as well, so repeated misses do not search the resolver again.
+"""
+
+from typing import Any
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.urls import NoReverseMatch, get_script_prefix, get_urlconf, reverse
+from django.utils.http import RFC3986_SUBDELIMS
+from django.utils.translation import get_language, override
+
+SAFE_CHARS = RFC3986_SUBDELIMS + "/~:@"
+
+
+class URLBuilder:
+    def __init__(self):
+        self.templates: dict[tuple, str | bool | None] = {}
+
+    def compile(self, name: str, args: tuple, kwargs: dict) -> str | None:
+        """
+        Reverses the route with placeholder arguments and returns it as format string, or ``None`` if
+        the route does not exist or does not accept the placeholders.
+        """
+        sentinels = {}
+
+        def sentinel(key: Any, value: Any) -> str | int:
+            # Integer converters only accept digits, all others accept a slug
+            placeholder = 918273645000 + len(sentinels) if isinstance(value, int) else f"rest0arg0{len(sentinels)}"
+            sentinels[str(placeholder)] = key
+            return placeholder
+
+        try:
+            url = reverse(
+                name,
+                args=[sentinel(i, value) for i, value in enumerate(args)],
+                kwargs={key: sentinel(key, value) for key, value in kwargs.items()},
+            )
+        except NoReverseMatch:
+            return None
+        url = url.replace("{", "{{").replace("}", "}}")
+        for placeholder, key in sentinels.items():
+            if url.count(placeholder) != 1:
+                return None
+            url = url.replace(placeholder, f"{{{key}}}" if isinstance(key, str) else f"{{args[{key}]}}")
+        return url
+
+    def build(
+        self, name: str, args: tuple = (), kwargs: dict | None = None, language: str | None = None
+    ) -> str | None:
+        """
+        Returns the URL of the named route with the given arguments (like ``reverse()``) or ``None``
+        if there is no such route. ``language`` activates a language for translated URL patterns.
+        """
+        args, kwargs = tuple(args), kwargs or {}
+        language = language or get_language()
+        key = (
+            get_urlconf() or settings.ROOT_URLCONF,
+            get_script_prefix(),
+            language,
+            name,
+            tuple(isinstance(value, int) for value in args),
+            tuple((key, isinstance(value, int)) for key, value in kwargs.items()),
+        )
+        try:
+            template = self.templates[key]
+        except KeyError:
+            with override(language):
+                template = self.compile(name, args, kwargs)
+            if template is None:
+                # Either there is no such route (remembered as None) or it cannot be
+                # compiled to a template (remembered as False: use reverse() each time)
+                url = self.reverse(name, args, kwargs, language)
+                self.templates[key] = None if url is None else False
+                return url
+            self.templates[key] = template
+
+        if template is None:
+            return None
+        if template is False:
+            return self.reverse(name, args, kwargs, language)
+        return template.format(
+            args=[quote(str(value), safe=SAFE_CHARS) for value in args],
+            **{key: quote(str(value), safe=SAFE_CHARS) for key, value in kwargs.items()},
+        )
+
+    @staticmethod
+    def reverse(name: str, args: tuple, kwargs: dict, language: str) -> str | None:
+        with override(language):
+            try:
+                return reverse(name, args=args or None, kwargs=kwargs or None)
+            except NoReverseMatch:
+                return None
+
+    def clear(self) -> None:
+        self.templates.clear()
+
+
+url_builder = URLBuilder()
+
+
+def clear_url_builder(*, setting: str, **kwargs) -> None:
+    if setting in ("ROOT_URLCONF", "LANGUAGES", "LANGUAGE_CODE"):
+        url_builder.clear()
+
+
+setting_changed.connect(clear_url_builder)
@@ -32,6 +32,11 @@ urlpatterns = [
         create_view_with_url_name(views.PageDetailView, "page-detail"),
         name="page-detail",
     ),
+    path(
+        "<slug:language>/pages-batch/",
+        views.PageBatchView.as_view(),
+        name="page-batch",
+    ),
     path(
         "<slug:language>/page_search/",
         views.PageSearchView.as_view(),
@@ -42,6 +47,16 @@ urlpatterns = [
         views.PlaceholderDetailView.as_view(),
         name="placeholder-detail",
     ),
+    path(
+        "<slug:language>/placeholders-batch/",
+        views.PlaceholderBatchView.as_view(),
+        name="placeholder-batch",
+    ),
+    path(
+        "<slug:language>/changes/",
+        views.ChangeFeedView.as_view(),
+        name="change-feed",
+    ),
     path("plugins/", views.PluginDefinitionView.as_view(), name="plugin-list"),
     # Menu endpoints
     path("<slug:language>/menu/", create_view_with_url_name(views.MenuView, "menu"), name="menu"),
@@ -1,9 +1,13 @@
 from django.contrib.sites.models import Site
-from django.core.exceptions import FieldError
-from django.db.models import QuerySet
-from django.http import Http404
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.db.models import Case, Count, IntegerField, Max, OuterRef, QuerySet, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.http import HttpRequest
+from django.utils.functional import cached_property
 
-from cms.models import Page, PageUrl
+from cms.models import Page, PageContent
+from cms.utils.i18n import get_fallback_languages, get_language_tuple, get_languages
 
 from rest_framework.request import Request
 
@@ -20,18 +24,197 @@ def get_site_filtered_queryset(site: Site) -> QuerySet:
         return Page.objects.filter(node__site=site)
 
 
-def get_object(site: Site, path: str) -> Page:
-    page_urls = (
-        PageUrl.objects.get_for_site(site).filter(path=path).select_related("page")
+def get_page_tree_lookup(lookup: str = "path") -> str:
+    """
+    Returns the lookup for a tree field (``path``, ``depth``) of a page.
+    Can be removed once django CMS 4.1 (which keeps the tree on ``page.node``) is no longer supported
+    """
+    try:
+        Page._meta.get_field(lookup)
+    except FieldDoesNotExist:
+        return f"node__{lookup}"
+    return lookup
+
+
+def get_page_content_queryset(pages: QuerySet, language: str, site: Site, preview: bool = False) -> QuerySet:
+    """
+    Returns a queryset with one page content per page: The content in the requested language or,
+    if missing, in its first available fallback language. This mirrors ``Page.get_content_obj``
+    (or ``Page.get_admin_content`` for preview requests) with ``fallback=True``, but resolves the
+    language in the database so the result can be counted and sliced without loading every page.
+    """
+    languages = list(dict.fromkeys([language, *get_fallback_languages(language, site_id=site.pk)]))
+    contents = PageContent.admin_manager.latest_content() if preview else PageContent.objects.all()
+    priority = Case(
+        *(When(language=lang, then=Value(i)) for i, lang in enumerate(languages)),
+        output_field=IntegerField(),
+    )
+    best_content = (
+        contents.filter(page=OuterRef("page"), language__in=languages)
+        .annotate(language_priority=priority)
+        .order_by("language_priority", "pk")
+        .values("pk")[:1]
+    )
+    return (
+        contents.filter(page__in=pages, language__in=languages)
+        .filter(pk=Subquery(best_content))
+        .select_related("page")
+        .order_by(f"page__{get_page_tree_lookup()}", "pk")
+    )
+
+
+def get_page_content_validators(queryset: QuerySet) -> tuple:
+    """
+    Returns a cheap fingerprint of a page content queryset to be used as validator for
+    conditional requests: It changes whenever a page content or page is changed, added or removed,
+    and whenever a translation of one of the pages is changed, added or removed (the languages of
+    a page are part of its representation).
+    """
+    return tuple(
+        queryset.order_by()
+        .aggregate(
+            count=Count("pk", distinct=True),
+            changed=Max("changed_date"),
+            page_changed=Max("page__changed_date"),
+            # The join is not restricted by the content manager: it covers all translations
+            translation_count=Count("page__pagecontent_set", distinct=True),
+            translations_changed=Max("page__pagecontent_set__changed_date"),
+        )
+        .values()
     )
-    page_urls = list(page_urls)
+
+
+def annotate_children_count(page_contents: QuerySet, children: QuerySet) -> QuerySet:
+    """
+    Annotates each page content with ``children_count``: the number of page contents in ``children``
+    that belong to a direct child of its page. The children are matched by tree path and depth, so the
+    count is a single correlated subquery and the children do not need to be loaded.
+    """
+    path, depth = get_page_tree_lookup("path"), get_page_tree_lookup("depth")
+    count = (
+        children.filter(
+            **{
+                f"page__{path}__startswith": OuterRef(f"page__{path}"),
+                f"page__{depth}": OuterRef(f"page__{depth}") + 1,
+            }
+        )
+        .order_by()
+        .values(f"page__{depth}")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return page_contents.annotate(children_count=Coalesce(Subquery(count), 0))
+
+
+def get_object(site: Site, path: str) -> Page:
+    """
+    Returns the page with the given path on the site, with its URLs in all languages cached.
+    Paths are resolved through the cached route table (see :mod:`djangocms_rest.routing`).
+    """
+    from djangocms_rest.routing import route_table
+
+    return route_table.resolve(site, path)
+
+
+class APIContext:
+    """
+    Per-request facts that serializers, permissions and the renderer need over and over: the site,
+    its (public) languages, whether preview content was requested, the requested fields and the
+    absolute URL prefix.
+    Each is computed on first access and kept for the rest of the request. Use
+    :func:`get_api_context` to get the context of a request.
+    """
+
+    def __init__(self, request: HttpRequest | None):
+        self.request = request
+
+    @cached_property
+    def site(self) -> Site:
+        site = getattr(self.request, "site", None)
+        return site if site is not None else get_current_site(self.request)
+
+    @cached_property
+    def languages(self) -> frozenset[str]:
+        return frozenset(code for code, _name in get_language_tuple(self.site.pk))
+
+    @cached_property
+    def public_languages(self) -> frozenset[str]:
+        return frozenset(lang["code"] for lang in get_languages(self.site.pk) if lang.get("public", True))
+
+    @cached_property
+    def preview(self) -> bool:
+        query = getattr(self.request, "GET", {})
+        return "preview" in query and query.get("preview", "").lower() not in ("0", "false")
+
+    def _get_field_list(self, param: str) -> frozenset[str] | None:
+        query = getattr(self.request, "GET", None)
+        if query is None or param not in query:
+            return None
+        return frozenset(
+            field.strip() for value in query.getlist(param) for field in value.split(",") if field.strip()
+        )
+
+    @cached_property
+    def fields(self) -> frozenset[str] | None:
+        """Field names requested with ``?fields=`` (``None`` for all fields); nested fields are dotted."""
+        return self._get_field_list("fields")
+
+    @cached_property
+    def omit(self) -> frozenset[str]:
+        """Field names excluded with ``?omit=``; nested fields are dotted."""
+        return self._get_field_list("omit") or frozenset()
+
+    @cached_property
+    def embedded_placeholders(self) -> frozenset[str] | None:
+        """
+        Slots of the placeholders whose content a page response embeds (``?placeholders=content,sidebar``);
+        ``?placeholders=none`` embeds none. ``None`` embeds all placeholders.
+        """
+        slots = self._get_field_list("placeholders")
+        if slots is None:
+            return None
+        return slots - {"none"}
+
+    @cached_property
+    def _selected_fields(self) -> dict[str, frozenset[str]]:
+        return {}
+
+    def include_field(self, name: str, prefix: str = "") -> bool:
+        """
+        Whether a field is part of the response according to ``?fields=`` and ``?omit=``. ``prefix``
+        is the dotted path of a nested object (e.g. ``"placeholders."``). If no field of a nested
+        object is selected explicitly, all of its fields are included.
+        """
+        if prefix + name in self.omit:
+            return False
+        if self.fields is None:
+            return True
+        try:
+            selected = self._selected_fields[prefix]
+        except KeyError:
+            selected = self._selected_fields[prefix] = frozenset(
+                field[len(prefix) :].split(".")[0] for field in self.fields if field.startswith(prefix)
+            )
+        return not selected or name in selected
+
+    @cached_property
+    def url_prefix(self) -> str:
+        protocol = getattr(self.request, "scheme", "http")
+        get_host = getattr(self.request, "get_host", None)
+        domain = get_host() if get_host is not None else self.site.domain
+        return f"{protocol}://{domain}"
+
+
+def get_api_context(request: Request | HttpRequest | None) -> APIContext:
+    """Returns the :class:`APIContext` of a request, creating it on first use."""
+    if request is None:
+        return APIContext(None)
+    request = getattr(request, "_request", request)  # The context lives on the Django request
     try:
-        page = page_urls[0].page
-    except IndexError:
-        raise Http404
-    else:
-        page.urls_cache = {url.language: url for url in page_urls}
-    return page
+        return request._rest_api_context
+    except AttributeError:
+        request._rest_api_context = APIContext(request)
+        return request._rest_api_context
 
 
 def get_absolute_frontend_url(request: Request, path: str) -> str:
@@ -47,10 +230,6 @@ def get_absolute_frontend_url(request: Request, path: str) -> str:
     """
     if path is None:
         return None
-    protocol = getattr(request, "scheme", "http")
-    domain = getattr(
-        request, "get_host", lambda: Site.objects.get_current(request).domain
-    )()
     if not path.startswith("/"):
         path = f"/{path}"
-    return f"{protocol}://{domain}{path}"
+    return f"{get_api_context(request).url_prefix}{path}"
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
+from functools import partial
+from operator import attrgetter
 from typing import Any
-from django.contrib.sites.shortcuts import get_current_site
+
+from django.db.models import Count, Max, Q, QuerySet, prefetch_related_objects
+from django.http import HttpResponse, StreamingHttpResponse
 from django.urls import reverse
 from django.utils.functional import lazy
 
@@ -11,29 +16,68 @@ from cms.utils.page_permissions import user_can_view_page
 from menus.menu_pool import menu_pool
 from menus.templatetags.menu_tags import ShowBreadcrumb, ShowMenu, ShowSubMenu
 
-
-from rest_framework.exceptions import NotFound
-from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from djangocms_rest.permissions import CanViewPage, IsAllowedPublicLanguage
+from djangocms_rest.changes import change_log_enabled, get_changes
+from djangocms_rest.models import SearchEntry
+from djangocms_rest.pagination import PageCursorPagination, PageLimitOffsetPagination
+from djangocms_rest.permissions import (
+    CanViewPage,
+    IsAllowedPublicLanguage,
+    filter_viewable_pages,
+    get_viewable_pages,
+)
+from djangocms_rest.plugin_rendering import RESTRenderer
+from djangocms_rest.purge import get_menu_key, get_page_content_keys, get_placeholder_keys
+from djangocms_rest.renderers import CBORRenderer, MessagePackRenderer
+from djangocms_rest.routing import route_table
+from djangocms_rest.schemas import (
+    extend_change_feed_schema,
+    extend_page_batch_schema,
+    extend_page_detail_schema,
+    extend_page_search_schema,
+    extend_page_tree_schema,
+    extend_placeholder_batch_schema,
+    extend_placeholder_schema,
+    extend_sparse_fieldset_schema,
+    menu_schema_class,
+)
+from djangocms_rest.search import search_index_enabled, search_page_contents
+from djangocms_rest.serializers.changes import ChangeFeedSerializer
 from djangocms_rest.serializers.languages import LanguageSerializer
 from djangocms_rest.serializers.menus import NavigationNodeSerializer
 from djangocms_rest.serializers.pages import (
     PageContentSerializer,
     PageListSerializer,
     PageMetaSerializer,
+    stream_page_tree,
 )
 from djangocms_rest.serializers.placeholders import PlaceholderSerializer
 from djangocms_rest.serializers.plugins import PluginDefinitionSerializer
+from djangocms_rest.serializers.utils.cache import (
+    get_page_response_cache,
+    get_placeholder_cache_versions,
+    get_placeholder_response_cache,
+    get_placeholder_response_cache_key,
+    page_response_cache_enabled,
+    set_page_response_cache,
+    set_placeholder_response_cache,
+)
+from djangocms_rest.url_builder import url_builder
 from djangocms_rest.utils import (
+    annotate_children_count,
+    get_absolute_frontend_url,
     get_object,
+    get_page_content_queryset,
+    get_page_content_validators,
+    get_page_tree_lookup,
     get_site_filtered_queryset,
 )
 from djangocms_rest.views_base import BaseAPIView, BaseListAPIView, preview_schema
-from djangocms_rest.schemas import extend_placeholder_schema, extend_page_search_schema, menu_schema_class
 
 # Generate the plugin definitions once at module load time
 # This avoids the need to import the plugin definitions in every view
@@ -60,9 +104,12 @@ class LanguageListView(BaseAPIView):
 
     def get(self, request: Request | None) -> Response:
         """List of languages available for the site."""
-        languages = get_languages().get(get_current_site(request).id, None)
+        languages = get_languages().get(self.site.pk, None)
         if languages is None:
             raise NotFound()
+        not_modified = self.get_not_modified_response(languages)
+        if not_modified is not None:
+            return not_modified
 
         serializer = self.serializer_class(languages, many=True, read_only=True)
         return Response(serializer.data)
@@ -71,10 +118,27 @@ class LanguageListView(BaseAPIView):
 class PageListView(BaseListAPIView):
     permission_classes = [IsAllowedPublicLanguage]
     serializer_class = PageListSerializer
-    pagination_class = LimitOffsetPagination
+    pagination_class = PageLimitOffsetPagination
+    cursor_pagination_class = PageCursorPagination
+
+    @property
+    def paginator(self):
+        """Switch to keyset pagination if the request carries a ``cursor`` query parameter
+        (an empty ``?cursor=`` requests the first page)."""
+        if not hasattr(self, "_paginator"):
+            query_params = getattr(self.request, "query_params", {})
+            cursor_pagination_class = self.cursor_pagination_class
+            if cursor_pagination_class and cursor_pagination_class.cursor_query_param in query_params:
+                self._paginator = cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     def get_queryset(self):
-        """Get queryset of pages for the given language."""
+        """Get queryset of page contents for the given language.
+
+        Visibility and language fallbacks are resolved in the database so that the paginator
+        only counts and loads the requested slice of pages."""
         language = self.kwargs["language"]
         qs = get_site_filtered_queryset(self.site)
 
@@ -82,20 +146,32 @@ class PageListView(BaseListAPIView):
         if self.request.user.is_anonymous:
             qs = qs.filter(login_required=False)
 
-        try:
-            pages = [
-                getattr(page, self.content_getter)(language, fallback=True)
-                for page in qs
-                if user_can_view_page(self.request.user, page)
-                and getattr(page, self.content_getter)(language, fallback=True)
-            ]
-
-            return pages
-        except PageContent.DoesNotExist:
-            raise NotFound()
+        qs = filter_viewable_pages(qs, self.request.user, self.site)
+        return get_page_content_queryset(qs, language, self.site, preview=self._preview_requested())
+
+    def get_validators(self, queryset: QuerySet) -> tuple:
+        return get_page_content_validators(queryset)
+
+    @extend_sparse_fieldset_schema
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        self.add_surrogate_keys(get_menu_key(self.site.pk))
+        queryset = self.filter_queryset(self.get_queryset())
+        not_modified = self.get_not_modified_response(*self.get_validators(queryset))
+        if not_modified is not None:
+            return not_modified
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
 
 
 class PageSearchView(PageListView):
+    # Results are ordered by relevance, not by the page tree
+    cursor_pagination_class = None
+
     @extend_page_search_schema
     def get(self, request, language: str | None = None) -> Response:
         self.search_term = request.GET.get("q", "")
@@ -105,36 +181,114 @@ class PageSearchView(PageListView):
     def get_queryset(self):
         if not self.search_term:
             return PageContent.objects.none()
+        queryset = super().get_queryset()
+        if search_index_enabled():
+            return search_page_contents(queryset, self.search_term)
+
+        # Without the search index, fall back to django CMS' search of titles and meta descriptions
         qs = Page.objects.search(self.search_term, language=self.language, current_site_only=False).on_site(self.site)
-        return PageContent.objects.filter(page__in=qs).distinct()
+        return queryset.filter(page__in=qs)
+
+    def get_validators(self, queryset: QuerySet) -> tuple:
+        """The ranking also changes with the search index."""
+        if not search_index_enabled():
+            return super().get_validators(queryset)
+        index = SearchEntry.objects.filter(site=self.site, language=self.language).aggregate(
+            count=Count("pk"), changed=Max("changed_date")
+        )
+        return (*super().get_validators(queryset), *index.values())
 
 
 class PageTreeListView(BaseAPIView):
     permission_classes = [IsAllowedPublicLanguage]
     serializer_class = PageMetaSerializer
+    stream_chunk_size = 500
+
+    def stream_requested(self) -> bool:
+        """``?stream=1`` requests the tree as a streamed JSON response (ignored for binary formats)."""
+        renderer = getattr(self.request, "accepted_renderer", None)
+        if renderer is not None and renderer.render_style == "binary":
+            return False
+        return "stream" in self.request.GET and self.request.GET.get("stream", "").lower() not in ("0", "false")
+
+    def get_tree_depth(self) -> int | None:
+        """``?depth=<n>`` limits the tree to ``n`` levels."""
+        depth = self.request.GET.get("depth")
+        if not depth:
+            return None
+        try:
+            depth = int(depth)
+        except ValueError:
+            depth = 0
+        if depth < 1:
+            raise ValidationError({"depth": "Expected a positive integer."})
+        return depth
+
+    def get_tree_root(self, pages: QuerySet) -> Page | None:
+        """``?root=<path>`` limits the tree to the descendants of the page at this path."""
+        if "root" not in self.request.GET:
+            return None
+        root = get_object(self.site, self.request.GET["root"].strip("/"))
+        if not pages.filter(pk=root.pk).exists():
+            raise NotFound()
+        return root
 
+    @extend_page_tree_schema
     def get(self, request, language):
         """List of all pages on this site for a given language."""
+        self.add_surrogate_keys(get_menu_key(self.site.pk))
         qs = get_site_filtered_queryset(self.site)
 
         # Filter out pages which require login
         if self.request.user.is_anonymous:
             qs = qs.filter(login_required=False)
 
-        try:
-            pages = [
-                getattr(page, self.content_getter)(language, fallback=True)
-                for page in qs
-                if user_can_view_page(self.request.user, page)
-                and getattr(page, self.content_getter)(language, fallback=True)
-            ]
-
-            if not any(pages):
-                raise PageContent.DoesNotExist()
-        except PageContent.DoesNotExist:
+        qs = filter_viewable_pages(qs, self.request.user, self.site)
+        depth = self.get_tree_depth()
+        root = self.get_tree_root(qs)
+        path_lookup, depth_lookup = get_page_tree_lookup("path"), get_page_tree_lookup("depth")
+        root_depth = 0
+        if root is not None:
+            root_depth = attrgetter(depth_lookup.replace("__", "."))(root)
+            qs = qs.filter(
+                **{
+                    f"{path_lookup}__startswith": attrgetter(path_lookup.replace("__", "."))(root),
+                    f"{depth_lookup}__gt": root_depth,
+                }
+            )
+
+        subtree = get_page_content_queryset(qs, language, self.site, preview=self._preview_requested())
+        page_contents = validated = subtree
+        if depth is not None:
+            page_contents = subtree.filter(**{f"page__{depth_lookup}__lte": root_depth + depth})
+            # The children counts of the deepest level depend on the level below
+            validated = subtree.filter(**{f"page__{depth_lookup}__lte": root_depth + depth + 1})
+        page_contents = annotate_children_count(page_contents, subtree)
+
+        validators = get_page_content_validators(validated)
+        if not validators[0] and root is None:
             raise NotFound()
-
-        serializer = self.serializer_class(pages, many=True, read_only=True, context={"request": request})
+        not_modified = self.get_not_modified_response(*validators)
+        if not_modified is not None:
+            return not_modified
+
+        root_id = root.pk if root is not None else None
+        if self.stream_requested():
+            return StreamingHttpResponse(
+                stream_page_tree(
+                    page_contents.iterator(chunk_size=self.stream_chunk_size),
+                    self.serializer_class(context={"request": request}),
+                    chunk_size=self.stream_chunk_size,
+                    root_id=root_id,
+                ),
+                content_type="application/json",
+            )
+
+        pages = list(page_contents)
+
+        serializer = self.serializer_class(
+            pages, many=True, read_only=True, root_id=root_id, context={"request": request}
+        )
         return Response(serializer.data)
 
 
@@ -143,22 +297,154 @@ class PageDetailView(BaseAPIView):
     permission_classes = [IsAllowedPublicLanguage, CanViewPage]
     serializer_class = PageContentSerializer
 
+    @extend_page_detail_schema
     def get(self, request: Request, language: str, path: str = "") -> Response:
         """Retrieve a page instance. The page instance includes the placeholders and
         their links to retrieve dynamic content."""
         site = self.site
+        use_response_cache = self.use_response_cache()
+        if use_response_cache:
+            entry = get_page_response_cache(request, language, site.pk, path)
+            if entry is not None:
+                self.add_surrogate_keys(*entry.get("surrogate_keys", ()))
+                not_modified = self.get_not_modified_response(
+                    *entry["validators"], last_modified=entry["last_modified"]
+                )
+                return not_modified or Response(entry["data"])
+
         page = get_object(site, path)
         self.check_object_permissions(request, page)
+        self.private_response = page.login_required
 
         try:
             page_content = getattr(page, self.content_getter)(language, fallback=True)
             if not page_content:
                 raise PageContent.DoesNotExist()
+            validators, last_modified = self.get_page_content_validators(page_content)
+            self.add_surrogate_keys(*get_page_content_keys(page_content))
+            not_modified = self.get_not_modified_response(*validators, last_modified=last_modified)
+            if not_modified is not None:
+                return not_modified
             serializer = self.serializer_class(page_content, read_only=True, context={"request": request})
+            # Cache hits skip the page lookup, so they cannot be marked private
+            if use_response_cache and not self.private_response:
+                set_page_response_cache(
+                    request,
+                    language,
+                    site.pk,
+                    path,
+                    page_content,
+                    page_content.placeholders.all(),
+                    serializer.data,
+                    validators,
+                    last_modified,
+                    surrogate_keys=self.surrogate_keys,
+                )
             return Response(serializer.data)
         except PageContent.DoesNotExist:
             raise NotFound()
 
+    def use_response_cache(self) -> bool:
+        """Whole responses are only cached for anonymous, non-preview requests (opt-in)."""
+        return page_response_cache_enabled() and self.request.user.is_anonymous and not self._preview_requested()
+
+    def get_page_content_validators(self, page_content: PageContent) -> tuple[tuple, datetime]:
+        """
+        The page content is validated by its change date, the change date and languages of its page
+        (page-level fields are part of the response) and the cache versions of its placeholders.
+        """
+        prefetch_related_objects([page_content], "placeholders")
+        page = page_content.page
+        versions = get_placeholder_cache_versions(page_content.placeholders.all(), page_content.language, self.site.pk)
+        last_modified = max(
+            [
+                page_content.changed_date,
+                page.changed_date,
+                *(datetime.fromtimestamp(version / 1000000, tz=timezone.utc) for version in versions),
+            ]
+        )
+        validators = (
+            page_content.pk,
+            page_content.changed_date,
+            page.changed_date,
+            sorted(page.get_languages()),
+            versions,
+        )
+        return validators, last_modified
+
+
+class PageBatchView(BaseAPIView):
+    permission_classes = [IsAllowedPublicLanguage]
+    serializer_class = PageContentSerializer
+    max_paths = 100
+
+    @extend_page_batch_schema
+    def get(self, request: Request, language: str) -> Response:
+        """Retrieve many page instances at once, selected by their paths (``?path=a&path=b``).
+
+        All paths are resolved in a single query and the placeholders of all pages are loaded
+        together. The response maps each path to its page (same format as the page detail
+        endpoint) in "results" and each path which cannot be retrieved to its error in "errors"."""
+        paths = list(dict.fromkeys(path.strip("/") for path in request.query_params.getlist("path")))
+        if not paths:
+            raise ValidationError({"path": "At least one path is required."})
+        if len(paths) > self.max_paths:
+            raise ValidationError({"path": f"At most {self.max_paths} paths can be requested at once."})
+
+        pages = route_table.resolve_many(self.site, paths)
+        viewable = get_viewable_pages(set(pages.values()), request.user, self.site)
+        page_contents = {
+            page_content.page_id: page_content
+            for page_content in get_page_content_queryset(
+                Page.objects.filter(pk__in=[page.pk for page in viewable]),
+                language,
+                self.site,
+                preview=self._preview_requested(),
+            )
+        }
+        found = [path for path in paths if path in pages and pages[path].pk in page_contents]
+        self.private_response = any(pages[path].login_required for path in found)
+
+        validators, last_modified = self.get_validators(page_contents.values())
+        for path in found:
+            self.add_surrogate_keys(*get_page_content_keys(page_contents[pages[path].pk]))
+        not_modified = self.get_not_modified_response(found, *validators, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = self.serializer_class(
+            [page_contents[pages[path].pk] for path in found],
+            many=True,
+            read_only=True,
+            context={"request": request},
+        )
+        return Response(
+            {
+                "results": dict(zip(found, serializer.data)),
+                "errors": {path: {"detail": NotFound.default_detail} for path in paths if path not in found},
+            }
+        )
+
+    def get_validators(self, page_contents) -> tuple[tuple, datetime | None]:
+        """The page contents are validated by their change dates and the cache versions of their
+        placeholders, which are read with one cache round-trip per language."""
+        page_contents = list(page_contents)
+        prefetch_related_objects(page_contents, "placeholders")
+        placeholders_by_language = {}
+        for page_content in page_contents:
+            placeholders_by_language.setdefault(page_content.language, []).extend(page_content.placeholders.all())
+        versions = [
+            version
+            for lang, placeholders in placeholders_by_language.items()
+            for version in get_placeholder_cache_versions(placeholders, lang, self.site.pk)
+        ]
+        dates = [
+            *(page_content.changed_date for page_content in page_contents),
+            *(datetime.fromtimestamp(version / 1000000, tz=timezone.utc) for version in versions),
+        ]
+        validators = sorted((page_content.pk, page_content.changed_date) for page_content in page_contents)
+        return (validators, versions), max(dates, default=None)
+
 
 class PlaceholderDetailView(BaseAPIView):
     permission_classes = [IsAllowedPublicLanguage]
@@ -203,11 +489,183 @@ class PlaceholderDetailView(BaseAPIView):
                 # If the object is a PageContent, check the page view permission
                 if not user_can_view_page(request.user, source.page):
                     raise NotFound()
+                self.private_response = source.page.login_required
 
         self.check_object_permissions(request, placeholder)
+        self.add_surrogate_keys(*get_placeholder_keys(placeholder, source))
+
+        cache_key = None
+        if self.use_response_cache(placeholder):
+            cache_key = get_placeholder_response_cache_key(
+                placeholder, language, self.site.pk, request, request.accepted_media_type
+            )
+            cached = get_placeholder_response_cache(cache_key) if cache_key else None
+            if cached is not None:
+                content_type, content = cached
+                return HttpResponse(content, content_type=content_type)
 
         serializer = self.serializer_class(instance=placeholder, request=request, language=language, read_only=True)
-        return Response(serializer.data)
+        response = Response(serializer.data)
+        if cache_key:
+            response.add_post_render_callback(partial(set_placeholder_response_cache, cache_key, placeholder, request))
+        return response
+
+    def use_response_cache(self, placeholder: Placeholder) -> bool:
+        """Encoded responses (JSON, MessagePack or CBOR) are cached for anonymous, non-preview
+        requests without rendered HTML."""
+        return (
+            placeholder.cache_placeholder
+            and self.request.user.is_anonymous
+            and not self._preview_requested()
+            and "html" not in self.request.GET
+            and isinstance(self.request.accepted_renderer, (JSONRenderer, MessagePackRenderer, CBORRenderer))
+        )
+
+
+class PlaceholderBatchView(BaseAPIView):
+    permission_classes = [IsAllowedPublicLanguage]
+    serializer_class = PlaceholderSerializer
+    max_placeholders = 100
+
+    @extend_placeholder_batch_schema
+    def get(self, request: Request, language: str) -> Response:
+        """Retrieve many placeholders at once, selected by ``?placeholder={content_type_id}/{object_id}/{slot}``
+        (repeat the parameter for more placeholders).
+
+        All placeholders are resolved with a single query, their cached content is read with a
+        single cache round-trip and only the cache misses are serialized (and written back to
+        the cache together). The response maps each identifier to its placeholder (same format
+        as the placeholder detail endpoint) in "results" and each identifier which cannot be
+        retrieved to its error in "errors"."""
+        identifiers = {}
+        for identifier in dict.fromkeys(request.query_params.getlist("placeholder")):
+            content_type_id, _, rest = identifier.strip("/").partition("/")
+            object_id, _, slot = rest.partition("/")
+            if not (content_type_id.isdigit() and object_id.isdigit() and slot) or "/" in slot:
+                raise ValidationError({"placeholder": f"Invalid placeholder identifier: {identifier}"})
+            identifiers[identifier] = (int(content_type_id), int(object_id), slot)
+        if not identifiers:
+            raise ValidationError({"placeholder": "At least one placeholder is required."})
+        if len(identifiers) > self.max_placeholders:
+            raise ValidationError(
+                {"placeholder": f"At most {self.max_placeholders} placeholders can be requested at once."}
+            )
+
+        query = Q(pk__in=[])
+        for content_type_id, object_id, slot in identifiers.values():
+            query |= Q(content_type_id=content_type_id, object_id=object_id, slot=slot)
+        placeholders = {
+            (placeholder.content_type_id, placeholder.object_id, placeholder.slot): placeholder
+            for placeholder in self.filter_visible(Placeholder.objects.filter(query))
+        }
+        found = [identifier for identifier, key in identifiers.items() if key in placeholders]
+
+        renderer = RESTRenderer(request)
+        instances = [placeholders[identifiers[identifier]] for identifier in found]
+        for placeholder in instances:
+            self.add_surrogate_keys(*get_placeholder_keys(placeholder, placeholder.source))
+            if isinstance(placeholder.source, PageContent) and placeholder.source.page.login_required:
+                self.private_response = True
+        if self.api_context.include_field("content"):
+            renderer.prefetch_plugins(instances, language, use_cache=not self.api_context.preview)
+        with renderer.defer_cache_writes(language):
+            data = self.serializer_class(
+                instances, many=True, request=request, language=language, renderer=renderer, read_only=True
+            ).data
+        return Response(
+            {
+                "results": dict(zip(found, data)),
+                "errors": {
+                    identifier: {"detail": NotFound.default_detail}
+                    for identifier in identifiers
+                    if identifier not in found
+                },
+            }
+        )
+
+    def filter_visible(self, placeholders: QuerySet) -> list[Placeholder]:
+        """Returns the placeholders whose source object is visible, loading the sources with one
+        query per content type. For page contents, the page's view permission is checked, too."""
+        placeholders = list(placeholders.select_related("content_type"))
+        object_ids = {}
+        for placeholder in placeholders:
+            object_ids.setdefault(placeholder.content_type, set()).add(placeholder.object_id)
+
+        content_manager = "admin_manager" if self._preview_requested() else "content"
+        sources = {}
+        for content_type, ids in object_ids.items():
+            source_model = content_type.model_class()
+            if source_model is None:
+                continue
+            queryset = getattr(source_model, content_manager, source_model.objects).filter(pk__in=ids)
+            if issubclass(source_model, PageContent):
+                queryset = queryset.select_related("page")
+            objects = list(queryset)
+            if issubclass(source_model, PageContent):
+                # Like the placeholder detail view, only the visibility of pages is checked
+                pages = get_viewable_pages({obj.page for obj in objects}, self.request.user, self.site)
+                viewable = {page.pk for page in pages}
+                objects = [obj for obj in objects if obj.page_id in viewable]
+            sources.update({(content_type.pk, obj.pk): obj for obj in objects})
+
+        visible = []
+        for placeholder in placeholders:
+            source = sources.get((placeholder.content_type_id, placeholder.object_id))
+            if source is not None:
+                placeholder.source = source
+                if isinstance(source, PageContent):
+                    placeholder.page = source.page
+                visible.append(placeholder)
+        return visible
+
+
+class ChangeFeedView(BaseAPIView):
+    permission_classes = [IsAllowedPublicLanguage]
+    serializer_class = ChangeFeedSerializer
+
+    @extend_change_feed_schema
+    def get(self, request: Request, language: str) -> Response:
+        """List the pages and placeholders which changed after a token (``?since=<token>``).
+
+        Pass the returned "token" as ``since`` next time. Without a token or if the token is too
+        old, "full_rebuild" is set. If "more" is set, further changes are available right away.
+        Changes are reported at least once: recent changes are reported again next time.
+        Requires ``REST_CHANGE_LOG = True``."""
+        if not change_log_enabled():
+            raise NotFound()
+        since = request.query_params.get("since")
+        if since is not None:
+            try:
+                since = int(since)
+            except ValueError:
+                raise ValidationError({"since": "A valid integer is required."})
+        changes = get_changes(self.site, language, since, request.user)
+
+        if "pages" in changes:
+            changes["pages"] = [
+                {"path": path, "details": self.get_page_url(language, path)} for path in changes["pages"]
+            ]
+            changes["placeholders"] = [
+                {
+                    "slot": placeholder.slot,
+                    "details": get_absolute_frontend_url(
+                        request,
+                        url_builder.build(
+                            "placeholder-detail",
+                            args=(language, placeholder.content_type_id, placeholder.object_id, placeholder.slot),
+                        ),
+                    ),
+                }
+                for placeholder in changes["placeholders"]
+            ]
+        return Response(self.serializer_class(changes).data)
+
+    def get_page_url(self, language: str, path: str) -> str:
+        if path:
+            url = url_builder.build("page-detail", kwargs={"language": language, "path": path})
+        else:
+            url = url_builder.build("page-root", kwargs={"language": language})
+        return get_absolute_frontend_url(self.request, url)
 
 
 class PluginDefinitionView(BaseAPIView):
@@ -249,6 +707,7 @@ class MenuView(BaseAPIView):
         **kwargs: dict[str, Any],
     ) -> Response:
         """Get the menu structure for a specific language and path."""
+        self.add_surrogate_keys(get_menu_key(self.site.pk))
         self.populate_defaults(kwargs)
         menu = self.get_menu_structure(request, language, path, **kwargs)
         serializer = self.serializer_class(menu, many=True, context={"request": request})
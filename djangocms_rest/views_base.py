@@ -1,14 +1,30 @@
+import hashlib
+from datetime import datetime
 from typing import ParamSpec, TypeVar
 
-from django.contrib.sites.shortcuts import get_current_site
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
 from django.utils.functional import cached_property
+from django.utils.http import http_date
 
 from cms.toolbar.toolbar import CMSToolbar
 
 from rest_framework.generics import ListAPIView
 from rest_framework.permissions import IsAdminUser
+from rest_framework.renderers import JSONRenderer
 from rest_framework.views import APIView
 
+from djangocms_rest.purge import (
+    format_surrogate_keys,
+    get_language_key,
+    get_site_key,
+    get_surrogate_key_header,
+    surrogate_keys_enabled,
+)
+from djangocms_rest.renderers import ORJSONRenderer, get_binary_renderer_classes
+from djangocms_rest.utils import APIContext, get_api_context
+
 P = ParamSpec("P")
 T = TypeVar("T")
 
@@ -58,24 +74,54 @@ class BaseAPIMixin:
     """
 
     http_method_names = ("get", "options")
+    etag = None
+    last_modified = None
+    # Set by views returning content of pages which require a login
+    private_response = False
+
+    @cached_property
+    def api_context(self) -> APIContext:
+        """
+        The request-scoped context with the site, its languages, the preview flag and the URL prefix.
+        """
+        return get_api_context(self.request)
 
     @cached_property
     def site(self):
         """
         Fetch and cache the current site and make it available to all views.
         """
-        site = getattr(self.request, "site", None)
-        return site if site is not None else get_current_site(self.request)
+        return self.api_context.site
+
+    @cached_property
+    def surrogate_keys(self) -> set[str]:
+        """
+        Keys of the objects the response is built from, sent in the surrogate key header
+        together with the site and language keys (see :mod:`djangocms_rest.purge`).
+        """
+        return set()
+
+    def add_surrogate_keys(self, *keys: str) -> None:
+        self.surrogate_keys.update(keys)
+
+    def get_renderers(self):
+        """
+        Render JSON with orjson (if installed) where DRF's stock JSON renderer is configured and
+        offer MessagePack and CBOR (if installed) to clients which ask for them in ``Accept``.
+        """
+        renderers = [
+            ORJSONRenderer() if type(renderer) is JSONRenderer else renderer for renderer in super().get_renderers()
+        ]
+        formats = {renderer.format for renderer in renderers}
+        for renderer_class in get_binary_renderer_classes():
+            if renderer_class.format not in formats:
+                renderers.append(renderer_class())
+        return renderers
 
     def _preview_requested(self):
         if not hasattr(self.request, "_preview_mode"):
             # Cache to not re-generate toolbar object for preview requests
-            self.request._preview_mode = "preview" in self.request.GET and self.request.GET.get(
-                "preview", ""
-            ).lower() not in (
-                "0",
-                "false",
-            )
+            self.request._preview_mode = self.api_context.preview
             if self.request._preview_mode:
                 if not hasattr(self.request, "toolbar"):  # Create toolbar if not present to mark preview mode
                     self.request.toolbar = CMSToolbar(self.request)
@@ -95,6 +141,66 @@ class BaseAPIMixin:
             permissions.insert(0, IsAdminUser())
         return permissions
 
+    def get_not_modified_response(self, *validators, last_modified: datetime | None = None) -> HttpResponse | None:
+        """
+        Derive the ``ETag`` (and optionally the ``Last-Modified`` header) of the response from the
+        given validators and return a 304 response if the client's copy is still current. Call this
+        before serializing. The ETag also depends on the URL, the site, the user and the response
+        format. Preview requests are never conditional.
+        """
+        if self._preview_requested() or self.request.method not in ("GET", "HEAD"):
+            return None
+        user = self.request.user
+        fingerprint = repr(
+            (
+                validators,
+                self.request.get_full_path(),
+                self.site.pk,
+                user.pk if user.is_authenticated else None,
+                getattr(self.request, "accepted_media_type", None),
+            )
+        )
+        self.etag = f'W/"{hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()}"'
+        self.last_modified = int(last_modified.timestamp()) if last_modified else None
+        return get_conditional_response(self.request._request, etag=self.etag, last_modified=self.last_modified)
+
+    def get_cache_control(self) -> str | None:
+        """
+        The ``Cache-Control`` policy of the URL (``REST_CACHE_CONTROL`` maps URL names, or
+        ``"default"``, to policies). Where a policy applies, responses to preview or authenticated
+        requests and content of pages which require a login are downgraded to ``private, no-store``
+        so that shared caches never store them.
+        """
+        policies = getattr(settings, "REST_CACHE_CONTROL", None)
+        if not policies:
+            return None
+        match = getattr(self.request, "resolver_match", None)
+        policy = policies.get(match.url_name if match else None, policies.get("default"))
+        if policy and (self._preview_requested() or self.request.user.is_authenticated or self.private_response):
+            return "private, no-store"
+        return policy
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        # DRF only varies on Accept if several renderer classes are configured, but the binary
+        # renderers are added by get_renderers(): shared caches must not mix up the formats
+        if len(self.get_renderers()) > 1:
+            patch_vary_headers(response, ["Accept"])
+        if self.etag and response.status_code in (200, 304):
+            response["ETag"] = self.etag
+            if self.last_modified:
+                response["Last-Modified"] = http_date(self.last_modified)
+        if response.status_code in (200, 304) and not response.has_header("Cache-Control"):
+            cache_control = self.get_cache_control()
+            if cache_control:
+                response["Cache-Control"] = cache_control
+        if surrogate_keys_enabled() and response.status_code in (200, 304) and not self._preview_requested():
+            keys = [get_site_key(self.site.pk)]
+            if "language" in kwargs:
+                keys.append(get_language_key(kwargs["language"]))
+            response[get_surrogate_key_header()] = format_surrogate_keys([*keys, *sorted(self.surrogate_keys)])
+        return response
+
 
 class BaseAPIView(BaseAPIMixin, APIView):
     """
@@ -0,0 +1,98 @@
+from unittest import skipUnless
+from unittest.mock import patch
+
+from cms.api import add_plugin
+from cms.models import PageContent
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from rest_framework.reverse import reverse
+
+from djangocms_rest.renderers import cbor2, msgpack
+from djangocms_rest.views import PageDetailView, PlaceholderDetailView
+from tests.base import BaseCMSRestTestCase
+
+
+@skipUnless(msgpack and cbor2, "msgpack and cbor2 are required")
+class BinaryFormatsTestCase(BaseCMSRestTestCase):
+    """
+    Test the MessagePack and CBOR response formats.
+
+    Verifies:
+    - Clients select the formats with the Accept header and get the same data as with JSON
+    - JSON stays the default and streaming falls back to a complete response
+    - Responses vary on Accept even if only JSON is configured
+    - Encoded placeholder responses are served from the cache as they are
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.page_content = PageContent.objects.get(page__urls__path="page-1", language="en")
+        self.placeholder = self.page_content.placeholders.get(slot="content")
+        add_plugin(self.placeholder, "TextPlugin", "en", body="<p>Text</p>")
+        self.placeholder_url = reverse(
+            "placeholder-detail",
+            args=["en", self.placeholder.content_type_id, self.placeholder.object_id, self.placeholder.slot],
+        )
+
+    def get(self, url, media_type, **params):
+        response = self.client.get(url, params, headers={"accept": media_type})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], media_type)
+        return msgpack.unpackb(response.content) if "msgpack" in media_type else cbor2.loads(response.content)
+
+    def test_formats(self):
+        for url in (
+            reverse("page-detail", kwargs={"language": "en", "path": "page-1"}),
+            reverse("page-tree-list", kwargs={"language": "en"}),
+            reverse("page-list", kwargs={"language": "en"}),
+            reverse("menu", kwargs={"language": "en"}),
+            self.placeholder_url,
+        ):
+            data = self.client.get(url).json()
+            for media_type in ("application/msgpack", "application/cbor"):
+                with self.subTest(url=url, media_type=media_type):
+                    self.assertEqual(self.get(url, media_type), data)
+
+    def test_json_is_default(self):
+        response = self.client.get(self.placeholder_url, headers={"accept": "*/*"})
+        self.assertEqual(response["Content-Type"], "application/json")
+
+    @override_settings(REST_CACHE_CONTROL={"default": "public, max-age=60"})
+    def test_vary(self):
+        # Only JSON is configured, but the binary formats are offered anyway
+        with patch.object(PageDetailView, "renderer_classes", [JSONRenderer]), patch.object(
+            PlaceholderDetailView, "renderer_classes", [JSONRenderer]
+        ):
+            for url in (reverse("page-detail", kwargs={"language": "en", "path": "page-1"}), self.placeholder_url):
+                # Repeated requests for the placeholder are served from the response cache
+                for media_type in ("application/json", "application/msgpack") * 2:
+                    with self.subTest(url=url, media_type=media_type):
+                        response = self.client.get(url, headers={"accept": media_type})
+                        self.assertEqual(response["Content-Type"], media_type)
+                        self.assertEqual(response["Cache-Control"], "public, max-age=60")
+                        self.assertIn("Accept", response["Vary"])
+
+    def test_stream(self):
+        url = reverse("page-tree-list", kwargs={"language": "en"})
+        self.assertEqual(self.get(url, "application/msgpack", stream=1), self.client.get(url).json())
+
+    def test_placeholder_response_cache(self):
+        self.client.get(self.placeholder_url)  # Caches the serialized content
+        # Cache the encoded responses
+        json_content = self.client.get(self.placeholder_url).content
+        self.get(self.placeholder_url, "application/msgpack")
+        with CaptureQueriesContext(connection) as queries:
+            data = self.get(self.placeholder_url, "application/msgpack")
+            response = self.client.get(self.placeholder_url)
+        self.assertFalse([query for query in queries if "cms_cmsplugin" in query["sql"]])
+        self.assertEqual(data["content"][0]["plugin_type"], "TextPlugin")
+        self.assertEqual(response.content, json_content)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+        # A change of the placeholder invalidates the cached responses
+        add_plugin(self.placeholder, "TextPlugin", "en", body="<p>More</p>")
+        self.placeholder.clear_cache("en", site_id=1)
+        self.assertEqual(len(self.get(self.placeholder_url, "application/msgpack")["content"]), 2)
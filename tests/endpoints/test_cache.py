@@ -1,8 +1,11 @@
-from cms.api import add_plugin
-from cms.models import PageContent
+from cms.api import add_plugin, create_page_content
+from cms.models import PageContent, PagePermission, PageUrl
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.shortcuts import get_current_site
 from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 
 from rest_framework.reverse import reverse
@@ -197,3 +200,112 @@ class CachingAPITestCase(BaseCMSRestTestCase):
         )
         self.assertEqual(version4, 12345)
         self.assertEqual(vary_list4, [])
+
+    def test_cache_key_matches_django_cms(self):
+        """
+        The REST cache key is built locally from a known version, but must stay the key django CMS
+        builds for the same version (with a ``:rest`` suffix).
+        """
+        from cms.cache.placeholder import _get_placeholder_cache_key, _set_placeholder_cache_version
+        from django.test import RequestFactory
+
+        from djangocms_rest.serializers.utils.cache import _get_placeholder_rest_cache_key
+
+        site_id = get_current_site(None).pk
+        for vary_on_list, language in (([], "en"), (["Accept-Language"], "en"), (["Accept-Language"], "x" * 200)):
+            with self.subTest(vary_on_list=vary_on_list, language=language):
+                request = RequestFactory().get("/", headers={"accept-language": language})
+                _set_placeholder_cache_version(self.placeholder, "en", site_id, 12345, vary_on_list)
+                self.assertEqual(
+                    _get_placeholder_rest_cache_key(self.placeholder, "en", site_id, request, 12345, vary_on_list),
+                    _get_placeholder_cache_key(self.placeholder, "en", site_id, request, soft=True) + ":rest",
+                )
+
+
+@override_settings(REST_PAGE_CACHE=True)
+class PageResponseCacheTestCase(BaseCMSRestTestCase):
+    """
+    Test the opt-in whole-response cache of the page detail endpoint.
+
+    Verifies:
+    - A cached page is served with a single database query
+    - Changing a placeholder, the page, its contents or its view permissions invalidates the cached response
+    - Responses for different hosts are cached separately
+    - Authenticated requests bypass the cache
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.page = PageUrl.objects.get(path="page-0", language="en").page
+        self.url = reverse("page-detail", kwargs={"language": "en", "path": "page-0"})
+        self.placeholder = self.page.get_placeholders(language="en").get(slot="content")
+        self.plugin = add_plugin(self.placeholder, "TextPlugin", "en", body="<p>Cached</p>")
+
+    def test_cached_response_skips_serialization(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertNumQueries(1):  # The state of the page content
+            cached = self.client.get(self.url)
+        self.assertEqual(cached.json(), response.json())
+        self.assertEqual(cached.headers["ETag"], response.headers["ETag"])
+
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=response.headers["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+
+        # Query parameters are part of the key
+        self.assertNotEqual(self.client.get(self.url + "?html=1").json(), response.json())
+        self.assertNotIn("content", self.client.get(self.url + "?placeholders=none").json()["placeholders"][0])
+        self.assertIn("content", self.client.get(self.url + "?placeholders=content").json()["placeholders"][0])
+
+    @override_settings(ALLOWED_HOSTS=["internal.example", "public.example"])
+    def test_host_is_part_of_the_key(self):
+        internal = self.client.get(self.url, headers={"host": "internal.example"}).json()
+        public = self.client.get(self.url, headers={"host": "public.example"}).json()
+        self.assertTrue(internal["absolute_url"].startswith("http://internal.example/"))
+        self.assertTrue(public["absolute_url"].startswith("http://public.example/"))
+        self.assertTrue(public["details"].startswith("http://public.example/"))
+
+    def test_placeholder_change_invalidates(self):
+        self.client.get(self.url)
+        self.plugin.body = "<p>Changed</p>"
+        self.plugin.save()
+        self.placeholder.clear_cache("en")
+
+        response = self.client.get(self.url)
+        self.assertIn("<p>Changed</p>", str(response.json()["placeholders"]))
+
+    def test_page_change_invalidates(self):
+        self.client.get(self.url)
+        PageContent.objects.filter(page=self.page, language="en").update(title="Changed title")
+        self.page.clear_cache()
+
+        self.assertEqual(self.client.get(self.url).json()["title"], "Changed title")
+
+    def test_page_content_change_invalidates(self):
+        self.client.get(self.url)
+        page_content = PageContent.objects.get(page=self.page, language="en")
+        page_content.title = "Changed title"
+        page_content.save()
+        self.assertEqual(self.client.get(self.url).json()["title"], "Changed title")
+
+        create_page_content("it", "Pagina 0", self.page)
+        self.assertIn("it", self.client.get(self.url).json()["languages"])
+
+    @override_settings(CMS_PAGE_CACHE=False)
+    def test_page_content_change_invalidates_without_page_cache(self):
+        self.test_page_content_change_invalidates()
+
+    @override_settings(CMS_PERMISSION=True)
+    def test_view_restriction_invalidates(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        PagePermission.objects.create(page=self.page, user=self.user, can_view=True)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_authenticated_requests_are_not_cached(self):
+        self.client.get(self.url)
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        self.assertTrue(queries.captured_queries)
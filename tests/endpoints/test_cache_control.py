@@ -0,0 +1,72 @@
+from cms.api import create_page
+from cms.models import PageContent
+from django.test import override_settings
+from rest_framework.reverse import reverse
+
+from tests.base import BaseCMSRestTestCase
+
+
+@override_settings(
+    REST_CACHE_CONTROL={
+        "page-detail": "public, max-age=60, stale-while-revalidate=600",
+        "placeholder-detail": "public, max-age=30",
+        "default": "public, max-age=5",
+    }
+)
+class CacheControlTestCase(BaseCMSRestTestCase):
+    """
+    Test the ``Cache-Control`` policies configured with ``REST_CACHE_CONTROL``.
+
+    Verifies:
+    - Each URL name gets its policy, others the default policy
+    - Preview, authenticated and login-required responses are private
+    - Error responses and unconfigured installs get no policy
+    """
+
+    def setUp(self):
+        self.url = reverse("page-detail", kwargs={"language": "en", "path": "page-1"})
+
+    def test_policies(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response["Cache-Control"], "public, max-age=60, stale-while-revalidate=600")
+
+        placeholder = PageContent.objects.get(page__urls__path="page-1", language="en").placeholders.first()
+        url = reverse(
+            "placeholder-detail", args=["en", placeholder.content_type_id, placeholder.object_id, placeholder.slot]
+        )
+        self.assertEqual(self.client.get(url)["Cache-Control"], "public, max-age=30")
+        response = self.client.get(reverse("menu", kwargs={"language": "en"}))
+        self.assertEqual(response["Cache-Control"], "public, max-age=5")
+
+    def test_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["Cache-Control"], "public, max-age=60, stale-while-revalidate=600")
+
+    def test_private_responses(self):
+        secret = create_page("secret", language="en", template="INHERIT", login_required=True)
+        placeholder = secret.get_placeholders("en").first()
+        for url in (
+            reverse("page-detail", kwargs={"language": "en", "path": "secret"}),
+            reverse(
+                "placeholder-detail",
+                args=["en", placeholder.content_type_id, placeholder.object_id, placeholder.slot],
+            ),
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url)["Cache-Control"], "private, no-store")
+
+        # The toolbar adds its own directives to responses for staff users
+        self.client.force_login(self.user)
+        self.assertTrue(self.client.get(self.url)["Cache-Control"].startswith("private, no-store"))
+        self.assertTrue(self.client.get(self.url, {"preview": 1})["Cache-Control"].startswith("private, no-store"))
+
+    def test_errors(self):
+        response = self.client.get(reverse("page-detail", kwargs={"language": "en", "path": "unknown"}))
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("Cache-Control", response)
+
+    @override_settings(REST_CACHE_CONTROL=None)
+    def test_not_configured(self):
+        self.assertNotIn("Cache-Control", self.client.get(self.url))
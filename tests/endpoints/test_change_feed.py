@@ -0,0 +1,145 @@
+from datetime import timedelta
+
+from cms.models import PageContent, PageUrl
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sites.models import Site
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.reverse import reverse
+
+from djangocms_rest.changes import get_changes, log_changes, placeholder_operation
+from djangocms_rest.models import ChangeLogEntry
+from tests.base import BaseCMSRestTestCase
+
+
+@override_settings(REST_CHANGE_LOG=True, REST_CHANGE_LOG_WINDOW=0)
+class ChangeFeedAPITestCase(BaseCMSRestTestCase):
+    """
+    Test the change feed endpoint ('/api/{language}/changes/?since=...').
+
+    Verifies:
+    - Changed pages and placeholders after a token are listed with their detail URLs
+    - Deleted and hidden pages are reported as removed paths
+    - Clients without a token or with a pruned token are told to rebuild everything
+    - The feed is paged by the returned token
+    - The token does not pass recent entries, so entries committed out of order are not missed
+    """
+
+    def setUp(self):
+        self.url = reverse("change-feed", kwargs={"language": "en"})
+        self.token = self.client.get(self.url).json()["token"]
+
+    def get_changes(self, since=None):
+        response = self.client.get(self.url, {"since": self.token if since is None else since})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def get_page_content(self, path):
+        return PageContent.objects.get(page__urls__path=path, language="en")
+
+    def test_no_token(self):
+        data = self.client.get(self.url).json()
+        self.assertTrue(data["full_rebuild"])
+        self.assertEqual(data["token"], self.token)
+
+    def test_page_content_changed(self):
+        page_content = self.get_page_content("page-1")
+        page_content.title = "Changed"
+        with self.captureOnCommitCallbacks(execute=True):
+            page_content.save()
+
+        data = self.get_changes()
+        self.assertFalse(data["full_rebuild"])
+        self.assertFalse(data["more"])
+        self.assertTrue(data["menu"])
+        self.assertEqual([page["path"] for page in data["pages"]], ["page-1"])
+        self.assertEqual(self.client.get(data["pages"][0]["details"]).json()["title"], "Changed")
+        self.assertEqual(data["removed"], [])
+
+        # Nothing changed since
+        data = self.get_changes(data["token"])
+        self.assertEqual(data["pages"], [])
+        self.assertFalse(data["menu"])
+
+    def test_placeholder_changed(self):
+        page_content = self.get_page_content("page-2")
+        placeholder = page_content.get_placeholders().get(slot="content")
+        with self.captureOnCommitCallbacks(execute=True):
+            placeholder_operation(sender=PageContent, operation="add_plugin", placeholder=placeholder)
+
+        data = self.get_changes()
+        self.assertEqual([page["path"] for page in data["pages"]], ["page-2"])
+        self.assertEqual(len(data["placeholders"]), 1)
+        self.assertEqual(self.client.get(data["placeholders"][0]["details"]).json()["slot"], "content")
+
+    def test_removed(self):
+        page = PageUrl.objects.get(path="page-1/page-0", language="en").page
+        hidden = PageUrl.objects.get(path="page-2", language="en").page
+        with self.captureOnCommitCallbacks(execute=True):
+            page.delete()
+            hidden.login_required = True
+            hidden.save()
+
+        data = self.get_changes()
+        self.assertEqual(data["removed"], ["page-1/page-0", "page-2"])
+        self.assertNotIn("page-2", [page["path"] for page in data["pages"]])
+
+        self.client.force_login(self.user)
+        data = self.get_changes()
+        self.assertEqual(data["removed"], ["page-1/page-0"])
+        self.assertIn("page-2", [page["path"] for page in data["pages"]])
+
+    def test_pruned_log(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            log_changes([self.pages[0]])
+            log_changes([self.pages[1]])
+        first = ChangeLogEntry.objects.order_by("pk").first()
+        ChangeLogEntry.objects.filter(pk=first.pk).update(created=timezone.now() - timedelta(days=31))
+        with self.captureOnCommitCallbacks(execute=True):
+            log_changes([self.pages[1]])
+
+        self.assertFalse(ChangeLogEntry.objects.filter(pk=first.pk).exists())
+        self.assertTrue(self.get_changes(first.pk - 1)["full_rebuild"])
+        self.assertFalse(self.get_changes(first.pk)["full_rebuild"])
+
+    def test_more(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            log_changes(self.pages)
+        changes = get_changes(Site.objects.get_current(), "en", int(self.token), AnonymousUser(), limit=1)
+        self.assertTrue(changes["more"])
+        self.assertEqual(len(changes["pages"]) + len(changes["removed"]), 1)
+
+        changes = get_changes(Site.objects.get_current(), "en", changes["token"], AnonymousUser(), limit=100)
+        self.assertFalse(changes["more"])
+        self.assertEqual(len(changes["pages"]), len(self.pages) - 1)
+
+    @override_settings(REST_CHANGE_LOG_WINDOW=60)
+    def test_window(self):
+        page_1 = PageUrl.objects.get(path="page-1", language="en").page
+        page_2 = PageUrl.objects.get(path="page-2", language="en").page
+        since = ChangeLogEntry.objects.create(site_id=1, language="en", page_id=page_1.pk, path="page-1").pk
+        ChangeLogEntry.objects.update(created=timezone.now() - timedelta(minutes=2))
+        self.assertEqual(int(self.client.get(self.url).json()["token"]), since)
+
+        # The entry with the lower key is committed last
+        ChangeLogEntry.objects.create(pk=since + 2, site_id=1, language="en", page_id=page_1.pk, path="page-1")
+        data = self.get_changes(since)
+        self.assertEqual([page["path"] for page in data["pages"]], ["page-1"])
+        self.assertEqual(int(data["token"]), since)
+        self.assertEqual(int(self.client.get(self.url).json()["token"]), since)
+
+        ChangeLogEntry.objects.create(pk=since + 1, site_id=1, language="en", page_id=page_2.pk, path="page-2")
+        data = self.get_changes(data["token"])
+        self.assertEqual([page["path"] for page in data["pages"]], ["page-1", "page-2"])
+
+        ChangeLogEntry.objects.update(created=timezone.now() - timedelta(minutes=2))
+        data = self.get_changes(data["token"])
+        self.assertEqual(int(data["token"]), since + 2)
+        self.assertEqual(self.get_changes(data["token"])["pages"], [])
+
+    def test_invalid_token(self):
+        self.assertEqual(self.client.get(self.url, {"since": "abc"}).status_code, 400)
+
+    @override_settings(REST_CHANGE_LOG=False)
+    def test_disabled(self):
+        self.assertEqual(self.client.get(self.url).status_code, 404)
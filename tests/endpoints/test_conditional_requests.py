@@ -0,0 +1,110 @@
+from cms.api import add_plugin, create_page_content
+from cms.models import PageUrl
+from django.core.cache import cache
+from rest_framework.reverse import reverse
+
+from tests.base import BaseCMSRestTestCase
+
+
+class ConditionalRequestTestCase(BaseCMSRestTestCase):
+    """
+    Test ETag / Last-Modified validators and 304 responses.
+
+    Verifies:
+    - Page detail, page tree, page list and language endpoints send an ETag
+    - A matching If-None-Match header returns 304 without a body
+    - Changing the content or its page changes the validator
+    - Adding a translation changes the validators of the lists
+    - Preview requests are never conditional
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def assertNotModified(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+        return etag
+
+    def test_endpoints_answer_if_none_match(self):
+        for url in (
+            reverse("page-detail", kwargs={"language": "en", "path": "page-0"}),
+            reverse("page-root", kwargs={"language": "en"}),
+            reverse("page-tree-list", kwargs={"language": "en"}),
+            reverse("page-list", kwargs={"language": "en"}),
+            reverse("language-list"),
+        ):
+            with self.subTest(url=url):
+                self.assertNotModified(url)
+
+    def test_etag_depends_on_query_params(self):
+        url = reverse("page-list", kwargs={"language": "en"})
+        etag = self.client.get(url).headers["ETag"]
+        response = self.client.get(url + "?limit=1", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_page_detail_validator_changes_with_content(self):
+        url = reverse("page-detail", kwargs={"language": "en", "path": "page-0"})
+        etag = self.assertNotModified(url)
+
+        page_content = self.client.get(url).json()
+        self.assertTrue(page_content["placeholders"])
+        page = PageUrl.objects.get(path="page-0", language="en").page
+        placeholder = page.get_admin_content("en").placeholders.get(slot=page_content["placeholders"][0]["slot"])
+        add_plugin(placeholder, "TextPlugin", "en", body="<p>Changed</p>")
+        placeholder.clear_cache("en")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_page_detail_validator_changes_with_page(self):
+        url = reverse("page-detail", kwargs={"language": "en", "path": "page-0"})
+        etag = self.assertNotModified(url)
+
+        create_page_content("it", "Pagina 0", PageUrl.objects.get(path="page-0", language="en").page)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("it", response.json()["languages"])
+
+    def test_page_detail_last_modified(self):
+        url = reverse("page-detail", kwargs={"language": "en", "path": "page-0"})
+        response = self.client.get(url)
+        last_modified = response.headers["Last-Modified"]
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_page_tree_validator_changes_with_pages(self):
+        url = reverse("page-tree-list", kwargs={"language": "en"})
+        etag = self.assertNotModified(url)
+
+        PageUrl.objects.get(path="page-0", language="en").page.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_validators_change_with_translations(self):
+        urls = (
+            reverse("page-tree-list", kwargs={"language": "en"}),
+            reverse("page-list", kwargs={"language": "en"}),
+        )
+        etags = {url: self.assertNotModified(url) for url in urls}
+
+        create_page_content("it", "Pagina 0", PageUrl.objects.get(path="page-0", language="en").page)
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etags[url])
+                self.assertEqual(response.status_code, 200)
+
+    def test_preview_is_not_conditional(self):
+        self.client.force_login(self.user)
+        url = reverse("page-tree-list", kwargs={"language": "en"}) + "?preview=1"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response.headers)
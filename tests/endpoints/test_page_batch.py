@@ -0,0 +1,94 @@
+from cms.api import add_plugin, create_page
+from cms.models import PageContent, PageUrl
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.reverse import reverse
+
+from djangocms_rest.routing import route_table
+from djangocms_rest.serializers.utils.prefetch import prefetch_templates
+from tests.base import BaseCMSRestTestCase
+
+
+class PageBatchAPITestCase(BaseCMSRestTestCase):
+    """
+    Test the page batch endpoint ('/api/{language}/pages-batch/?path=...').
+
+    Verifies:
+    - Each requested path maps to the same payload as the page detail endpoint
+    - Unknown and hidden paths are reported as errors, not as a failed request
+    - The number of queries does not grow with the number of pages
+    - Inherited templates are resolved for all pages at once
+    - Missing or too many paths are rejected
+    """
+
+    def setUp(self):
+        cache.clear()
+        route_table.clear()
+        self.url = reverse("page-batch", kwargs={"language": "en"})
+        self.paths = list(PageUrl.objects.filter(language="en").exclude(path="").values_list("path", flat=True))
+        for page_url in PageUrl.objects.filter(path__in=self.paths[:3]):
+            placeholder = page_url.page.get_placeholders("en").get(slot="content")
+            add_plugin(placeholder, "TextPlugin", "en", body=f"<p>{page_url.path}</p>")
+
+    def test_get(self):
+        response = self.client.get(self.url, {"path": self.paths[:3]})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(list(data["results"]), self.paths[:3])
+        self.assertEqual(data["errors"], {})
+
+        for path in self.paths[:3]:
+            detail = self.client.get(reverse("page-detail", kwargs={"language": "en", "path": path})).json()
+            self.assertEqual(data["results"][path], detail)
+
+    def test_errors(self):
+        create_page("secret", language="en", template="INHERIT", login_required=True)
+        response = self.client.get(self.url, {"path": [self.paths[0], "/nonexistent/", "secret"]})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(list(data["results"]), [self.paths[0]])
+        self.assertEqual(set(data["errors"]), {"nonexistent", "secret"})
+
+        self.client.force_login(self.user)
+        data = self.client.get(self.url, {"path": "secret"}).json()
+        self.assertEqual(list(data["results"]), ["secret"])
+
+    def test_constant_queries(self):
+        def count_queries(paths):
+            cache.clear()
+            route_table.clear()
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(len(self.client.get(self.url, {"path": paths}).json()["results"]), len(paths))
+            return [query["sql"] for query in queries]
+
+        few, many = count_queries(self.paths[:2]), count_queries(self.paths)
+        self.assertEqual(len(many), len(few), "\n".join(many))
+
+    def test_sparse_fieldsets(self):
+        data = self.client.get(self.url, {"path": self.paths[:2], "fields": "title,path"}).json()
+        for result in data["results"].values():
+            self.assertEqual(set(result), {"title", "path"})
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        response = self.client.get(self.url, {"path": [f"page-{i}" for i in range(101)]})
+        self.assertEqual(response.status_code, 400)
+
+        url = reverse("page-batch", kwargs={"language": "xx"})
+        self.assertEqual(self.client.get(url, {"path": self.paths[0]}).status_code, 404)
+
+    def test_prefetch_templates(self):
+        parent = create_page("sekizai", language="en", template="page.html")
+        child = create_page("child", language="en", template="INHERIT", parent=parent)
+        grandchild = create_page("grandchild", language="en", template="INHERIT", parent=child)
+        PageContent.objects.filter(page=parent).update(template="plugin_with_sekizai.html")
+        contents = list(PageContent.objects.filter(language="en").select_related("page"))
+
+        with self.assertNumQueries(1):
+            prefetch_templates(contents)
+        with self.assertNumQueries(0):
+            templates = {content.page_id: content.get_template() for content in contents}
+        for content in PageContent.objects.filter(language="en"):
+            self.assertEqual(templates[content.page_id], content.get_template())
+        self.assertEqual(templates[grandchild.pk], "plugin_with_sekizai.html")
@@ -59,3 +59,16 @@ class PageDetailAPITestCase(BaseCMSRestTestCase):
             reverse("page-detail", kwargs={"language": "en", "path": "page-0"})
         )
         self.assertEqual(response.status_code, 200)
+
+    def test_selective_placeholder_embedding(self):
+        url = reverse("page-detail", kwargs={"language": "en", "path": "page-0"})
+
+        placeholders = self.client.get(url, {"placeholders": "content"}).json()["placeholders"]
+        self.assertIn("content", placeholders[0])
+
+        for value in ("none", "sidebar"):
+            with self.subTest(placeholders=value):
+                placeholders = self.client.get(url, {"placeholders": value}).json()["placeholders"]
+                self.assertEqual(placeholders[0]["slot"], "content")
+                self.assertNotIn("content", placeholders[0])
+                self.assertIn("details", placeholders[0])
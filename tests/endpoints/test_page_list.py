@@ -1,8 +1,15 @@
+from cms.api import create_page, create_page_content
+from cms.models import ACCESS_PAGE_AND_DESCENDANTS, PagePermission, PageUrl
+from django.contrib.auth.models import AnonymousUser, Group, Permission
 from django.contrib.sites.models import Site
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from djangocms_rest.permissions import get_viewable_page_ids
 from djangocms_rest.utils import get_site_filtered_queryset
 from rest_framework.reverse import reverse
 
-from tests.base import BaseCMSRestTestCase
+from tests.base import BaseCMSRestTestCase, User
 from tests.types import PAGE_META_FIELD_TYPES
 from tests.utils import assert_field_types
 
@@ -111,3 +118,164 @@ class PageListAPITestCase(BaseCMSRestTestCase):
         self.assertIn("results", data)
         self.assertIsInstance(results, list)
         self.assertEqual(data["count"], 0)
+
+    def test_paginated_list_queries_do_not_grow_with_site(self):
+        """Only the requested slice of pages is loaded, independent of the number of pages"""
+
+        url = reverse("page-list", kwargs={"language": "en"}) + "?limit=2"
+        self.client.get(url)  # Warm up caches (site, languages, ...)
+        with CaptureQueriesContext(connection) as before:
+            response = self.client.get(url)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+        for i in range(5):
+            create_page(f"extra page {i}", language="en", template="INHERIT")
+
+        with CaptureQueriesContext(connection) as after:
+            response = self.client.get(url)
+        data = response.json()
+        self.assertEqual(len(data["results"]), 2)
+        self.assertEqual(data["count"], get_site_filtered_queryset(Site.objects.get_current()).count())
+        self.assertEqual(len(before), len(after))
+
+    def test_list_excludes_login_required_pages_for_anonymous(self):
+
+        create_page("secret page", language="en", template="INHERIT", login_required=True)
+        url = reverse("page-list", kwargs={"language": "en"}) + "?limit=100"
+
+        titles = [page["title"] for page in self.client.get(url).json()["results"]]
+        self.assertNotIn("secret page", titles)
+
+        self.client.force_login(self.user)
+        titles = [page["title"] for page in self.client.get(url).json()["results"]]
+        self.assertIn("secret page", titles)
+
+    def test_list_falls_back_to_other_language(self):
+
+        page = create_page("english only", language="en", template="INHERIT")
+        url = reverse("page-list", kwargs={"language": "it"}) + "?limit=100"
+
+        results = self.client.get(url).json()["results"]
+        self.assertIn(("english only", "en"), [(item["title"], item["language"]) for item in results])
+
+        create_page_content("it", "solo italiano", page)
+        results = self.client.get(url).json()["results"]
+        titles = [item["title"] for item in results]
+        self.assertIn("solo italiano", titles)
+        self.assertNotIn("english only", titles)
+
+    @override_settings(CMS_PERMISSION=True)
+    def test_list_excludes_view_restricted_pages(self):
+        restricted = create_page("restricted page", language="en", template="INHERIT")
+        create_page("restricted child", language="en", template="INHERIT", parent=restricted)
+        PagePermission.objects.create(
+            page=restricted, user=self.user, can_view=True, grant_on=ACCESS_PAGE_AND_DESCENDANTS
+        )
+        url = reverse("page-list", kwargs={"language": "en"}) + "?limit=100"
+
+        data = self.client.get(url).json()
+        titles = [page["title"] for page in data["results"]]
+        self.assertNotIn("restricted page", titles)
+        self.assertNotIn("restricted child", titles)
+        self.assertIn("page 0", titles)
+        self.assertEqual(data["count"], len(titles))
+
+        self.client.force_login(self.user)
+        titles = [page["title"] for page in self.client.get(url).json()["results"]]
+        self.assertIn("restricted page", titles)
+        self.assertIn("restricted child", titles)
+
+    @override_settings(CMS_PERMISSION=True)
+    def test_viewable_page_ids_are_cached_per_group(self):
+        restricted = create_page("restricted page", language="en", template="INHERIT")
+        group = Group.objects.create(name="intranet")
+        permission = PagePermission.objects.create(
+            page=restricted, group=group, can_view=True, grant_on=ACCESS_PAGE_AND_DESCENDANTS
+        )
+        alice = User.objects.create_user("alice", password="pass")
+        bob = User.objects.create_user("bob", password="pass")
+        alice.groups.add(group)
+        bob.groups.add(group)
+        site = Site.objects.get_current()
+
+        self.assertIsNone(get_viewable_page_ids(alice, site))
+        with self.assertNumQueries(1):  # The permission fingerprint of the user
+            self.assertIsNone(get_viewable_page_ids(bob, site))
+
+        self.assertEqual(get_viewable_page_ids(AnonymousUser(), site), (True, frozenset([restricted.pk])))
+
+        permission.delete()
+        self.assertIsNone(get_viewable_page_ids(AnonymousUser(), site))
+
+    @override_settings(CMS_PERMISSION=True)
+    def test_logged_in_user_with_own_permissions(self):
+        restricted = create_page("restricted page", language="en", template="INHERIT")
+        group = Group.objects.create(name="intranet")
+        PagePermission.objects.create(
+            page=restricted, group=group, can_view=True, grant_on=ACCESS_PAGE_AND_DESCENDANTS
+        )
+        user = User.objects.create_user("carol", password="pass")
+        user.user_permissions.add(
+            Permission.objects.get(codename="view_page"), Permission.objects.get(codename="add_page")
+        )
+        self.client.force_login(user)
+        list_url = reverse("page-list", kwargs={"language": "en"}) + "?limit=100"
+        tree_url = reverse("page-tree-list", kwargs={"language": "en"})
+
+        response = self.client.get(list_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("restricted page", [page["title"] for page in response.json()["results"]])
+        response = self.client.get(tree_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("restricted page", [page["title"] for page in response.json()])
+
+        # The user keeps permissions of their own, so their permission fingerprint does not change
+        user.user_permissions.remove(Permission.objects.get(codename="view_page"))
+        titles = [page["title"] for page in self.client.get(list_url).json()["results"]]
+        self.assertNotIn("restricted page", titles)
+        self.assertIn("page 0", titles)
+
+    def test_list_without_count(self):
+        url = reverse("page-list", kwargs={"language": "en"})
+        total = self.client.get(url).json()["count"]
+
+        data = self.client.get(url + "?limit=2&count=false").json()
+        self.assertNotIn("count", data)
+        self.assertEqual(len(data["results"]), 2)
+        self.assertIn("offset=2", data["next"])
+
+        data = self.client.get(url + f"?limit=2&offset={total - 2}&count=false").json()
+        self.assertEqual(len(data["results"]), 2)
+        self.assertIsNone(data["next"])
+
+    def test_cursor_pagination(self):
+        """Walking the list with cursors returns every page exactly once in tree order"""
+        url = reverse("page-list", kwargs={"language": "en"})
+        expected = [page["path"] for page in self.client.get(url + "?limit=100").json()["results"]]
+
+        paths = []
+        next_url = url + "?cursor=&limit=3"
+        while next_url:
+            data = self.client.get(next_url).json()
+            self.assertNotIn("count", data)
+            self.assertLessEqual(len(data["results"]), 3)
+            paths += [page["path"] for page in data["results"]]
+            next_url = data["next"]
+        self.assertEqual(paths, expected)
+
+    def test_cursor_pagination_is_stable_under_changes(self):
+        """Removing pages before the cursor position does not shift the following results"""
+        url = reverse("page-list", kwargs={"language": "en"})
+        data = self.client.get(url + "?cursor=&limit=3").json()
+        remaining = [
+            page["path"] for page in self.client.get(url + "?limit=100&offset=3").json()["results"]
+        ]
+
+        PageUrl.objects.get(path=data["results"][1]["path"], language="en").page.delete()
+        paths = []
+        next_url = data["next"]
+        while next_url:
+            data = self.client.get(next_url).json()
+            paths += [page["path"] for page in data["results"]]
+            next_url = data["next"]
+        self.assertEqual(paths, remaining)
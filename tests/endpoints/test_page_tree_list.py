@@ -1,6 +1,13 @@
+import json
+
+from cms.api import create_page
+from cms.models import PageContent
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.reverse import reverse
+from rest_framework.test import APIRequestFactory
 
-from djangocms_rest.serializers.pages import PageMetaSerializer, PageTreeSerializer
+from djangocms_rest.serializers.pages import PageMetaSerializer, PageTreeSerializer, stream_page_tree
 from tests.base import BaseCMSRestTestCase
 from tests.types import PAGE_TREE_META_FIELD_TYPES
 from tests.utils import assert_field_types
@@ -82,3 +89,106 @@ class PageTreeListAPITestCase(BaseCMSRestTestCase):
         """Test that PageMetaSerializer.many_init returns a PageTreeSerializer instance"""
         serializer = PageMetaSerializer.many_init(context={})
         self.assertIsInstance(serializer, PageTreeSerializer)
+
+    def test_tree_queries_do_not_grow_with_tree(self):
+        """The number of queries for the page tree is independent of the number of pages"""
+        url = reverse("page-tree-list", kwargs={"language": "en"})
+        self.client.get(url)  # Warm up caches (site, languages, ...)
+        with CaptureQueriesContext(connection) as before:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        parent = None
+        for i in range(5):
+            parent = create_page(f"nested page {i}", language="en", template="INHERIT", parent=parent)
+
+        with CaptureQueriesContext(connection) as after:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(before), len(after))
+
+        # The nested pages are placed correctly within the tree
+        node = {"children": response.json()}
+        for i in range(5):
+            node = next(child for child in node["children"] if child["title"] == f"nested page {i}")
+        self.assertEqual(node["children"], [])
+
+    def test_streamed_tree_matches_tree(self):
+        """The streamed tree has the same content as the regular response"""
+        # A hidden page hides its descendants in the tree
+        hidden = create_page("hidden page", language="en", template="INHERIT", login_required=True)
+        create_page("orphaned page", language="en", template="INHERIT", parent=hidden)
+        url = reverse("page-tree-list", kwargs={"language": "en"})
+        expected = self.client.get(url).json()
+
+        response = self.client.get(url + "?stream=1")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(b"".join(response.streaming_content)), expected)
+
+    def test_stream_page_tree_chunks(self):
+        """Chunk boundaries do not change the streamed tree"""
+        request = APIRequestFactory().get("/")
+        page_contents = PageContent.objects.filter(language="en").select_related("page").order_by("page__path")
+        child = PageMetaSerializer(context={"request": request})
+        expected = json.loads(b"".join(stream_page_tree(page_contents, child)))
+
+        for chunk_size in (1, 2, 3):
+            with self.subTest(chunk_size=chunk_size):
+                data = json.loads(b"".join(stream_page_tree(page_contents, child, chunk_size=chunk_size)))
+                self.assertEqual(data, expected)
+
+    def test_stream_empty_tree(self):
+        child = PageMetaSerializer(context={})
+        self.assertEqual(b"".join(stream_page_tree([], child)), b"[]")
+
+    def test_depth_and_root(self):
+        """
+        ``?depth=`` limits the levels of the tree and ``?root=`` returns the tree below a page.
+        ``children_count`` allows to lazy-load levels beyond the depth limit.
+        """
+        parent = None
+        for i in range(4):
+            parent = create_page(f"nested page {i}", language="en", template="INHERIT", parent=parent)
+
+        def truncate(nodes, depth):
+            return [
+                {**node, "children": truncate(node["children"], depth - 1) if depth > 1 else []}
+                for node in nodes
+            ]
+
+        url = reverse("page-tree-list", kwargs={"language": "en"})
+        full_tree = self.client.get(url).json()
+        nested = next(node for node in full_tree if node["title"] == "nested page 0")
+        self.assertEqual(nested["children_count"], 1)
+
+        for depth in (1, 2, 3):
+            with self.subTest(depth=depth):
+                response = self.client.get(url, {"depth": depth})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), truncate(full_tree, depth))
+
+        response = self.client.get(url, {"root": nested["path"], "depth": 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), truncate(nested["children"], 2))
+        self.assertEqual(response.json()[0]["children"][0]["children_count"], 1)
+
+        # The streamed tree is limited the same way
+        response = self.client.get(url, {"root": nested["path"], "depth": 2, "stream": 1})
+        self.assertEqual(json.loads(b"".join(response.streaming_content)), truncate(nested["children"], 2))
+
+        leaf = nested["children"][0]["children"][0]["children"][0]
+        response = self.client.get(url, {"root": leaf["path"]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+
+    def test_invalid_depth_and_root(self):
+        url = reverse("page-tree-list", kwargs={"language": "en"})
+        self.assertEqual(self.client.get(url, {"depth": "0"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"depth": "x"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"root": "does-not-exist"}).status_code, 404)
+
+        hidden = create_page("hidden root", language="en", template="INHERIT", login_required=True)
+        path = hidden.get_path("en")
+        self.assertEqual(self.client.get(url, {"root": path}).status_code, 404)
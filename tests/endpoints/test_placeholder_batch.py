@@ -0,0 +1,111 @@
+from collections import Counter
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from cms.api import add_plugin, create_page
+from cms.models import PageUrl
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.reverse import reverse
+
+from djangocms_rest.serializers.utils.cache import get_placeholder_rest_cache_many
+from tests.base import BaseCMSRestTestCase
+
+
+class PlaceholderBatchAPITestCase(BaseCMSRestTestCase):
+    """
+    Test the placeholder batch endpoint ('/api/{language}/placeholders-batch/?placeholder=...').
+
+    Verifies:
+    - Each identifier maps to the same payload as the placeholder detail endpoint
+    - Unknown and hidden placeholders are reported as errors
+    - Cache misses are written back and later requests are served from the cache
+    - The cache is read and written with a constant number of round-trips
+    - Invalid identifiers are rejected
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("placeholder-batch", kwargs={"language": "en"})
+        self.placeholders = []
+        for page_url in PageUrl.objects.filter(language="en").exclude(path="")[:3]:
+            placeholder = page_url.page.get_placeholders("en").get(slot="content")
+            add_plugin(placeholder, "TextPlugin", "en", body=f"<p>{page_url.path}</p>")
+            self.placeholders.append(placeholder)
+        self.identifiers = [self.get_identifier(placeholder) for placeholder in self.placeholders]
+
+    @staticmethod
+    def get_identifier(placeholder):
+        return f"{placeholder.content_type_id}/{placeholder.object_id}/{placeholder.slot}"
+
+    def test_get(self):
+        response = self.client.get(self.url, {"placeholder": self.identifiers})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(list(data["results"]), self.identifiers)
+        self.assertEqual(data["errors"], {})
+
+        for identifier, placeholder in zip(self.identifiers, self.placeholders):
+            url = reverse("placeholder-detail", args=["en", *identifier.split("/")])
+            self.assertEqual(data["results"][identifier], self.client.get(url).json())
+            self.assertEqual(data["results"][identifier]["content"][0]["plugin_type"], "TextPlugin")
+
+    def test_errors(self):
+        hidden = create_page("secret", language="en", template="INHERIT", login_required=True)
+        hidden_identifier = self.get_identifier(hidden.get_placeholders("en").get(slot="content"))
+        unknown_identifier = f"{self.placeholders[0].content_type_id}/0/content"
+        identifiers = [self.identifiers[0], unknown_identifier, hidden_identifier]
+        data = self.client.get(self.url, {"placeholder": identifiers}).json()
+        self.assertEqual(list(data["results"]), [self.identifiers[0]])
+        self.assertEqual(set(data["errors"]), {unknown_identifier, hidden_identifier})
+
+    def test_cache(self):
+        self.client.get(self.url, {"placeholder": self.identifiers})
+        cached = get_placeholder_rest_cache_many(self.placeholders, "en", 1, None)
+        self.assertEqual(set(cached), {placeholder.pk for placeholder in self.placeholders})
+
+        with CaptureQueriesContext(connection) as queries:
+            data = self.client.get(self.url, {"placeholder": self.identifiers}).json()
+        self.assertFalse([query for query in queries if "cms_cmsplugin" in query["sql"]])
+        self.assertEqual(data["results"][self.identifiers[0]]["content"][0]["plugin_type"], "TextPlugin")
+
+    @contextmanager
+    def count_cache_calls(self):
+        """Counts the cache calls of the code under test (not the calls a backend makes to itself)."""
+        calls, depth = Counter(), [0]
+
+        def counted(name, method):
+            def wrapper(*args, **kwargs):
+                if not depth[0]:
+                    calls[name] += 1
+                depth[0] += 1
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    depth[0] -= 1
+
+            return wrapper
+
+        with patch.multiple(
+            cache, **{name: counted(name, getattr(cache, name)) for name in ("get", "set", "get_many", "set_many")}
+        ):
+            yield calls
+
+    def test_cache_round_trips(self):
+        with self.count_cache_calls() as calls:
+            self.client.get(self.url, {"placeholder": self.identifiers})
+        # Versions read (no entries without versions), versions read for the write, entries written
+        self.assertEqual(calls, {"get_many": 2, "set_many": 1})
+
+        with self.count_cache_calls() as calls:
+            self.client.get(self.url, {"placeholder": self.identifiers})
+        self.assertEqual(calls, {"get_many": 2})
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        for identifier in ("content", "1/content", "a/1/content", "1/1/"):
+            with self.subTest(identifier=identifier):
+                self.assertEqual(self.client.get(self.url, {"placeholder": identifier}).status_code, 400)
+        response = self.client.get(self.url, {"placeholder": [f"1/{i}/content" for i in range(101)]})
+        self.assertEqual(response.status_code, 400)
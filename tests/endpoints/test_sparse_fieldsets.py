@@ -0,0 +1,89 @@
+import json
+from unittest.mock import patch
+
+from cms.api import add_plugin
+from cms.models import PageUrl
+from django.core.cache import cache
+from rest_framework.reverse import reverse
+
+from djangocms_rest.plugin_rendering import RESTRenderer
+from tests.base import BaseCMSRestTestCase
+
+
+class SparseFieldsetTestCase(BaseCMSRestTestCase):
+    """
+    Test the ``?fields=`` and ``?omit=`` query parameters.
+
+    Verifies:
+    - Page list, tree and detail responses only contain the requested fields
+    - Nested placeholder fields can be selected or omitted with dotted names
+    - Omitted placeholder content is not serialized at all
+    - Placeholder detail responses honour the parameters, too
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.page = PageUrl.objects.get(path="page-0", language="en").page
+        self.placeholder = self.page.get_placeholders("en").get(slot="content")
+        add_plugin(self.placeholder, "TextPlugin", "en", body="<p>Sparse</p>")
+
+    def test_page_list(self):
+        url = reverse("page-list", kwargs={"language": "en"})
+        results = self.client.get(url, {"fields": "title,path,details"}).json()["results"]
+        self.assertTrue(results)
+        for result in results:
+            self.assertEqual(list(result), ["title", "path", "details"])
+
+        result = self.client.get(url, {"omit": "languages,details"}).json()["results"][0]
+        self.assertNotIn("languages", result)
+        self.assertNotIn("details", result)
+        self.assertIn("title", result)
+
+    def test_page_tree(self):
+        url = reverse("page-tree-list", kwargs={"language": "en"})
+        for stream in ("0", "1"):
+            with self.subTest(stream=stream):
+                response = self.client.get(url, {"fields": "title", "stream": stream})
+                content = b"".join(response.streaming_content) if response.streaming else response.content
+                tree = json.loads(content)
+                self.assertEqual(set(tree[0]), {"title", "children"})
+                self.assertEqual(set(tree[0]["children"][0]), {"title", "children"})
+
+        tree = self.client.get(url, {"fields": "children_count"}).json()
+        self.assertEqual(set(tree[0]), {"children_count", "children"})
+
+    def test_page_detail(self):
+        url = reverse("page-detail", kwargs={"language": "en", "path": "page-0"})
+        data = self.client.get(url, {"fields": "title,placeholders.slot"}).json()
+        self.assertEqual(set(data), {"title", "placeholders"})
+        self.assertEqual({key for placeholder in data["placeholders"] for key in placeholder}, {"slot"})
+
+        data = self.client.get(url, {"omit": "placeholders"}).json()
+        self.assertNotIn("placeholders", data)
+        self.assertIn("title", data)
+
+    def test_omitted_content_is_not_serialized(self):
+        url = reverse("page-detail", kwargs={"language": "en", "path": "page-0"})
+        with patch.object(RESTRenderer, "serialize_placeholder", autospec=True, return_value=[]) as serialize:
+            data = self.client.get(url, {"omit": "placeholders.content"}).json()
+            serialize.assert_not_called()
+            self.client.get(url)
+            serialize.assert_called()
+
+        self.assertTrue(data["placeholders"])
+        for placeholder in data["placeholders"]:
+            self.assertNotIn("content", placeholder)
+            self.assertIn("details", placeholder)
+
+    def test_placeholder_detail(self):
+        url = reverse(
+            "placeholder-detail",
+            args=["en", self.placeholder.content_type_id, self.placeholder.object_id, "content"],
+        )
+        data = self.client.get(url, {"fields": "slot,content"}).json()
+        self.assertEqual(set(data), {"slot", "content"})
+        self.assertEqual(data["content"][0]["plugin_type"], "TextPlugin")
+
+        data = self.client.get(url, {"omit": "content"}).json()
+        self.assertNotIn("content", data)
+        self.assertIn("details", data)
@@ -175,6 +175,7 @@ ROOT_URLCONF = "tests.urls"
 
 STATIC_URL = "/static/"
 MEDIA_URL = "/media/"
+MEDIA_ROOT = mkdtemp()
 
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 
@@ -0,0 +1,78 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from cms.api import create_page
+from cms.models import PageContent
+from django.core.management import call_command
+from django.test import override_settings
+
+from tests.base import BaseCMSRestTestCase
+
+
+@override_settings(ALLOWED_HOSTS=["example.com"])
+class ExportRestAPITestCase(BaseCMSRestTestCase):
+    """
+    Test the ``export_rest_api`` management command.
+
+    Verifies:
+    - Languages, pages, placeholders and menus are written in a layout mirroring the URLs
+    - Pages which require a login are not exported
+    - Unchanged files are not rewritten, changed ones are
+    - An interrupted export can be resumed
+    """
+
+    def setUp(self):
+        self.output = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.site_dir = self.output / "example.com" / "api"
+
+    def export(self, *args):
+        stdout = StringIO()
+        call_command("export_rest_api", str(self.output), *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def read(self, *parts):
+        return json.loads(self.site_dir.joinpath(*parts, "index.json").read_text())
+
+    def test_export(self):
+        create_page("secret", language="en", template="INHERIT", login_required=True)
+        output = self.export()
+        self.assertIn("pages/s", output)
+
+        self.assertEqual(self.read("languages")[0]["code"], "en")
+        page = self.read("en", "pages", "page-1")
+        self.assertEqual(page["title"], "page 1")
+        self.assertTrue(page["details"].startswith("https://example.com/api/en/pages/page-1/"))
+        self.assertEqual(self.read("en", "pages")["is_home"], True)
+        self.assertTrue(self.read("en", "menu"))
+        self.assertTrue(self.read("en", "pages-tree"))
+
+        placeholder = page["placeholders"][0]["details"].removeprefix("https://example.com/api/")
+        self.assertEqual(self.read(*placeholder.strip("/").split("/"))["slot"], "content")
+        self.assertFalse(self.site_dir.joinpath("en", "pages", "secret").exists())
+
+        manifest = json.loads((self.output / "manifest.json").read_text())
+        self.assertIn("example.com/api/en/pages/page-1/", manifest)
+        self.assertFalse((self.output / ".export-journal").exists())
+
+    def test_unchanged_files_are_not_rewritten(self):
+        self.export()
+        file_path = self.site_dir / "en" / "pages" / "page-1" / "index.json"
+        mtime = file_path.stat().st_mtime_ns
+
+        self.assertIn("(0 written", self.export())
+        self.assertEqual(file_path.stat().st_mtime_ns, mtime)
+
+        PageContent.objects.filter(page__urls__path="page-1", language="en").update(title="Changed")
+        self.assertNotIn("(0 written", self.export())
+        self.assertEqual(self.read("en", "pages", "page-1")["title"], "Changed")
+
+    def test_resume(self):
+        journal = self.output / ".export-journal"
+        journal.write_text("example.com/api/en/pages/page-1/\tabc\n")
+        self.export("--resume")
+        self.assertFalse(self.site_dir.joinpath("en", "pages", "page-1", "index.json").exists())
+        self.assertTrue(self.site_dir.joinpath("en", "pages", "page-2", "index.json").exists())
+        manifest = json.loads((self.output / "manifest.json").read_text())
+        self.assertEqual(manifest["example.com/api/en/pages/page-1/"], "abc")
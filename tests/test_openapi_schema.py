@@ -90,6 +90,7 @@ class OpenAPISchemaTestCase(RESTTestCase):
 
         # Expected serializers based on our API
         expected_serializers = [
+            "ChangeFeed",
             "Language",
             "PageContent",
             "PageMeta",
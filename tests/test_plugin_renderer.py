@@ -2,17 +2,24 @@ import json
 from django.urls import reverse
 from tests.base import BaseCMSRestTestCase
 
+from django.contrib.auth.models import AnonymousUser
 from django.contrib.contenttypes.models import ContentType
 from django.core.files import File
+from django.db import connection
+from django.template import Context
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 
 
 from cms import api
-from cms.models import PageContent
+from cms.models import PageContent, Placeholder
 from cms.toolbar.utils import get_object_edit_url, get_object_preview_url
 
 from filer.models.imagemodels import Image
 from bs4 import BeautifulSoup
 
+from djangocms_rest.plugin_rendering import RESTRenderer
+
 
 def get_text_from_html(html, selector):
     soup = BeautifulSoup(html, "html.parser")
@@ -194,3 +201,64 @@ class PlaceholdersAPITestCase(BaseCMSRestTestCase):
         self.assertContains(
             response, '<span class="key">"float"</span>: <span class="num">3.14</span>'
         )
+
+    def test_prefetch_plugins_batches_placeholders(self):
+        """Plugins of several placeholders are loaded with the same number of queries as for one"""
+        page_content = self.page.get_admin_content("en")
+        for i in range(3):
+            placeholder = Placeholder.objects.create(source=page_content, slot=f"extra-{i}")
+            parent = api.add_plugin(placeholder, "DummyParentPlugin", "en")
+            api.add_plugin(placeholder, "DummyNumberPlugin", "en", target=parent)
+            api.add_plugin(placeholder, "DummyNumberPlugin", "en")
+
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+
+        def serialize(slots):
+            placeholders = list(Placeholder.objects.filter(slot__in=slots).order_by("slot"))
+            renderer = RESTRenderer(request)
+            with CaptureQueriesContext(connection) as queries:
+                renderer.prefetch_plugins(placeholders, "en", use_cache=False)
+                content = [
+                    renderer.serialize_placeholder(placeholder, Context(), "en", use_cache=False)
+                    for placeholder in placeholders
+                ]
+            return content, len(queries)
+
+        serialize(["extra-0"])  # Warm up caches
+        one, one_queries = serialize(["extra-0"])
+        three, three_queries = serialize(["extra-0", "extra-1", "extra-2"])
+        self.assertEqual(one_queries, three_queries)
+        self.assertEqual(three[0], one[0])
+        self.assertEqual([len(content) for content in three], [2, 2, 2])
+
+        # Same result as serializing each placeholder on its own
+        placeholder = Placeholder.objects.get(slot="extra-0")
+        self.assertEqual(
+            RESTRenderer(request).serialize_placeholder(placeholder, Context(), "en", use_cache=False), one[0]
+        )
+
+    def test_serialize_plugins_loads_relations_per_type(self):
+        """Foreign keys of plugins are loaded once per plugin type, not once per plugin"""
+        placeholder = Placeholder.objects.create(source=self.page.get_admin_content("en"), slot="links")
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+
+        def serialize():
+            renderer = RESTRenderer(request)
+            with CaptureQueriesContext(connection) as queries:
+                content = renderer.serialize_placeholder(
+                    Placeholder.objects.get(pk=placeholder.pk), Context(), "en", use_cache=False
+                )
+            return content, len(queries)
+
+        api.add_plugin(placeholder, "DummyLinkPlugin", "en", label="link", page=self.page)
+        serialize()  # Warm up caches
+        one, one_queries = serialize()
+        for _ in range(4):
+            api.add_plugin(placeholder, "DummyLinkPlugin", "en", label="link", page=self.page)
+        five, five_queries = serialize()
+
+        self.assertEqual(one_queries, five_queries)
+        self.assertEqual(len(five), 5)
+        self.assertEqual({plugin["page"] for plugin in five}, {one[0]["page"]})
@@ -0,0 +1,104 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from cms.models import PageContent, PageUrl
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.reverse import reverse
+
+from djangocms_rest.purge import HTTPPurgeBackend, placeholder_operation
+from tests.base import BaseCMSRestTestCase
+
+
+@override_settings(REST_SURROGATE_KEYS=True)
+class SurrogateKeyTestCase(BaseCMSRestTestCase):
+    """
+    Test the surrogate key headers and the purge dispatcher.
+
+    Verifies:
+    - Responses are tagged with the site, language, page, placeholder and menu keys
+    - Cached page responses keep their keys
+    - Changes are purged by key through the configured backend once committed
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.page = PageUrl.objects.get(path="page-1", language="en").page
+        self.page_content = PageContent.objects.get(page=self.page, language="en")
+        self.placeholder = self.page_content.placeholders.get(slot="content")
+        self.purge_file = Path(self.enterContext(tempfile.TemporaryDirectory())) / "purged"
+
+    def get_keys(self, response):
+        self.assertEqual(response.status_code, 200)
+        return set(response["Surrogate-Key"].split(" "))
+
+    def test_page_detail(self):
+        keys = self.get_keys(self.client.get(reverse("page-detail", kwargs={"language": "en", "path": "page-1"})))
+        self.assertEqual(
+            keys, {"site:1", "lang:en", f"page:{self.page.pk}", f"placeholder:{self.placeholder.pk}"}
+        )
+
+    @override_settings(REST_PAGE_CACHE=True)
+    def test_cached_page_detail(self):
+        url = reverse("page-detail", kwargs={"language": "en", "path": "page-1"})
+        self.assertEqual(self.get_keys(self.client.get(url)), self.get_keys(self.client.get(url)))
+        self.assertIn(f"page:{self.page.pk}", self.get_keys(self.client.get(url)))
+
+    def test_placeholder_detail(self):
+        url = reverse(
+            "placeholder-detail",
+            args=["en", self.placeholder.content_type_id, self.placeholder.object_id, self.placeholder.slot],
+        )
+        self.assertEqual(
+            self.get_keys(self.client.get(url)),
+            {"site:1", "lang:en", f"page:{self.page.pk}", f"placeholder:{self.placeholder.pk}"},
+        )
+
+    def test_menu_keys(self):
+        for url in (
+            reverse("page-tree-list", kwargs={"language": "en"}),
+            reverse("page-list", kwargs={"language": "en"}),
+            reverse("menu", kwargs={"language": "en"}),
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(self.get_keys(self.client.get(url)), {"site:1", "lang:en", "menu:1"})
+        self.assertEqual(self.get_keys(self.client.get(reverse("language-list"))), {"site:1"})
+
+    @override_settings(REST_SURROGATE_KEYS=False)
+    def test_disabled(self):
+        response = self.client.get(reverse("page-detail", kwargs={"language": "en", "path": "page-1"}))
+        self.assertNotIn("Surrogate-Key", response)
+
+    @override_settings(REST_SURROGATE_KEY_HEADER="Cache-Tag")
+    def test_cache_tag_header(self):
+        response = self.client.get(reverse("menu", kwargs={"language": "en"}))
+        self.assertEqual(response["Cache-Tag"], "site:1,lang:en,menu:1")
+
+    def test_purge(self):
+        backend = {"BACKEND": "djangocms_rest.purge.FilePurgeBackend", "OPTIONS": {"path": str(self.purge_file)}}
+        with override_settings(REST_PURGE_BACKEND=backend):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.page_content.title = "Changed"
+                self.page_content.save()
+            with self.captureOnCommitCallbacks(execute=True):
+                placeholder_operation(sender=PageContent, operation="add_plugin", placeholder=self.placeholder)
+
+        self.assertEqual(
+            self.purge_file.read_text().splitlines(),
+            [f"menu:1 page:{self.page.pk}", f"placeholder:{self.placeholder.pk}"],
+        )
+
+    def test_purge_not_configured(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.page_content.save()
+        self.assertEqual(callbacks, [])
+
+    def test_http_backend(self):
+        backend = HTTPPurgeBackend("https://cdn.example.com/purge", headers={"Fastly-Key": "secret"}, batch_size=2)
+        with patch("djangocms_rest.purge.urlopen") as urlopen:
+            backend.purge(["a", "b", "c"])
+        requests = [call.args[0] for call in urlopen.call_args_list]
+        self.assertEqual([request.get_header("Surrogate-key") for request in requests], ["a b", "c"])
+        self.assertEqual(requests[0].get_header("Fastly-key"), "secret")
+        self.assertEqual(requests[0].get_method(), "POST")
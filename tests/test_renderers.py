@@ -0,0 +1,92 @@
+import json
+import os
+import timeit
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.reverse import reverse
+
+from djangocms_rest import renderers
+from djangocms_rest.renderers import ORJSONRenderer
+from tests.base import BaseCMSRestTestCase
+
+
+class ORJSONRendererTestCase(BaseCMSRestTestCase):
+    """
+    Test the orjson-based JSON renderer.
+
+    Verifies:
+    - API responses are rendered with it and decode to the same data as with the stock renderer
+    - Lazy strings, decimals, datetimes, UUIDs and non-string keys are supported
+    - Indented output and missing orjson fall back to the stock renderer
+    """
+
+    def test_api_responses(self):
+        for url in (
+            reverse("page-detail", kwargs={"language": "en", "path": "page-1"}),
+            reverse("page-tree-list", kwargs={"language": "en"}),
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+                self.assertEqual(json.loads(response.content), json.loads(JSONRenderer().render(response.data)))
+
+    def test_types(self):
+        data = {
+            "lazy": gettext_lazy("Pages"),
+            "decimal": Decimal("1.5"),
+            "datetime": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "uuid": uuid.UUID(int=1),
+            1: "int key",
+            "separator": "a\u2028b",
+        }
+        self.assertEqual(
+            ORJSONRenderer().render(data),
+            b'{"lazy":"Pages","decimal":1.5,"datetime":"2024-01-02T03:04:05Z",'
+            b'"uuid":"00000000-0000-0000-0000-000000000001","1":"int key","separator":"a\\u2028b"}',
+        )
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_fallback(self):
+        data = {"a": [1, 2], "big": 2**70}
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(
+            ORJSONRenderer().render(data, "application/json; indent=4"),
+            JSONRenderer().render(data, "application/json; indent=4"),
+        )
+        with patch.object(renderers, "orjson", None):
+            self.assertEqual(ORJSONRenderer().render({"a": 1}), b'{"a":1}')
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+
+@skipUnless(os.environ.get("REST_BENCHMARK"), "Set REST_BENCHMARK=1 to run the benchmarks")
+class RendererBenchmark(BaseCMSRestTestCase):
+    """Compares the orjson renderer with DRF's stock JSON renderer on page detail and tree data.
+    Run with ``REST_BENCHMARK=1 python -m pytest -s tests/test_renderers.py``."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._create_pages([10, [5] * 10, [(3, 2)] * 10])
+
+    def benchmark(self, name, data, number=200):
+        stock = min(timeit.repeat(lambda: JSONRenderer().render(data), number=number, repeat=5))
+        fast = min(timeit.repeat(lambda: ORJSONRenderer().render(data), number=number, repeat=5))
+        print(
+            f"\n{name} ({len(JSONRenderer().render(data))} bytes): stock {stock / number * 1e6:.0f} µs, "
+            f"orjson {fast / number * 1e6:.0f} µs ({stock / fast:.1f}x)"
+        )
+        self.assertLess(fast, stock)
+
+    def test_page_detail(self):
+        response = self.client.get(reverse("page-detail", kwargs={"language": "en", "path": "page-1"}))
+        self.benchmark("Page detail", response.data)
+
+    def test_page_tree(self):
+        response = self.client.get(reverse("page-tree-list", kwargs={"language": "en"}))
+        self.benchmark("Page tree", response.data, number=20)
@@ -0,0 +1,69 @@
+from cms.api import create_page
+from cms.models import PageUrl
+from django.contrib.sites.models import Site
+from django.http import Http404
+
+from djangocms_rest.routing import route_table
+from djangocms_rest.utils import get_object
+from tests.base import BaseCMSRestTestCase
+
+
+class RouteTableTestCase(BaseCMSRestTestCase):
+    """
+    Test the cached route table behind ``get_object``.
+
+    Verifies:
+    - Known paths are resolved without a query, with the URLs of all languages cached
+    - Unknown paths are remembered and answered without a query
+    - Saving a page URL forgets all routes
+    - Moving a page (which changes the paths of its descendants in bulk) forgets all routes
+    """
+
+    def setUp(self):
+        route_table.clear()
+        self.site = Site.objects.get_current()
+
+    def test_known_path(self):
+        page = get_object(self.site, "page-1")
+        self.assertEqual(page, PageUrl.objects.get(path="page-1", language="en").page)
+        self.assertEqual(set(page.urls_cache), {"en"})
+
+        with self.assertNumQueries(0):
+            cached = get_object(self.site, "page-1")
+        self.assertEqual(cached, page)
+        self.assertEqual(cached.login_required, page.login_required)
+        self.assertEqual(set(cached.urls_cache), {"en"})
+
+    def test_unknown_path(self):
+        with self.assertRaises(Http404):
+            get_object(self.site, "zebra")
+        with self.assertNumQueries(0), self.assertRaises(Http404):
+            get_object(self.site, "zebra")
+
+        page = create_page("zebra", language="en", template="INHERIT")
+        self.assertEqual(get_object(self.site, "zebra"), page)
+
+    def test_page_url_saved(self):
+        page_url = PageUrl.objects.get(path="page-1", language="en")
+        get_object(self.site, "page-1")
+        page_url.path = page_url.slug = "renamed"
+        page_url.save()
+
+        with self.assertRaises(Http404):
+            get_object(self.site, "page-1")
+        self.assertEqual(get_object(self.site, "renamed"), page_url.page)
+
+    def test_page_moved(self):
+        parent = PageUrl.objects.get(path="page-1", language="en").page
+        child = get_object(self.site, "page-1/page-0")
+        parent.move_page(PageUrl.objects.get(path="page-0", language="en").page, "last-child")
+
+        with self.assertRaises(Http404):
+            get_object(self.site, "page-1/page-0")
+        self.assertEqual(get_object(self.site, "page-0/page-1/page-0"), child)
+
+    def test_other_site(self):
+        get_object(self.site, "page-1")
+        other_site = Site.objects.create(domain="other.example.com", name="other")
+        with self.assertRaises(Http404):
+            get_object(other_site, "page-1")
@@ -0,0 +1,120 @@
+from io import StringIO
+
+from cms.api import add_plugin, create_page
+from cms.models import PageContent
+from cms.signals import post_placeholder_operation
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from rest_framework.reverse import reverse
+
+from djangocms_rest.models import SearchEntry
+from djangocms_rest.search import (
+    SearchBackend,
+    SQLiteSearchBackend,
+    get_search_backend,
+    get_search_text,
+    rebuild_search_index,
+)
+from tests.base import BaseCMSRestTestCase
+
+
+@override_settings(REST_SEARCH_INDEX=True)
+class SearchIndexTestCase(BaseCMSRestTestCase):
+    """
+    Test the full-text search index of page contents.
+
+    Verifies:
+    - Placeholder content is indexed as plain text
+    - Search results are ranked (title matches first) and paginated
+    - Every search word has to match, the last one as a prefix
+    - Pages the user cannot see are not found
+    - Changed pages are re-indexed incrementally
+    """
+
+    def setUp(self):
+        self.title_page = create_page("Zebra crossing", language="en", template="INHERIT")
+        self.text_page = create_page("Animals", language="en", template="INHERIT")
+        placeholder = self.text_page.get_placeholders("en").get(slot="content")
+        add_plugin(placeholder, "TextPlugin", "en", body="<p>The <b>zebra</b> &amp; the lion</p>")
+        self.hidden_page = create_page("Hidden zebra", language="en", template="INHERIT", login_required=True)
+        rebuild_search_index()
+
+    def search(self, term, **params):
+        response = self.client.get(reverse("page-search", kwargs={"language": "en"}), {"q": term, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_index_contains_placeholder_text(self):
+        entry = SearchEntry.objects.get(page_content__page=self.text_page, language="en")
+        self.assertEqual(entry.title, "Animals")
+        self.assertIn("The zebra & the lion", entry.text)
+        self.assertNotIn("<b>", entry.text)
+
+    def test_uses_full_text_index(self):
+        self.assertIsInstance(get_search_backend(connection), SQLiteSearchBackend)
+
+    def test_ranked_results(self):
+        data = self.search("zebra")
+        self.assertEqual(data["count"], 2)
+        self.assertEqual([result["title"] for result in data["results"]], ["Zebra crossing", "Animals"])
+
+        data = self.search("zebra", limit=1)
+        self.assertEqual(len(data["results"]), 1)
+        self.assertIsNotNone(data["next"])
+
+    def test_all_words_and_prefix(self):
+        self.assertEqual([result["title"] for result in self.search("lion zeb")["results"]], ["Animals"])
+        self.assertEqual(self.search("lion tiger")["count"], 0)
+        self.assertEqual(self.search("*\"")["count"], 0)
+
+    def test_hidden_pages_are_not_found(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.search("hidden")["count"], 1)
+        self.client.logout()
+        self.assertEqual(self.search("hidden")["count"], 0)
+
+    def test_fallback_backend(self):
+        queryset = SearchBackend().filter(PageContent.objects.filter(language="en"), ["zebra"])
+        self.assertEqual(
+            list(queryset.order_by("-search_rank", "title").values_list("title", flat=True)),
+            ["Hidden zebra", "Zebra crossing", "Animals"],
+        )
+
+    def test_search_text(self):
+        data = [{"plugin_type": "LinkPlugin", "label": "Read <i>more</i>", "link": "https://example.com", "id": 1}]
+        self.assertEqual(list(get_search_text(data)), ["Read more"])
+
+    def test_placeholder_operation_reindexes_page(self):
+        placeholder = self.title_page.get_placeholders("en").get(slot="content")
+        add_plugin(placeholder, "TextPlugin", "en", body="<p>Giraffe</p>")
+        self.assertEqual(self.search("giraffe")["count"], 0)
+
+        request = RequestFactory().post("/")
+        request.user = self.user
+        with self.captureOnCommitCallbacks(execute=True):
+            post_placeholder_operation.send(
+                sender=PageContent, operation="add_plugin", request=request, placeholder=placeholder
+            )
+        self.assertEqual([result["title"] for result in self.search("giraffe")["results"]], ["Zebra crossing"])
+
+    def test_page_content_change_reindexes_page(self):
+        page_content = self.text_page.get_admin_content("en")
+        page_content.menu_title = "Savanna"
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            page_content.save()
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.search("savanna")["count"], 1)
+
+    def test_rebuild_command(self):
+        SearchEntry.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_rest_search_index", "--language", "en", stdout=out)
+        count = PageContent.objects.filter(language="en").count()
+        self.assertIn(f"Indexed {count} page contents", out.getvalue())
+        self.assertIn("Latency per page (ms)", out.getvalue())
+        self.assertEqual(SearchEntry.objects.count(), count)
+
+        # SQLite allows a single writer only: batches are indexed one after the other
+        call_command("rebuild_rest_search_index", "--workers", "2", "--batch-size", "2", stdout=out)
+        self.assertEqual(SearchEntry.objects.count(), PageContent.objects.count())
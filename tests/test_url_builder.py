@@ -0,0 +1,42 @@
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from djangocms_rest.url_builder import URLBuilder
+
+
+class URLBuilderTestCase(SimpleTestCase):
+    """
+    Test the precompiled URL builder.
+
+    Verifies:
+    - Built URLs are identical to reverse() for keyword and positional arguments
+    - Arguments are quoted like reverse() does
+    - Missing routes return None and are remembered
+    """
+
+    def setUp(self):
+        self.builder = URLBuilder()
+
+    def test_matches_reverse(self):
+        for path in ("page-0", "parent/child", "über uns", "a%b", "{braces}", "q?x=1#frag"):
+            with self.subTest(path=path):
+                kwargs = {"language": "en", "path": path}
+                self.assertEqual(
+                    self.builder.build("page-detail", kwargs=kwargs), reverse("page-detail", kwargs=kwargs)
+                )
+
+        args = ("en", 12, 345, "content")
+        self.assertEqual(self.builder.build("placeholder-detail", args=args), reverse("placeholder-detail", args=args))
+        self.assertEqual(
+            self.builder.build("page-root", kwargs={"language": "de"}), reverse("page-root", kwargs={"language": "de"})
+        )
+
+    def test_compiles_once(self):
+        self.builder.build("page-detail", kwargs={"language": "en", "path": "a"})
+        self.builder.build("page-detail", kwargs={"language": "de", "path": "b"})
+        self.assertEqual(len(self.builder.templates), 1)
+
+    def test_missing_route(self):
+        self.assertIsNone(self.builder.build("image-detail", args=(1,)))
+        self.assertIsNone(self.builder.build("image-detail", args=(2,)))
+        self.assertEqual(list(self.builder.templates.values()), [None])
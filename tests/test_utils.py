@@ -1,7 +1,9 @@
 from django.test import TestCase
 from django.test import RequestFactory
 
-from djangocms_rest.utils import get_absolute_frontend_url
+from rest_framework.request import Request
+
+from djangocms_rest.utils import get_absolute_frontend_url, get_api_context
 
 
 class UtilityTestCase(TestCase):
@@ -14,3 +16,19 @@ class UtilityTestCase(TestCase):
         request = RequestFactory().get("http://testserver/")
         url = get_absolute_frontend_url(request, None)
         self.assertIsNone(url)
+
+    def test_api_context_is_request_scoped(self):
+        request = RequestFactory().get("/api/en/pages/?preview=1", secure=True)
+        context = get_api_context(request)
+        self.assertIs(get_api_context(Request(request)), context)
+        self.assertIsNot(get_api_context(RequestFactory().get("/")), context)
+
+        self.assertEqual(context.url_prefix, "https://testserver")
+        self.assertTrue(context.preview)
+        self.assertIn("en", context.languages)
+        self.assertLessEqual(context.public_languages, context.languages)
+
+    def test_api_context_preview_flag(self):
+        for query, preview in (("", False), ("?preview", True), ("?preview=false", False), ("?preview=0", False)):
+            with self.subTest(query=query):
+                self.assertEqual(get_api_context(RequestFactory().get("/" + query)).preview, preview)
@@ -27,7 +27,7 @@ PAGE_META_FIELD_TYPES = {
     "changed_date": (str, "datetime"),
 }
 
-PAGE_TREE_META_FIELD_TYPES = {**PAGE_META_FIELD_TYPES, "children": list}
+PAGE_TREE_META_FIELD_TYPES = {**PAGE_META_FIELD_TYPES, "children": list, "children_count": int}
 
 
 PLACEHOLDER_FIELD_TYPES = {